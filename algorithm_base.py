@@ -2,14 +2,17 @@
 Base class for pathfinding algorithms with animation support.
 """
 import os
-import pygame
 import time
 import sys
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, Dict, Set
 from collections import deque
-from config import COLORS, MAZE_CONFIG, ALGORITHM_CONFIG, setup_logging
-from utils import load_maze_from_file, find_start_end_positions, validate_maze_positions, save_maze_image, get_neighbors
+from config import COLORS, MAZE_CONFIG, ALGORITHM_CONFIG, TERRAIN_CONFIG, setup_logging
+from deadline import Deadline
+from grid import Grid, path_cost
+from components import end_reachable
+from search_state import SearchState, NO_PARENT
+from utils import load_maze_from_file, find_start_end_positions, validate_maze_positions, save_maze_image, import_pygame
 
 logger = setup_logging()
 
@@ -26,21 +29,30 @@ class PathfindingAlgorithm(ABC):
         """
         self.maze_file = maze_file
         self.animate = animate
+        self.progress_callback = None
+        # Optional exploration tracer with expand(pos) and discover(pos) hooks
+        self.tracer = None
+        # Deadline/cancellation token; headless execute() applies the default timeout if unset
+        self.deadline = None
 
         # Initialize maze-related attributes
         self.maze = None
+        self.grid = None
         self.rows = 0
         self.cols = 0
         self.start = None
         self.end = None
 
-        # Algorithm state
-        self.visited = set()
+        # Algorithm state: visited flags and parents per flat cell id of self.grid
+        self.compact_state = ALGORITHM_CONFIG['COMPACT_STATE']
+        self.state = None
         self.path = []
-        self.came_from = {}
+        # Whether an end can be reached from the start, if known before solving
+        self.reachable = None
         self.stats = {
             'nodes_explored': 0,
             'path_length': 0,
+            'path_cost': 0,
             'execution_time': 0,
             'success': False
         }
@@ -49,15 +61,51 @@ class PathfindingAlgorithm(ABC):
         if maze_file and os.path.exists(maze_file):
             self.load_maze()
 
+    @classmethod
+    def from_grid(cls, maze: List[List[int]], animate: bool = False,
+                  start: Optional[Tuple[int, int]] = None,
+                  ends: Optional[List[Tuple[int, int]]] = None) -> 'PathfindingAlgorithm':
+        """
+        Create an algorithm instance for an in-memory maze.
+
+        Args:
+            maze: 2D list representing the maze
+            animate: Whether to show real-time animation
+            start: Start position, if already known
+            ends: End positions, if already known
+
+        Returns:
+            Algorithm instance ready to solve
+        """
+        algorithm = cls(None, animate)
+        algorithm.set_maze(maze, start, ends)
+        return algorithm
+
     def load_maze(self):
         """Load and validate the maze from file."""
-        self.maze = load_maze_from_file(self.maze_file)
+        self.set_maze(load_maze_from_file(self.maze_file))
+
+    def set_maze(self, maze: List[List[int]], start: Optional[Tuple[int, int]] = None,
+                 ends: Optional[List[Tuple[int, int]]] = None):
+        """
+        Validate a maze and prepare the algorithm to solve it.
+
+        Args:
+            maze: 2D list representing the maze
+            start: Start position, if already known (skips validation and discovery)
+            ends: End positions, if already known
+        """
+        self.maze = maze
         self.rows = len(self.maze)
         self.cols = len(self.maze[0])
 
-        # Validate maze
-        validate_maze_positions(self.maze)
-        self.start, self.ends = find_start_end_positions(self.maze)
+        # Validate maze unless the caller already located start and ends
+        if start is None or not ends:
+            validate_maze_positions(self.maze)
+            start, ends = find_start_end_positions(self.maze)
+        self.start, self.ends = start, list(ends)
+        self.grid = Grid(maze, self.start, self.ends)
+        self.reachable = None
         # For backward compatibility, set self.end to the first end point
         self.end = self.ends[0] if self.ends else None
 
@@ -67,6 +115,7 @@ class PathfindingAlgorithm(ABC):
     
     def setup_animation(self):
         """Setup pygame for animation."""
+        pygame = import_pygame()
         pygame.init()
         self.cell_size = MAZE_CONFIG['CELL_SIZE']
         self.margin = MAZE_CONFIG['MARGIN']
@@ -80,23 +129,24 @@ class PathfindingAlgorithm(ABC):
         self.font = pygame.font.SysFont(None, 24)
         self.clock = pygame.time.Clock()
     
-    def draw_maze(self, current_pos: Optional[Tuple[int, int]] = None, 
-                  frontier: Optional[Set[Tuple[int, int]]] = None):
+    def draw_maze(self, current_pos: Optional[int] = None,
+                  frontier: Optional[Set[int]] = None):
         """
         Draw the current state of the maze.
         
         Args:
-            current_pos: Current position being explored
-            frontier: Set of positions in the frontier/queue
+            current_pos: Cell id currently being explored
+            frontier: Set of cell ids in the frontier/queue
         """
         if not self.animate:
             return
-            
+
+        pygame = import_pygame()
         self.screen.fill(COLORS['WHITE'])
         
         for row in range(self.rows):
             for col in range(self.cols):
-                pos = (row, col)
+                pos = self.grid.cell_id(row, col)
                 val = self.maze[row][col]
                 
                 # Determine color based on cell type and state
@@ -106,12 +156,14 @@ class PathfindingAlgorithm(ABC):
                     color = COLORS['GREEN']
                 elif val == 3:  # End
                     color = COLORS['RED']
-                elif pos in self.visited:  # Visited
+                elif self.state.visited[pos]:  # Visited
                     color = COLORS['LIGHT_BLUE']
                 elif frontier and pos in frontier:  # In frontier
                     color = COLORS['YELLOW']
                 elif pos == current_pos:  # Current position
                     color = COLORS['ORANGE']
+                elif val in TERRAIN_CONFIG:  # Unexplored terrain
+                    color = COLORS[TERRAIN_CONFIG[val]['color']]
                 else:  # Empty path
                     color = COLORS['WHITE']
                 
@@ -166,20 +218,45 @@ class PathfindingAlgorithm(ABC):
             surface = self.font.render(text, True, COLORS['BLACK'])
             self.screen.blit(surface, (10, y_offset + i * 25))
     
+    def explored_cells(self) -> Set[Tuple[int, int]]:
+        """Get every position the search has visited."""
+        if self.state is None:
+            return set()
+        return set(self.grid.positions(self.state.visited_cells()))
+
+    def new_state(self) -> SearchState:
+        """Create empty search state for the current grid in the configured storage mode."""
+        return SearchState(self.grid, self.compact_state)
+
+    def report_progress(self, nodes_explored: int) -> None:
+        """
+        Send a periodic progress update to the registered callback.
+
+        Args:
+            nodes_explored: Number of nodes expanded so far
+        """
+        if self.progress_callback and nodes_explored % ALGORITHM_CONFIG['PROGRESS_INTERVAL'] == 0:
+            self.progress_callback({'nodes_explored': nodes_explored})
+
+    def should_stop(self, nodes_explored: int) -> bool:
+        """
+        Check the deadline every few expansions.
+
+        Args:
+            nodes_explored: Number of nodes expanded so far
+
+        Returns:
+            True if the search should give up because time ran out or it was cancelled
+        """
+        return self.deadline is not None and self.deadline.check(nodes_explored)
+
     def reconstruct_path(self) -> List[Tuple[int, int]]:
         """Reconstruct the path from start to end."""
-        if self.end not in self.came_from and self.end != self.start:
+        end = self.grid.cell_id(*self.end)
+        if self.state.parents[end] == NO_PARENT and self.end != self.start:
             return []
-            
-        path = []
-        current = self.end
-        
-        while current in self.came_from:
-            path.append(current)
-            current = self.came_from[current]
-        
-        path.reverse()
-        return path
+
+        return self.grid.positions(self.state.path_to(end))
     
     @abstractmethod
     def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
@@ -191,39 +268,77 @@ class PathfindingAlgorithm(ABC):
         """
         pass
     
-    def run(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+    def unreachable_result(self) -> Tuple[None, Dict]:
         """
-        Run the pathfinding algorithm and save results.
+        Result of a solve whose ends cannot be reached, leaving empty search state to draw.
+
+        Returns:
+            Tuple of (None, statistics)
+        """
+        self.state = self.new_state()
+        return None, {'nodes_explored': 0, 'unreachable': True}
+
+    def execute(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+        """
+        Solve the maze and finalise statistics without writing any images.
 
         Returns:
             Tuple of (path, statistics)
         """
-        logger.info(f"Starting {self.__class__.__name__} algorithm")
         start_time = time.time()
 
-        try:
-            # Ensure maze is loaded
-            if self.maze is None:
-                self.load_maze()
+        # Ensure maze is loaded
+        if self.maze is None:
+            self.load_maze()
+        if self.deadline is None and not self.animate:
+            # Animated runs are slowed down on purpose, so only headless solves get the default limit
+            self.deadline = Deadline(ALGORITHM_CONFIG['TIMEOUT_SECONDS'])
 
-            # Solve the maze
+        # Solve the maze, unless the start and every end lie in different regions
+        reachable = self.reachable
+        if reachable is None:
+            reachable = end_reachable(self.grid)
+        if reachable:
             path, stats = self.solve()
+        else:
+            path, stats = self.unreachable_result()
+
+        # Update final statistics
+        self.stats.update(stats)
+        self.stats.setdefault('status', 'found' if path is not None else 'no_path')
+        self.stats['execution_time'] = time.time() - start_time
+        self.stats['success'] = path is not None
+        self.stats['path_length'] = len(path) if path else 0
+        self.stats['path_cost'] = path_cost(self.maze, path)
+
+        return path, self.stats
 
-            # Update final statistics
-            self.stats.update(stats)
-            self.stats['execution_time'] = time.time() - start_time
-            self.stats['success'] = path is not None
-            self.stats['path_length'] = len(path) if path else 0
+    def save_images(self, path: Optional[List[Tuple[int, int]]]) -> None:
+        """
+        Write maze.png and solution.png to the working directory.
 
-            # Always save maze image
-            save_maze_image(self.maze, "maze.png")
+        Args:
+            path: Solution path, or None to write the plain maze as the solution image
+        """
+        save_maze_image(self.maze, "maze.png")
+        if path:
+            save_maze_image(self.maze, "solution.png", path)
+        else:
+            # Create a "no solution" image
+            save_maze_image(self.maze, "solution.png")
 
-            # Save solution image only if path found
-            if path:
-                save_maze_image(self.maze, "solution.png", path)
-            else:
-                # Create a "no solution" image
-                save_maze_image(self.maze, "solution.png")
+    def run(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+        """
+        Run the pathfinding algorithm and save results.
+
+        Returns:
+            Tuple of (path, statistics)
+        """
+        logger.info(f"Starting {self.__class__.__name__} algorithm")
+
+        try:
+            path, _ = self.execute()
+            self.save_images(path)
 
             # Keep animation window open briefly if animated
             if self.animate:
@@ -231,7 +346,7 @@ class PathfindingAlgorithm(ABC):
                     self.path = path
                 self.draw_maze()
                 time.sleep(2)  # Show final result
-                pygame.quit()
+                import_pygame().quit()
 
             logger.info(f"{self.__class__.__name__} completed: {self.stats}")
             return path, self.stats
@@ -239,5 +354,5 @@ class PathfindingAlgorithm(ABC):
         except Exception as e:
             logger.error(f"Error in {self.__class__.__name__}: {e}")
             if self.animate:
-                pygame.quit()
+                import_pygame().quit()
             raise
@@ -1,12 +1,26 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, g, request, jsonify, render_template, stream_with_context
+import json
 import subprocess
 import os
 import sys
 import time
 import traceback
-from config import APP_CONFIG, setup_logging, validate_maze_size, get_algorithm_script, get_algorithm_info
-from utils import encode_image_to_base64, cleanup_temp_files, MazeError, AlgorithmError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from config import APP_CONFIG, PATHS, MAZE_CONFIG, WORKER_CONFIG, JOB_CONFIG, CACHE_CONFIG, BATCH_CONFIG, MAZE_POOL_CONFIG, setup_logging, validate_maze_size, get_algorithm_info, get_terrain_info
+from utils import encode_image_to_base64, save_maze_image, validate_maze_grid, load_maze_from_file, find_start_end_positions, MazeError, AlgorithmError
 from web_maze_generator import generate_web_mazes
+from maze_pool import get_maze_pool
+from deadline import Deadline
+from solver_engine import solve_grid, get_solver, get_supported_algorithms, prepare_maze, unreachable_result
+from batch_solver import iter_batch_results
+from exploration_stream import stream_exploration
+from workspace import SolveWorkspace
+from worker_pool import get_solver_pool
+from job_manager import get_job_manager, JobQueueFull
+from solution_cache import SolutionCache
+from wire_format import MAZE_ENCODINGS, encode_solution, encode_maze, decode_maze
+from open_list import OPEN_LISTS
+import metrics
 
 # Suppress pygame welcome message before any pygame imports
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
@@ -17,6 +31,160 @@ logger = setup_logging()
 app = Flask(__name__)
 app.config.update(APP_CONFIG)
 
+solution_cache = SolutionCache()
+
+class RenderError(Exception):
+    """Raised when maze or solution images cannot be produced."""
+    pass
+
+RESPONSE_FORMATS = ['png', 'json']
+PATH_ENCODINGS = ['coords', 'rle']
+
+def read_request_maze(payload):
+    """
+    Decode a maze sent as nested lists or in a compact encoding.
+
+    Raises:
+        MazeError: If an encoded maze is malformed
+    """
+    try:
+        return decode_maze(payload)
+    except ValueError as e:
+        raise MazeError(str(e))
+
+def run_solver(maze_data, algorithm, **options):
+    """Solve a maze on the warm worker pool when enabled, otherwise in-process."""
+    try:
+        # Mazes whose ends cannot be reached are answered here, without dispatching a solver;
+        # the prepared maze carries the check's outcome, so the solver does not repeat it
+        maze = prepare_maze(maze_data)
+        result = unreachable_result(maze, algorithm)
+        if result is None and WORKER_CONFIG['ENABLED']:
+            result = get_solver_pool().solve(maze, algorithm, **options)
+        elif result is None:
+            deadline = Deadline(WORKER_CONFIG['SOLVE_TIMEOUT_SECONDS'])
+            result = solve_grid(maze, algorithm, deadline=deadline, **options)
+    except Exception:
+        metrics.SOLVE_ERRORS.inc(algorithm=algorithm)
+        raise
+    metrics.observe_solve(algorithm, len(maze_data), len(maze_data[0]), result.stats)
+    return result
+
+def _cache_counters():
+    stats = solution_cache.get_stats()
+    return {(result,): stats[key] for result, key in (('hit', 'hits'), ('miss', 'misses'), ('eviction', 'evictions'))}
+
+def _cache_gauges():
+    stats = solution_cache.get_stats()
+    return {(name,): stats[name] for name in ('entries', 'bytes', 'max_bytes', 'hit_ratio')}
+
+def _queue_gauges():
+    gauges = {('jobs', 'queue_depth'): get_job_manager().queue_depth}
+    if WORKER_CONFIG['ENABLED']:
+        pool_stats = get_solver_pool().get_stats()
+        gauges[('solver_pool', 'queue_depth')] = pool_stats['queue_depth']
+        gauges[('solver_pool', 'busy_workers')] = pool_stats['busy_workers']
+        gauges[('solver_pool', 'processes')] = pool_stats['processes']
+    return gauges
+
+def _maze_pool_counters():
+    if not MAZE_POOL_CONFIG['ENABLED']:
+        return {}
+    stats = get_maze_pool().get_stats()
+    return {('hit',): stats['hits'], ('miss',): stats['misses']}
+
+def _maze_pool_gauges():
+    if not MAZE_POOL_CONFIG['ENABLED']:
+        return {}
+    return {(str(size),): ready for size, ready in get_maze_pool().get_stats()['ready'].items()}
+
+# Values tracked by the cache, pools and job queue are read when /metrics is scraped
+metrics.REGISTRY.register(metrics.Counter(
+    'maze_cache_events_total', 'Solution cache hits, misses and evictions.', ('result',), callback=_cache_counters))
+metrics.REGISTRY.register(metrics.Gauge(
+    'maze_cache', 'Solution cache entries, bytes used, byte budget and hit ratio.', ('stat',), callback=_cache_gauges))
+metrics.REGISTRY.register(metrics.Gauge(
+    'maze_queue', 'Solver pool and job queue depth and utilisation.', ('queue', 'stat'), callback=_queue_gauges))
+metrics.REGISTRY.register(metrics.Counter(
+    'maze_pool_events_total', 'Random mazes served from the pre-generated pool (hit) or generated in-request (miss).',
+    ('result',), callback=_maze_pool_counters))
+metrics.REGISTRY.register(metrics.Gauge(
+    'maze_pool_ready', 'Pre-generated random mazes ready per maze size.', ('size',), callback=_maze_pool_gauges))
+
+def solve_and_render(maze_data, algorithm, workspace, response_format='png', open_list=None):
+    """
+    Solve a maze and, for the PNG response format, render its images.
+
+    Args:
+        maze_data: 2D list representing the maze
+        algorithm: Algorithm name
+        workspace: SolveWorkspace to render images into
+        response_format: 'png' for base64 images, 'json' for path/explored data
+        open_list: Open list name for the best-first solvers, or None for the default
+
+    Returns:
+        Cache entry with the path, stats and either encoded images or explored cells
+
+    Raises:
+        RenderError: If an image could not be rendered or encoded
+    """
+    if response_format == 'json':
+        solve_result = run_solver(maze_data, algorithm, collect_explored=True, open_list=open_list)
+        return {
+            'path_found': solve_result.path_found,
+            'path': [list(pos) for pos in solve_result.path],
+            'explored': [list(pos) for pos in solve_result.explored],
+            'stats': solve_result.stats
+        }
+
+    solve_result = run_solver(maze_data, algorithm, open_list=open_list)
+    path_found = solve_result.path_found
+
+    workspace.create()
+    maze_image = workspace.maze_image
+    solution_image = workspace.solution_image
+
+    try:
+        with metrics.RENDER_LATENCY.time(stage='render_png'):
+            save_maze_image(maze_data, maze_image)
+        with metrics.RENDER_LATENCY.time(stage='encode_png'):
+            maze_b64 = encode_image_to_base64(maze_image)
+        solution_b64 = None
+        if path_found:
+            with metrics.RENDER_LATENCY.time(stage='render_png'):
+                save_maze_image(maze_data, solution_image, solve_result.path)
+            with metrics.RENDER_LATENCY.time(stage='encode_png'):
+                solution_b64 = encode_image_to_base64(solution_image)
+    except Exception as e:
+        raise RenderError(str(e))
+
+    return {
+        'path_found': path_found,
+        'path': [list(pos) for pos in solve_result.path],
+        'stats': solve_result.stats,
+        'maze_image': maze_b64,
+        'solution_image': solution_b64
+    }
+
+@app.before_request
+def start_request_timer():
+    """Remember when the request started for the latency histogram."""
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """Count the request and observe its latency (time to first byte for streams)."""
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=str(response.status_code))
+    if 'request_start' in g:
+        metrics.HTTP_LATENCY.observe(time.perf_counter() - g.request_start, endpoint=endpoint, method=request.method)
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Expose request, solver, cache and queue metrics in the Prometheus text format."""
+    return Response(metrics.render_metrics(), content_type=metrics.CONTENT_TYPE)
+
 @app.route('/')
 def index():
     """Serve the main page."""
@@ -24,59 +192,74 @@ def index():
 
 @app.route('/algorithms', methods=['GET'])
 def get_algorithms():
-    """Get information about available algorithms."""
+    """Get information about available algorithms and the terrain cell values they understand."""
     try:
         algorithms = get_algorithm_info()
         return jsonify({
             "success": True,
-            "algorithms": algorithms
+            "algorithms": algorithms,
+            "terrain": get_terrain_info()
         })
     except Exception as e:
         logger.error(f"Error getting algorithm info: {e}")
         return jsonify({"error": "Failed to get algorithm information"}), 500
 
+@app.route('/workers', methods=['GET'])
+def get_worker_status():
+    """Report solver worker pool utilisation and queue depth."""
+    if not WORKER_CONFIG['ENABLED']:
+        return jsonify({"success": True, "enabled": False})
+    return jsonify({
+        "success": True,
+        "enabled": True,
+        "pool": get_solver_pool().get_stats()
+    })
+
+@app.route('/cache', methods=['GET'])
+def get_cache_status():
+    """Report solution cache size and hit/miss counters."""
+    return jsonify({
+        "success": True,
+        "enabled": CACHE_CONFIG['ENABLED'],
+        "cache": solution_cache.get_stats()
+    })
+
 @app.route('/generate-random-mazes', methods=['POST'])
 def generate_random_mazes():
     """Generate multiple random mazes for web interface selection."""
-    print("🔥 /generate-random-mazes endpoint called!")
     try:
         # Validate request
         if not request.json:
-            print("❌ No JSON data in request")
             return jsonify({"error": "No JSON data provided"}), 400
 
         data = request.json
-        print(f"📋 Received data: {data}")
 
         size = validate_maze_size(data.get('size', 25))
         count = min(max(data.get('count', 5), 1), 10)  # Limit between 1 and 10
+        maze_encoding = str(data.get('maze_encoding', 'grid')).lower()
+        if maze_encoding not in MAZE_ENCODINGS:
+            return jsonify({"error": f"Invalid maze encoding. Must be one of: {', '.join(MAZE_ENCODINGS)}"}), 400
 
-        print(f"🎲 Generating {count} random mazes of size {size}x{size}")
-
-        # Generate mazes using web generator
-        mazes = generate_web_mazes(size, count)
+        # Take ready mazes from the background pool, or generate them in-request
+        if MAZE_POOL_CONFIG['ENABLED']:
+            mazes = get_maze_pool().take(size, count)
+        else:
+            mazes = generate_web_mazes(size, count)
 
         if not mazes:
-            print("❌ Failed to generate mazes - empty result")
+            logger.error("Failed to generate mazes - empty result")
             return jsonify({"error": "Failed to generate mazes"}), 500
 
-        print(f"✅ Successfully generated {len(mazes)} mazes")
-        print(f"📊 First maze sample: {mazes[0][:2] if mazes else 'None'}")
-
         response_data = {
             "success": True,
-            "mazes": mazes,
+            "mazes": [encode_maze(maze, maze_encoding) for maze in mazes],
+            "maze_encoding": maze_encoding,
             "count": len(mazes),
             "size": size
         }
-        print(f"📤 Sending response with {len(mazes)} mazes")
         return jsonify(response_data)
 
     except Exception as e:
-        print(f"❌ ERROR in generate_random_mazes: {e}")
-        print(f"❌ Error type: {type(e)}")
-        import traceback
-        print(f"❌ Traceback: {traceback.format_exc()}")
         logger.error(f"Error generating random mazes: {e}")
         logger.error(traceback.format_exc())
         return jsonify({"error": f"Failed to generate random mazes: {str(e)}"}), 500
@@ -87,6 +270,7 @@ def solve_maze():
     Solve maze endpoint with comprehensive error handling.
     """
     start_time = time.time()
+    workspace = SolveWorkspace()
 
     try:
         # Validate request
@@ -98,7 +282,12 @@ def solve_maze():
         original_size = data.get('size', 25)
         size = validate_maze_size(original_size)
         algorithm = data.get('algorithm', 'bfs').lower()
-        custom_maze = data.get('maze_grid', None)
+        custom_maze = read_request_maze(data.get('maze_grid', None))
+        response_format = str(data.get('response_format', 'png')).lower()
+        path_encoding = str(data.get('path_encoding', 'coords')).lower()
+        maze_encoding = str(data.get('maze_encoding', 'grid')).lower()
+        open_list = data.get('open_list')
+        open_list = str(open_list).lower() if open_list is not None else None
 
         print(f"Solving maze: type={maze_type}, size={size}, algorithm={algorithm}")
 
@@ -106,12 +295,17 @@ def solve_maze():
         if maze_type not in ['random', 'custom', 'random_selected']:
             return jsonify({"error": "Invalid maze type. Must be 'random', 'custom', or 'random_selected'"}), 400
 
-        algo_script = get_algorithm_script(algorithm)
-        if not algo_script:
-            return jsonify({"error": f"Invalid algorithm '{algorithm}'. Supported: astar, bfs, dfs, dijkstra, bidirectional"}), 400
+        if response_format not in RESPONSE_FORMATS:
+            return jsonify({"error": f"Invalid response format. Must be one of: {', '.join(RESPONSE_FORMATS)}"}), 400
+        if path_encoding not in PATH_ENCODINGS:
+            return jsonify({"error": f"Invalid path encoding. Must be one of: {', '.join(PATH_ENCODINGS)}"}), 400
+        if maze_encoding not in MAZE_ENCODINGS:
+            return jsonify({"error": f"Invalid maze encoding. Must be one of: {', '.join(MAZE_ENCODINGS)}"}), 400
+        if open_list is not None and open_list not in OPEN_LISTS:
+            return jsonify({"error": f"Invalid open list. Must be one of: {', '.join(OPEN_LISTS)}"}), 400
 
-        # Clean up any existing temporary files
-        cleanup_temp_files()
+        if not get_solver(algorithm):
+            return jsonify({"error": f"Invalid algorithm '{algorithm}'. Supported: {', '.join(get_supported_algorithms())}"}), 400
 
         # Handle different maze types
         if maze_type in ['custom', 'random_selected']:
@@ -122,47 +316,21 @@ def solve_maze():
             if not custom_maze:
                 return jsonify({"error": f"Maze data is required for {maze_type_name}"}), 400
 
-            # Validate maze dimensions match the original requested size
-            if len(custom_maze) != original_size or any(len(row) != original_size for row in custom_maze):
-                return jsonify({"error": f"Maze must be {original_size}x{original_size}"}), 400
-
-            # Update size to match the actual maze size (no validation adjustment for custom mazes)
+            # Validate maze dimensions and start/end points (no size adjustment for custom mazes)
+            validate_maze_grid(custom_maze, original_size)
             size = original_size
 
-            # Check for start and end points
-            start_count = sum(row.count(2) for row in custom_maze)
-            end_count = sum(row.count(3) for row in custom_maze)
-
-            if start_count != 1:
-                return jsonify({"error": "Maze must have exactly one start point (green)"}), 400
-            if end_count < 1:
-                return jsonify({"error": "Maze must have at least one end point (red)"}), 400
-
-            # Save maze to file
-            maze_file = "selected_maze.txt" if maze_type == 'random_selected' else "custom_maze.txt"
-            try:
-                with open(maze_file, 'w') as f:
-                    for row in custom_maze:
-                        f.write(str(row) + '\n')
-                logger.info(f"Maze saved to {maze_file}")
-
-                # Also generate the initial maze image
-                from utils import save_maze_image, load_maze_from_file
-                maze_data = load_maze_from_file(maze_file)
-                save_maze_image(maze_data, "maze.png")
-                logger.info("Maze image generated")
-
-            except Exception as e:
-                logger.error(f"Failed to save maze: {e}")
-                return jsonify({"error": "Failed to save maze"}), 500
+            maze_data = custom_maze
 
         else:
             # Handle random maze generation with GUI (legacy)
             if maze_type != 'random':
                 return jsonify({"error": "Only 'random', 'custom', and 'random_selected' maze types are supported"}), 400
 
-            maze_script = "random_maze.py"
-            maze_file = "random_maze.txt"
+            # Every request gets its own scratch directory for maze files and images
+            workspace.create()
+            maze_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "random_maze.py")
+            maze_file = workspace.path(PATHS['RANDOM_MAZE'])
 
             # Step 1: Generate the maze
             logger.info(f"Generating {maze_type} maze with size {size}")
@@ -172,7 +340,8 @@ def solve_maze():
                     check=True,
                     capture_output=True,
                     text=True,
-                    timeout=30
+                    timeout=30,
+                    cwd=workspace.directory
                 )
                 logger.info(f"Maze generation completed: {result.stdout}")
             except subprocess.TimeoutExpired:
@@ -195,100 +364,71 @@ def solve_maze():
                 logger.error(f"Maze file {maze_file} was not created")
                 return jsonify({"error": "Maze file was not generated"}), 500
 
-        # Step 2: Solve the maze
-        logger.info(f"Solving maze with {algorithm} algorithm")
-        try:
-            # Run algorithm in headless mode (no GUI)
-            result = subprocess.run(
-                [sys.executable, algo_script, maze_file, "headless"],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            logger.info(f"Maze solving completed: {result.stdout}")
-
-            # Check if algorithm found a path by examining output
-            path_found = False
-            if result.stdout:
-                logger.info(f"Algorithm output: {result.stdout}")
-                if "SUCCESS:" in result.stdout and "Path found!" in result.stdout:
-                    path_found = True
-                elif "FAILURE:" in result.stdout and ("No path" in result.stdout or "No path found" in result.stdout):
-                    path_found = False
-                elif "Path found!" in result.stdout:
-                    path_found = True
-                else:
-                    # Default to checking if solution image exists
-                    path_found = os.path.exists("solution.png")
-
-        except subprocess.TimeoutExpired:
-            logger.error("Maze solving timed out")
-            return jsonify({"error": "Maze solving timed out"}), 500
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Maze solving failed: {e.stderr}")
-            return jsonify({"error": f"Maze solving failed: {e.stderr}"}), 500
-
-        # Step 3: Verify images were generated
-        maze_image = "maze.png"
-        solution_image = "solution.png"
+            maze_data = load_maze_from_file(maze_file)
 
-        if not os.path.exists(maze_image):
-            logger.error("Maze image was not generated")
-            return jsonify({"error": "Maze image was not generated"}), 500
+        # Step 2: Serve repeat solves from the cache, otherwise solve and render
+        cache_key = SolutionCache.make_key(maze_data, algorithm, {'format': response_format, 'open_list': open_list})
+        entry = solution_cache.get(cache_key) if CACHE_CONFIG['ENABLED'] else None
+        cached = entry is not None
 
-        # Step 4: Handle path found/not found cases
+        if entry is None:
+            logger.info(f"Solving maze with {algorithm} algorithm")
+            try:
+                entry = solve_and_render(maze_data, algorithm, workspace, response_format, open_list)
+            except FutureTimeoutError:
+                logger.error("Maze solving timed out")
+                return jsonify({"error": "Maze solving timed out"}), 500
+            except RenderError as e:
+                logger.error(f"Error processing maze images: {e}")
+                return jsonify({"error": f"Error processing maze images: {str(e)}"}), 500
+
+            # A search cut short by its deadline may finish next time, so don't cache it
+            if CACHE_CONFIG['ENABLED'] and not entry['stats'].get('partial'):
+                solution_cache.put(cache_key, entry)
+
+        # Step 3: Return the solution, whether or not a path was found
         processing_time = time.time() - start_time
+        path_found = entry['path_found']
+        status = entry['stats'].get('status', 'found' if path_found else 'no_path')
+
+        if status == 'timeout' and not path_found:
+            logger.warning(f"{algorithm} stopped at its deadline after {processing_time:.2f} seconds")
+            message = f"{algorithm.upper()} ran out of time before finding a path; showing the partial search"
+        elif path_found:
+            logger.info(f"Maze solved successfully in {processing_time:.2f} seconds (cached={cached})")
+            message = f"Path found successfully using {algorithm.upper()} algorithm"
+        else:
+            logger.info(f"No path found with {algorithm} algorithm in {processing_time:.2f} seconds (cached={cached})")
+            message = f"No path found between start and end points using {algorithm.upper()} algorithm"
 
-        if not path_found:
-            # No path was found
-            logger.info(f"No path found with {algorithm} algorithm in {processing_time:.2f} seconds")
+        response_data = {
+            "success": path_found,
+            "path_found": path_found,
+            "processing_time": round(processing_time, 2),
+            "algorithm": algorithm,
+            "maze_type": maze_type,
+            "size": size,
+            "stats": entry['stats'],
+            "status": status,
+            "cached": cached,
+            "response_format": response_format,
+            "message": message
+        }
 
-            try:
-                maze_b64 = encode_image_to_base64(maze_image)
-
-                return jsonify({
-                    "success": False,
-                    "path_found": False,
-                    "maze": maze_b64,
-                    "solution": None,
-                    "processing_time": round(processing_time, 2),
-                    "algorithm": algorithm,
-                    "maze_type": maze_type,
-                    "size": size,
-                    "message": f"No path found between start and end points using {algorithm.upper()} algorithm"
-                })
-            except Exception as e:
-                logger.error(f"Error encoding maze image: {e}")
-                return jsonify({"error": f"Error processing maze image: {str(e)}"}), 500
-
-        # Path was found - verify solution image exists
-        if not os.path.exists(solution_image):
-            logger.error("Solution image was not generated despite path being found")
-            return jsonify({"error": "Solution image was not generated"}), 500
-
-        # Step 5: Encode images and return successful response
-        try:
-            maze_b64 = encode_image_to_base64(maze_image)
-            solution_b64 = encode_image_to_base64(solution_image)
-
-            logger.info(f"Maze solved successfully in {processing_time:.2f} seconds")
-
-            return jsonify({
-                "success": True,
-                "path_found": True,
-                "maze": maze_b64,
-                "solution": solution_b64,
-                "processing_time": round(processing_time, 2),
-                "algorithm": algorithm,
-                "maze_type": maze_type,
-                "size": size,
-                "message": f"Path found successfully using {algorithm.upper()} algorithm"
-            })
-
-        except Exception as e:
-            logger.error(f"Error encoding images: {e}")
-            return jsonify({"error": f"Error processing images: {str(e)}"}), 500
+        if response_format == 'json':
+            # Path data for the client to draw; it already has the grid unless the server generated it
+            with metrics.RENDER_LATENCY.time(stage='encode_json'):
+                start, _ = find_start_end_positions(maze_data)
+                response_data.update(encode_solution(
+                    start, entry['path'], entry['explored'], len(maze_data), len(maze_data[0]), path_encoding
+                ))
+                if maze_type == 'random':
+                    response_data["maze_grid"] = encode_maze(maze_data, maze_encoding)
+        else:
+            response_data["maze"] = entry['maze_image']
+            response_data["solution"] = entry['solution_image']
+
+        return jsonify(response_data)
 
     except MazeError as e:
         logger.error(f"Maze error: {e}")
@@ -300,6 +440,160 @@ def solve_maze():
         logger.error(f"Unexpected error: {e}")
         logger.error(traceback.format_exc())
         return jsonify({"error": "An unexpected error occurred"}), 500
+    finally:
+        workspace.cleanup()
+
+@app.route('/solve/batch', methods=['POST'])
+def solve_batch():
+    """
+    Solve a list of mazes with a list of algorithms, streaming NDJSON records
+    as each solve completes.
+    """
+    if not request.json:
+        return jsonify({"error": "No JSON data provided"}), 400
+
+    data = request.json
+    mazes = data.get('mazes')
+    algorithms = data.get('algorithms', ['bfs'])
+
+    if not isinstance(mazes, list) or not mazes:
+        return jsonify({"error": "'mazes' must be a non-empty list of maze grids"}), 400
+    if not isinstance(algorithms, list) or not algorithms:
+        return jsonify({"error": "'algorithms' must be a non-empty list"}), 400
+
+    algorithms = [str(algorithm).lower() for algorithm in algorithms]
+    unknown = [algorithm for algorithm in algorithms if not get_solver(algorithm)]
+    if unknown:
+        return jsonify({"error": f"Invalid algorithm(s) {', '.join(unknown)}. Supported: {', '.join(get_supported_algorithms())}"}), 400
+
+    if len(mazes) > BATCH_CONFIG['MAX_MAZES'] or len(mazes) * len(algorithms) > BATCH_CONFIG['MAX_TASKS']:
+        return jsonify({"error": f"Batch too large (max {BATCH_CONFIG['MAX_MAZES']} mazes, {BATCH_CONFIG['MAX_TASKS']} solves)"}), 400
+
+    # Validate each maze and locate its start/end once; all of its algorithms share the result
+    prepared = {}
+    invalid = []
+    for index, grid in enumerate(mazes):
+        try:
+            grid = read_request_maze(grid)
+            validate_maze_grid(grid, len(grid) if isinstance(grid, list) else -1)
+            prepared[index] = prepare_maze(grid)
+        except MazeError as e:
+            invalid.append({"maze_index": index, "error": str(e)})
+
+    logger.info(f"Batch solve: {len(prepared)} mazes x {len(algorithms)} algorithms")
+
+    def generate():
+        start_time = time.time()
+        for record in invalid:
+            yield json.dumps(record) + "\n"
+        completed = 0
+        for record in iter_batch_results(prepared, algorithms):
+            completed += 1
+            yield json.dumps(record, default=str) + "\n"
+        yield json.dumps({
+            "done": True,
+            "solves": completed,
+            "invalid_mazes": len(invalid),
+            "processing_time": round(time.time() - start_time, 3)
+        }) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@app.route('/solve/stream', methods=['POST'])
+def solve_stream():
+    """
+    Solve a maze and stream its exploration as server-sent events for live animation.
+    """
+    try:
+        if not request.json:
+            return jsonify({"error": "No JSON data provided"}), 400
+
+        data = request.json
+        algorithm = data.get('algorithm', 'bfs').lower()
+        maze_grid = read_request_maze(data.get('maze_grid', None))
+
+        if not get_solver(algorithm):
+            return jsonify({"error": f"Invalid algorithm '{algorithm}'. Supported: {', '.join(get_supported_algorithms())}"}), 400
+        if not maze_grid:
+            return jsonify({"error": "Maze data is required"}), 400
+        if len(maze_grid) > MAZE_CONFIG['MAX_SIZE']:
+            return jsonify({"error": f"Maze is too large to stream (max {MAZE_CONFIG['MAX_SIZE']}x{MAZE_CONFIG['MAX_SIZE']})"}), 400
+
+        try:
+            fps = float(data.get('fps') or 0)
+            max_events_per_second = int(data.get('max_events_per_second') or 0)
+        except (TypeError, ValueError):
+            return jsonify({"error": "'fps' and 'max_events_per_second' must be numbers"}), 400
+
+        validate_maze_grid(maze_grid, data.get('size', len(maze_grid)))
+        maze = prepare_maze(maze_grid)
+
+    except MazeError as e:
+        logger.error(f"Maze error: {e}")
+        return jsonify({"error": str(e)}), 400
+
+    logger.info(f"Streaming {algorithm} exploration of {maze.rows}x{maze.cols} maze")
+    response = Response(
+        stream_with_context(stream_exploration(maze, algorithm, fps, max_events_per_second)),
+        mimetype='text/event-stream'
+    )
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    """Queue a long-running solve and return its job id immediately."""
+    try:
+        if not request.json:
+            return jsonify({"error": "No JSON data provided"}), 400
+
+        data = request.json
+        algorithm = data.get('algorithm', 'bfs').lower()
+        maze_grid = read_request_maze(data.get('maze_grid', None))
+
+        if not get_solver(algorithm):
+            return jsonify({"error": f"Invalid algorithm '{algorithm}'. Supported: {', '.join(get_supported_algorithms())}"}), 400
+        if not maze_grid:
+            return jsonify({"error": "Maze data is required"}), 400
+
+        validate_maze_grid(maze_grid, data.get('size', len(maze_grid)))
+        job = get_job_manager().submit(maze_grid, algorithm)
+
+        response = jsonify({"success": True, "job_id": job.job_id, "status": job.status})
+        response.status_code = 202
+        response.headers['Location'] = f"/jobs/{job.job_id}"
+        return response
+
+    except JobQueueFull as e:
+        logger.warning(f"Rejecting job: {e}")
+        response = jsonify({"error": "Server is busy, please retry later"})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(JOB_CONFIG['RETRY_AFTER_SECONDS'])
+        return response
+    except MazeError as e:
+        logger.error(f"Maze error: {e}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error creating job: {e}")
+        logger.error(traceback.format_exc())
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the status, progress and result of a solve job."""
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify({"success": True, "job": job.to_dict()})
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancel a queued or running solve job."""
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify({"success": True, "job": job.to_dict()})
 
 @app.errorhandler(404)
 def not_found(error):
@@ -315,8 +609,15 @@ def internal_error(error):
 if __name__ == '__main__':
     print("🚀 Starting Maze Solver AI Flask application")
     print(f"🌐 Server running at http://{APP_CONFIG['HOST']}:{APP_CONFIG['PORT']}")
+    if WORKER_CONFIG['ENABLED']:
+        # Warm up the solver workers before the first request arrives
+        get_solver_pool()
+    if MAZE_POOL_CONFIG['ENABLED']:
+        # Start filling the random maze pool before the first request arrives
+        get_maze_pool()
     app.run(
         host=APP_CONFIG['HOST'],
         port=APP_CONFIG['PORT'],
-        debug=APP_CONFIG['DEBUG']
+        debug=APP_CONFIG['DEBUG'],
+        threaded=APP_CONFIG['THREADED']
     )
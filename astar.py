@@ -1,12 +1,15 @@
 """
 Enhanced A* pathfinding algorithm with real-time animation.
 """
-import heapq
 import sys
 import time
 from typing import List, Tuple, Optional, Dict, Set
 from algorithm_base import PathfindingAlgorithm
-from utils import get_neighbors, calculate_distance
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from grid import WALL
+from search_state import cell_flags, cell_values, UNREACHED
+from open_list import make_open_list
+from heuristic import heuristic_table
 from config import ALGORITHM_CONFIG
 
 class AStarAlgorithm(PathfindingAlgorithm):
@@ -14,25 +17,35 @@ class AStarAlgorithm(PathfindingAlgorithm):
 
     def __init__(self, maze_file: str, animate: bool = True):
         super().__init__(maze_file, animate)
-        self.g_score = {}  # Cost from start to node
-        self.f_score = {}  # g_score + heuristic
-        self.open_set = []  # Priority queue
-        self.open_set_hash = set()  # For O(1) membership testing
+        self.g_score = None  # Cost from start to each cell id
+        self.open_set = None  # Open list of cell ids by g_score + heuristic (see open_list)
+        self.open_flags = None  # Open-set membership per cell id, for O(1) testing
+        self.open_list_kind = None  # Open list name, or None for the configured default (see open_list)
+        self.heuristic_kind = None  # Heuristic name, or None for the configured default (see heuristic)
+        self.heuristic_table = None  # Heuristic of each cell id, built once per solve
+
+    def build_heuristic(self) -> Dict:
+        """
+        Precompute the heuristic of every cell for this solve.
+
+        Returns:
+            Statistics: the heuristic used and the seconds spent building its table
+        """
+        build_start = time.perf_counter()
+        self.heuristic_table, kind = heuristic_table(self.grid, self.heuristic_kind, self.deadline)
+        return {'heuristic': kind, 'heuristic_time': time.perf_counter() - build_start}
 
-    def heuristic(self, pos: Tuple[int, int]) -> float:
+    def heuristic(self, cell: int) -> int:
         """
-        Calculate heuristic distance (Manhattan distance) to nearest end.
+        Estimated distance from a cell to the nearest end (see build_heuristic).
 
         Args:
-            pos: Current position
+            cell: Flat cell id of the current position
 
         Returns:
             Heuristic distance to nearest end
         """
-        # Return distance to nearest end point
-        if not self.ends:
-            return 0
-        return min(calculate_distance(pos, end) for end in self.ends)
+        return self.heuristic_table[cell]
 
     def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
         """
@@ -41,98 +54,129 @@ class AStarAlgorithm(PathfindingAlgorithm):
         Returns:
             Tuple of (path, statistics)
         """
+        grid = self.grid
+        flat = grid.flat
+        costs = grid.costs
+        goal_mask = grid.goal_mask
+        start = grid.start
+        state = self.state = self.new_state()
+        visited = state.visited
+        parents = state.parents
+        g_score = self.g_score = cell_values(grid, self.compact_state)
+        open_flags = self.open_flags = cell_flags(grid, self.compact_state)
+        open_set = self.open_set = make_open_list(self.open_list_kind, grid, self.compact_state)
+        heuristic_stats = self.build_heuristic()
+        h = self.heuristic_table
+
+        # UNREACHED marks cells with no way to an end (every cell when the maze has no ends)
+        if h[start] == UNREACHED:
+            return None, {'nodes_explored': 0, 'max_frontier_size': 0,
+                          'open_list': open_set.name, **heuristic_stats}
+
         # Initialize scores
-        self.g_score[self.start] = 0
-        self.f_score[self.start] = self.heuristic(self.start)
+        g_score[start] = 0
 
         # Initialize open set with start position
-        heapq.heappush(self.open_set, (self.f_score[self.start], self.start))
-        self.open_set_hash.add(self.start)
+        open_set.push(h[start], start)
+        open_flags[start] = 1
 
         nodes_explored = 0
         max_frontier_size = 0
 
-        while self.open_set:
+        while open_set:
             # Get node with lowest f_score
-            current_f, current = heapq.heappop(self.open_set)
-            self.open_set_hash.remove(current)
+            current_f, current = open_set.pop()
+            if visited[current]:
+                continue  # Stale duplicate of a cell re-pushed with a lower f_score
+            open_flags[current] = 0
 
             # Check if we reached any goal
-            if current in self.ends:
+            if goal_mask[current]:
                 # Update self.end to the reached end point for path reconstruction
-                self.end = current
+                self.end = grid.position(current)
                 path = self.reconstruct_path()
                 return path, {
                     'nodes_explored': nodes_explored,
                     'max_frontier_size': max_frontier_size,
-                    'final_path_cost': self.g_score[current],
-                    'end_reached': current
+                    'final_path_cost': g_score[current],
+                    'open_list': open_set.name,
+                    **heuristic_stats,
+                    'end_reached': self.end
                 }
 
             # Mark as visited
-            self.visited.add(current)
+            visited[current] = 1
             nodes_explored += 1
+            self.report_progress(nodes_explored)
+            if self.tracer:
+                self.tracer.expand(grid.position(current))
 
             # Update animation
             if self.animate and nodes_explored % 5 == 0:  # Update every 5 nodes for performance
                 self.stats['nodes_explored'] = nodes_explored
-                self.draw_maze(current, self.open_set_hash)
+                self.draw_maze(current, set(open_set.cells()))
                 time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
 
+            current_g = g_score[current]
+
             # Explore neighbors
-            for neighbor in get_neighbors(current, self.rows, self.cols):
-                nr, nc = neighbor
+            for direction, offset in state.directions:
+                neighbor = current + offset
 
-                # Skip walls and visited nodes
-                if self.maze[nr][nc] == 1 or neighbor in self.visited:
+                # Skip walls (including the border) and visited nodes
+                if flat[neighbor] == WALL or visited[neighbor]:
                     continue
 
-                # Calculate tentative g_score
-                tentative_g = self.g_score[current] + 1
-
                 # If this path to neighbor is better than any previous one
-                if neighbor not in self.g_score or tentative_g < self.g_score[neighbor]:
+                tentative_g = current_g + costs[neighbor]
+                if tentative_g < g_score[neighbor]:
                     # Record the best path
-                    self.came_from[neighbor] = current
-                    self.g_score[neighbor] = tentative_g
-                    self.f_score[neighbor] = tentative_g + self.heuristic(neighbor)
+                    parents[neighbor] = direction
+                    g_score[neighbor] = tentative_g
 
-                    # Add to open set if not already there
-                    if neighbor not in self.open_set_hash:
-                        heapq.heappush(self.open_set, (self.f_score[neighbor], neighbor))
-                        self.open_set_hash.add(neighbor)
+                    # Queue it, or lower its f_score if it is already queued
+                    open_set.push(tentative_g + h[neighbor], neighbor)
+                    if not open_flags[neighbor]:
+                        open_flags[neighbor] = 1
+                        if self.tracer:
+                            self.tracer.discover(grid.position(neighbor))
 
             # Track maximum frontier size
-            max_frontier_size = max(max_frontier_size, len(self.open_set))
+            max_frontier_size = max(max_frontier_size, len(open_set))
 
-            # Timeout check
-            if time.time() - self.stats.get('start_time', time.time()) > ALGORITHM_CONFIG['TIMEOUT_SECONDS']:
-                break
+            # Stop when the deadline passes or the solve is cancelled
+            if self.should_stop(nodes_explored):
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'max_frontier_size': max_frontier_size,
+                    'open_list': open_set.name,
+                    **heuristic_stats,
+                    **self.deadline.stop_stats()
+                }
 
         # No path found
         return None, {
             'nodes_explored': nodes_explored,
             'max_frontier_size': max_frontier_size,
-            'timeout': True
+            'open_list': open_set.name,
+            **heuristic_stats
         }
 
 def main():
     """Main function to run A* algorithm."""
-    maze_file = sys.argv[1] if len(sys.argv) > 1 else "manual_maze.txt"
-
-    # Check for headless mode (no animation)
-    animate = True
-    if len(sys.argv) >= 3:
-        if sys.argv[2].lower() in ['false', 'headless', 'no-gui']:
-            animate = False
+    args = parse_solver_args("Solve a maze with A* search.")
+    if args.json:
+        sys.exit(run_algorithm_json(AStarAlgorithm, 'astar', args))
 
     try:
-        algorithm = AStarAlgorithm(maze_file, animate)
+        algorithm = AStarAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
         path, stats = algorithm.run()
 
         # Print results with clear success/failure indication
         if path:
             print(f"A* Path found! Length: {len(path)}")
+            print(f"Path cost: {stats['path_cost']}")
             print(f"SUCCESS: Path successfully found using A* algorithm")
         else:
             print("A* No path found")
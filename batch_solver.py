@@ -0,0 +1,85 @@
+"""
+Batch solving of many mazes with many algorithms.
+
+Each maze is validated and its start/end positions located once, then every
+(maze, algorithm) pair is fanned out to the solver workers and results are
+yielded in completion order so they can be streamed to the client.
+"""
+import logging
+from concurrent.futures import as_completed
+from typing import Any, Dict, Iterator, List
+
+from config import WORKER_CONFIG
+from deadline import Deadline
+from metrics import SOLVE_ERRORS, observe_solve
+from solver_engine import PreparedMaze, SolveResult, solve_grid
+from worker_pool import get_solver_pool
+from wire_format import encode_path_rle
+
+logger = logging.getLogger(__name__)
+
+
+def _result_record(maze_index: int, maze: PreparedMaze, result: SolveResult) -> Dict[str, Any]:
+    """Build the streamed record for a successful solve."""
+    observe_solve(result.algorithm, maze.rows, maze.cols, result.stats)
+    return {
+        'maze_index': maze_index,
+        'algorithm': result.algorithm,
+        'path_found': result.path_found,
+        'status': result.status,
+        'path_length': result.stats.get('path_length', 0),
+        'nodes_explored': result.stats.get('nodes_explored', 0),
+        'execution_time': result.stats.get('execution_time', 0),
+        'start': list(maze.start),
+        'path_rle': encode_path_rle(maze.start, result.path),
+        'stats': result.stats
+    }
+
+
+def _error_record(maze_index: int, algorithm: str, error: Exception) -> Dict[str, Any]:
+    """Build the streamed record for a failed solve."""
+    logger.error(f"Batch solve of maze {maze_index} with {algorithm} failed: {error}")
+    SOLVE_ERRORS.inc(algorithm=algorithm)
+    return {
+        'maze_index': maze_index,
+        'algorithm': algorithm,
+        'error': str(error) or type(error).__name__
+    }
+
+
+def iter_batch_results(mazes: Dict[int, PreparedMaze], algorithms: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Solve every maze with every algorithm, yielding records as solves finish.
+
+    Args:
+        mazes: Prepared mazes keyed by their index in the request
+        algorithms: Algorithm names to run on each maze
+
+    Yields:
+        One result or error record per (maze, algorithm) pair
+    """
+    tasks = [(index, algorithm) for index in mazes for algorithm in algorithms]
+
+    if not WORKER_CONFIG['ENABLED']:
+        for index, algorithm in tasks:
+            try:
+                deadline = Deadline(WORKER_CONFIG['SOLVE_TIMEOUT_SECONDS'])
+                yield _result_record(index, mazes[index], solve_grid(mazes[index], algorithm, deadline=deadline))
+            except Exception as e:
+                yield _error_record(index, algorithm, e)
+        return
+
+    pool = get_solver_pool()
+    futures = {pool.submit(mazes[index], algorithm): (index, algorithm) for index, algorithm in tasks}
+    try:
+        for future in as_completed(futures):
+            index, algorithm = futures[future]
+            try:
+                yield _result_record(index, mazes[index], future.result())
+            except Exception as e:
+                yield _error_record(index, algorithm, e)
+    finally:
+        # Client went away or iteration finished: drop any work still outstanding
+        for future in futures:
+            if not future.done():
+                pool.cancel(future)
@@ -0,0 +1,110 @@
+"""
+Cold-start benchmark for headless solving.
+
+Times fresh interpreter processes that import the solver engine (what a web
+worker does at start-up) or run a solver script headless on a small maze, and
+checks that none of them load pygame. The cost of importing pygame on its own
+is measured as a reference for what headless runs no longer pay.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs N]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Small open maze with the start in one corner and the end in the other
+MAZE_SIZE = 25
+
+
+def write_maze(directory: str) -> str:
+    """Write a benchmark maze file and return its path."""
+    maze = [[0] * MAZE_SIZE for _ in range(MAZE_SIZE)]
+    maze[0][0] = 2
+    maze[-1][-1] = 3
+    filename = os.path.join(directory, "bench_maze.txt")
+    with open(filename, "w") as f:
+        f.write("\n".join(str(row) for row in maze) + "\n")
+    return filename
+
+
+def time_command(command: List[str], cwd: str, runs: int) -> List[float]:
+    """
+    Run a command repeatedly in fresh processes.
+
+    Args:
+        command: Command line to run
+        cwd: Working directory
+        runs: Number of runs
+
+    Returns:
+        Wall-clock seconds of each run
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def loads_pygame(code: str, cwd: str) -> bool:
+    """Whether running a snippet in a fresh interpreter imports pygame."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    check = code + "\nimport sys\nprint('pygame' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", check], cwd=cwd, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return output.strip().splitlines()[-1] == "True"
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    """Min and median of a list of timings, in milliseconds."""
+    return {
+        'min_ms': round(min(timings) * 1000, 1),
+        'median_ms': round(statistics.median(timings) * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start of headless maze solving.")
+    parser.add_argument('--runs', type=int, default=10, help="Fresh processes per case")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        maze_file = write_maze(workdir)
+        cases = {
+            'python (baseline)': [sys.executable, "-c", "pass"],
+            'import pygame (reference)': [sys.executable, "-c", "import pygame"],
+            'import solver_engine': [sys.executable, "-c", "import solver_engine"],
+            'bfs.py headless': [sys.executable, os.path.join(REPO_ROOT, "bfs.py"), maze_file, "headless"],
+            'bfs.py --json': [sys.executable, os.path.join(REPO_ROOT, "bfs.py"), maze_file, "--json"],
+            'dijkstra.py --json': [sys.executable, os.path.join(REPO_ROOT, "dijkstra.py"), maze_file, "--json"]
+        }
+        results = {name: summarize(time_command(command, workdir, args.runs))
+                   for name, command in cases.items()}
+        results['pygame loaded by solver_engine'] = loads_pygame("import solver_engine", workdir)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Cold start over {args.runs} runs (min / median):")
+    for name, result in results.items():
+        if isinstance(result, dict):
+            print(f"  {name:<28} {result['min_ms']:>8.1f} ms {result['median_ms']:>8.1f} ms")
+    print(f"  pygame loaded by solver_engine: {results['pygame loaded by solver_engine']}")
+
+
+if __name__ == "__main__":
+    main()
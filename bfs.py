@@ -6,7 +6,8 @@ import time
 from collections import deque
 from typing import List, Tuple, Optional, Dict, Set
 from algorithm_base import PathfindingAlgorithm
-from utils import get_neighbors
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from grid import WALL
 from config import ALGORITHM_CONFIG
 
 class BFSAlgorithm(PathfindingAlgorithm):
@@ -23,9 +24,16 @@ class BFSAlgorithm(PathfindingAlgorithm):
         Returns:
             Tuple of (path, statistics)
         """
+        grid = self.grid
+        flat = grid.flat
+        goal_mask = grid.goal_mask
+        state = self.state = self.new_state()
+        visited = state.visited
+        parents = state.parents
+
         # Initialize queue with start position
-        self.queue.append(self.start)
-        self.visited.add(self.start)
+        self.queue.append(grid.start)
+        visited[grid.start] = 1
         
         nodes_explored = 0
         max_queue_size = 1
@@ -33,16 +41,19 @@ class BFSAlgorithm(PathfindingAlgorithm):
         while self.queue:
             current = self.queue.popleft()
             nodes_explored += 1
+            self.report_progress(nodes_explored)
+            if self.tracer:
+                self.tracer.expand(grid.position(current))
             
             # Check if we reached any goal
-            if current in self.ends:
+            if goal_mask[current]:
                 # Update self.end to the reached end point for path reconstruction
-                self.end = current
+                self.end = grid.position(current)
                 path = self.reconstruct_path()
                 return path, {
                     'nodes_explored': nodes_explored,
                     'max_queue_size': max_queue_size,
-                    'end_reached': current
+                    'end_reached': self.end
                 }
             
             # Update animation
@@ -52,44 +63,46 @@ class BFSAlgorithm(PathfindingAlgorithm):
                 time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
             
             # Explore neighbors
-            for neighbor in get_neighbors(current, self.rows, self.cols):
-                nr, nc = neighbor
+            for direction, offset in state.directions:
+                neighbor = current + offset
                 
-                # Skip walls and visited nodes
-                if self.maze[nr][nc] == 1 or neighbor in self.visited:
+                # Skip walls (including the border) and visited nodes
+                if flat[neighbor] == WALL or visited[neighbor]:
                     continue
                 
-                # Add to queue and mark as visited
+                # Add to queue, mark as visited and record the direction it was reached from
                 self.queue.append(neighbor)
-                self.visited.add(neighbor)
-                self.came_from[neighbor] = current
+                visited[neighbor] = 1
+                parents[neighbor] = direction
+                if self.tracer:
+                    self.tracer.discover(grid.position(neighbor))
             
             # Track maximum queue size
             max_queue_size = max(max_queue_size, len(self.queue))
             
-            # Timeout check
-            if time.time() - self.stats.get('start_time', time.time()) > ALGORITHM_CONFIG['TIMEOUT_SECONDS']:
-                break
+            # Stop when the deadline passes or the solve is cancelled
+            if self.should_stop(nodes_explored):
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'max_queue_size': max_queue_size,
+                    **self.deadline.stop_stats()
+                }
         
         # No path found
         return None, {
             'nodes_explored': nodes_explored,
-            'max_queue_size': max_queue_size,
-            'timeout': True
+            'max_queue_size': max_queue_size
         }
 
 def main():
     """Main function to run BFS algorithm."""
-    maze_file = sys.argv[1] if len(sys.argv) > 1 else "manual_maze.txt"
-
-    # Check for headless mode (no animation)
-    animate = True
-    if len(sys.argv) >= 3:
-        if sys.argv[2].lower() in ['false', 'headless', 'no-gui']:
-            animate = False
+    args = parse_solver_args("Solve a maze with Breadth-First Search.")
+    if args.json:
+        sys.exit(run_algorithm_json(BFSAlgorithm, 'bfs', args))
     
     try:
-        algorithm = BFSAlgorithm(maze_file, animate)
+        algorithm = BFSAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
         path, stats = algorithm.run()
         
         # Print results with clear success/failure indication
@@ -3,11 +3,13 @@ Bidirectional Search pathfinding algorithm with real-time animation.
 """
 import sys
 import time
-import pygame
 from collections import deque
 from typing import List, Tuple, Optional, Dict, Set
 from algorithm_base import PathfindingAlgorithm
-from utils import get_neighbors
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from utils import import_pygame
+from grid import WALL
+from search_state import NO_PARENT
 from config import ALGORITHM_CONFIG, COLORS
 
 class BidirectionalAlgorithm(PathfindingAlgorithm):
@@ -17,32 +19,32 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
         super().__init__(maze_file, animate)
         self.forward_queue = deque()
         self.backward_queue = deque()
-        self.forward_visited = set()
-        self.backward_visited = set()
-        self.forward_came_from = {}
-        self.backward_came_from = {}
+        # Search state of each direction, created per solve
+        self.forward_state = None
+        self.backward_state = None
     
-    def draw_maze(self, current_forward: Optional[Tuple[int, int]] = None, 
-                  current_backward: Optional[Tuple[int, int]] = None,
-                  frontier_forward: Optional[Set[Tuple[int, int]]] = None,
-                  frontier_backward: Optional[Set[Tuple[int, int]]] = None):
+    def draw_maze(self, current_forward: Optional[int] = None,
+                  current_backward: Optional[int] = None,
+                  frontier_forward: Optional[Set[int]] = None,
+                  frontier_backward: Optional[Set[int]] = None):
         """
         Draw the current state of the bidirectional search.
         
         Args:
-            current_forward: Current position being explored from start
-            current_backward: Current position being explored from end
-            frontier_forward: Forward frontier positions
-            frontier_backward: Backward frontier positions
+            current_forward: Cell id currently being explored from start
+            current_backward: Cell id currently being explored from end
+            frontier_forward: Forward frontier cell ids
+            frontier_backward: Backward frontier cell ids
         """
         if not self.animate:
             return
-            
+
+        pygame = import_pygame()
         self.screen.fill(COLORS['WHITE'])
         
         for row in range(self.rows):
             for col in range(self.cols):
-                pos = (row, col)
+                pos = self.grid.cell_id(row, col)
                 val = self.maze[row][col]
                 
                 # Determine color based on cell type and state
@@ -52,11 +54,11 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
                     color = COLORS['GREEN']
                 elif val == 3:  # End
                     color = COLORS['RED']
-                elif pos in self.forward_visited and pos in self.backward_visited:  # Meeting point
+                elif self.forward_state.visited[pos] and self.backward_state.visited[pos]:  # Meeting point
                     color = (255, 0, 255)  # Magenta for intersection
-                elif pos in self.forward_visited:  # Forward visited
+                elif self.forward_state.visited[pos]:  # Forward visited
                     color = COLORS['LIGHT_BLUE']
-                elif pos in self.backward_visited:  # Backward visited
+                elif self.backward_state.visited[pos]:  # Backward visited
                     color = (255, 192, 203)  # Light pink
                 elif frontier_forward and pos in frontier_forward:  # Forward frontier
                     color = COLORS['YELLOW']
@@ -101,34 +103,43 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-    
-    def reconstruct_bidirectional_path(self, meeting_point: Tuple[int, int]) -> List[Tuple[int, int]]:
+
+    def unreachable_result(self) -> Tuple[None, Dict]:
+        """Result of a solve whose ends cannot be reached, leaving empty search state to draw."""
+        self.forward_state = self.new_state()
+        self.backward_state = self.new_state()
+        return None, {'nodes_explored': 0, 'unreachable': True}
+
+    def explored_cells(self) -> Set[Tuple[int, int]]:
+        """Get every position visited by either search direction."""
+        if self.forward_state is None:
+            return set()
+        return set(self.grid.positions(self.forward_state.visited_cells())) | \
+            set(self.grid.positions(self.backward_state.visited_cells()))
+
+    def reconstruct_bidirectional_path(self, meeting_point: int) -> List[Tuple[int, int]]:
         """
         Reconstruct path from bidirectional search meeting point.
         
         Args:
-            meeting_point: The point where forward and backward searches meet
+            meeting_point: Cell id where forward and backward searches meet
             
         Returns:
             Complete path from start to end
         """
         # Build forward path (start to meeting point)
-        forward_path = []
-        current = meeting_point
-        while current in self.forward_came_from:
-            forward_path.append(current)
-            current = self.forward_came_from[current]
-        forward_path.reverse()
+        forward_path = self.forward_state.path_to(meeting_point)
         
         # Build backward path (meeting point to end)
+        backward = self.backward_state
         backward_path = []
         current = meeting_point
-        while current in self.backward_came_from:
-            current = self.backward_came_from[current]
+        while backward.parents[current] != NO_PARENT:
+            current = backward.parent(current)
             backward_path.append(current)
         
         # Combine paths
-        return forward_path + backward_path
+        return self.grid.positions(forward_path + backward_path)
     
     def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
         """
@@ -137,14 +148,24 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
         Returns:
             Tuple of (path, statistics)
         """
+        grid = self.grid
+        flat = grid.flat
+        self.forward_state = self.new_state()
+        self.backward_state = self.new_state()
+        forward_visited = self.forward_state.visited
+        forward_parents = self.forward_state.parents
+        backward_visited = self.backward_state.visited
+        backward_parents = self.backward_state.parents
+        directions = self.forward_state.directions
+
         # Initialize both searches
-        self.forward_queue.append(self.start)
-        self.forward_visited.add(self.start)
+        self.forward_queue.append(grid.start)
+        forward_visited[grid.start] = 1
 
         # Initialize backward search from all end points
-        for end_point in self.ends:
+        for end_point in grid.ends:
             self.backward_queue.append(end_point)
-            self.backward_visited.add(end_point)
+            backward_visited[end_point] = 1
         
         nodes_explored = 0
         max_queue_size = 1 + len(self.ends)
@@ -158,14 +179,17 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
                     
                 current = self.forward_queue.popleft()
                 nodes_explored += 1
+                self.report_progress(nodes_explored)
+                if self.tracer:
+                    self.tracer.expand(grid.position(current))
                 
                 # Check if we've met the backward search
-                if current in self.backward_visited:
+                if backward_visited[current]:
                     path = self.reconstruct_bidirectional_path(current)
                     return path, {
                         'nodes_explored': nodes_explored,
                         'max_queue_size': max_queue_size,
-                        'meeting_point': current
+                        'meeting_point': grid.position(current)
                     }
                 
                 # Update animation
@@ -175,17 +199,19 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
                     time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
                 
                 # Explore neighbors
-                for neighbor in get_neighbors(current, self.rows, self.cols):
-                    nr, nc = neighbor
+                for direction, offset in directions:
+                    neighbor = current + offset
                     
-                    # Skip walls and visited nodes
-                    if self.maze[nr][nc] == 1 or neighbor in self.forward_visited:
+                    # Skip walls (including the border) and visited nodes
+                    if flat[neighbor] == WALL or forward_visited[neighbor]:
                         continue
                     
                     # Add to forward search
                     self.forward_queue.append(neighbor)
-                    self.forward_visited.add(neighbor)
-                    self.forward_came_from[neighbor] = current
+                    forward_visited[neighbor] = 1
+                    forward_parents[neighbor] = direction
+                    if self.tracer:
+                        self.tracer.discover(grid.position(neighbor))
             
             else:
                 # Backward search step
@@ -194,14 +220,17 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
                     
                 current = self.backward_queue.popleft()
                 nodes_explored += 1
+                self.report_progress(nodes_explored)
+                if self.tracer:
+                    self.tracer.expand(grid.position(current))
                 
                 # Check if we've met the forward search
-                if current in self.forward_visited:
+                if forward_visited[current]:
                     path = self.reconstruct_bidirectional_path(current)
                     return path, {
                         'nodes_explored': nodes_explored,
                         'max_queue_size': max_queue_size,
-                        'meeting_point': current
+                        'meeting_point': grid.position(current)
                     }
                 
                 # Update animation
@@ -211,45 +240,47 @@ class BidirectionalAlgorithm(PathfindingAlgorithm):
                     time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
                 
                 # Explore neighbors
-                for neighbor in get_neighbors(current, self.rows, self.cols):
-                    nr, nc = neighbor
+                for direction, offset in directions:
+                    neighbor = current + offset
                     
-                    # Skip walls and visited nodes
-                    if self.maze[nr][nc] == 1 or neighbor in self.backward_visited:
+                    # Skip walls (including the border) and visited nodes
+                    if flat[neighbor] == WALL or backward_visited[neighbor]:
                         continue
                     
                     # Add to backward search
                     self.backward_queue.append(neighbor)
-                    self.backward_visited.add(neighbor)
-                    self.backward_came_from[neighbor] = current
+                    backward_visited[neighbor] = 1
+                    backward_parents[neighbor] = direction
+                    if self.tracer:
+                        self.tracer.discover(grid.position(neighbor))
             
             # Track maximum queue size
             total_queue_size = len(self.forward_queue) + len(self.backward_queue)
             max_queue_size = max(max_queue_size, total_queue_size)
             
-            # Timeout check
-            if time.time() - self.stats.get('start_time', time.time()) > ALGORITHM_CONFIG['TIMEOUT_SECONDS']:
-                break
+            # Stop when the deadline passes or the solve is cancelled
+            if self.should_stop(nodes_explored):
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'max_queue_size': max_queue_size,
+                    **self.deadline.stop_stats()
+                }
         
         # No path found
         return None, {
             'nodes_explored': nodes_explored,
-            'max_queue_size': max_queue_size,
-            'timeout': True
+            'max_queue_size': max_queue_size
         }
 
 def main():
     """Main function to run Bidirectional Search algorithm."""
-    maze_file = sys.argv[1] if len(sys.argv) > 1 else "manual_maze.txt"
-
-    # Check for headless mode (no animation)
-    animate = True
-    if len(sys.argv) >= 3:
-        if sys.argv[2].lower() in ['false', 'headless', 'no-gui']:
-            animate = False
+    args = parse_solver_args("Solve a maze with bidirectional BFS.")
+    if args.json:
+        sys.exit(run_algorithm_json(BidirectionalAlgorithm, 'bidirectional', args))
     
     try:
-        algorithm = BidirectionalAlgorithm(maze_file, animate)
+        algorithm = BidirectionalAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
         path, stats = algorithm.run()
         
         # Print results with clear success/failure indication
@@ -0,0 +1,226 @@
+"""
+Bidirectional A* (NBA*) with real-time animation.
+
+Two A* searches run towards each other: a forward one from the start, guided
+by the distance to the nearest end (see heuristic), and a backward one from
+every end at once, guided by the Manhattan distance back to the start. Each
+relaxation that reaches a cell the other side has also reached gives a
+candidate path, and the cheapest one so far is kept as `best`.
+
+Meeting the other search is not enough to stop, since the first meeting cell
+need not lie on a shortest path. Following NBA* (Pijls and Post, "Yet another
+bidirectional algorithm for shortest paths"):
+
+- A side stops the search when the lowest f-score it pops is at least
+  `best`; every path still open on that side costs at least as much.
+- A popped cell is closed without expanding it when `g + F - h_other` is at
+  least `best`, where F is the lowest f-score the other side has popped and
+  h_other is the other side's heuristic of the cell. No path through that
+  cell can beat `best`.
+
+Both heuristics are consistent and never overestimate terrain costs, so the
+path is optimal on weighted mazes too.
+"""
+import sys
+import time
+from array import array
+from typing import List, Tuple, Optional, Dict
+
+from bidirectional import BidirectionalAlgorithm
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from grid import WALL
+from search_state import cell_values, UNREACHED
+from open_list import make_open_list
+from heuristic import heuristic_table, manhattan_table
+from config import ALGORITHM_CONFIG
+
+
+class BidirectionalAStarAlgorithm(BidirectionalAlgorithm):
+    """Bidirectional A* search with the NBA* stopping and pruning rules."""
+
+    def __init__(self, maze_file: str, animate: bool = True):
+        super().__init__(maze_file, animate)
+        self.open_list_kind = None  # Open list name, or None for the configured default (see open_list)
+        self.heuristic_kind = None  # Forward heuristic name, or None for the configured default (see heuristic)
+        # Open lists of each direction, created per solve
+        self.forward_open = None
+        self.backward_open = None
+
+    def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+        """
+        Solve maze using bidirectional A*.
+
+        Returns:
+            Tuple of (path, statistics)
+        """
+        grid = self.grid
+        flat = grid.flat
+        costs = grid.costs
+        start = grid.start
+        forward = self.forward_state = self.new_state()
+        backward = self.backward_state = self.new_state()
+        directions = forward.directions
+
+        build_start = time.perf_counter()
+        forward_h, kind = heuristic_table(grid, self.heuristic_kind, self.deadline)
+        backward_h = array('i', manhattan_table(grid, [start]).tobytes())
+        heuristic_stats = {'heuristic': kind, 'heuristic_time': time.perf_counter() - build_start}
+
+        forward_open = self.forward_open = make_open_list(self.open_list_kind, grid, self.compact_state)
+        backward_open = self.backward_open = make_open_list(self.open_list_kind, grid, self.compact_state)
+        if forward_h[start] == UNREACHED:
+            # The start cannot reach an end (or the maze has none)
+            return None, {'nodes_explored': 0, 'max_frontier_size': 0,
+                          'open_list': forward_open.name, **heuristic_stats}
+
+        forward_g = cell_values(grid, self.compact_state)
+        backward_g = cell_values(grid, self.compact_state)
+        forward_g[start] = 0
+        forward_open.push(forward_h[start], start)
+        # Initialize backward search from all end points
+        for end_point in grid.ends:
+            backward_g[end_point] = 0
+            backward_open.push(backward_h[end_point], end_point)
+
+        # Per side: open list, search state, g-scores and heuristic, indexed 0 forward, 1 backward
+        sides = (
+            (forward_open, forward, forward_g, forward_h),
+            (backward_open, backward, backward_g, backward_h)
+        )
+        # Lowest f-score popped so far on each side, a lower bound for pruning on the other
+        bounds = [forward_h[start], min(backward_h[end_point] for end_point in grid.ends)]
+        best = UNREACHED
+        meeting_point = None
+
+        nodes_explored = 0
+        pruned = 0
+        max_frontier_size = 1 + len(grid.ends)
+
+        while forward_open and backward_open:
+            # Expand the side with the smaller open list
+            side = 0 if len(forward_open) <= len(backward_open) else 1
+            open_set, state, g_score, h = sides[side]
+            _, _, other_g, other_h = sides[1 - side]
+            visited = state.visited
+
+            current_f, current = open_set.pop()
+            if visited[current]:
+                continue  # Stale duplicate of a cell re-pushed with a lower f_score
+            if current_f >= best:
+                break
+            visited[current] = 1
+            bounds[side] = current_f
+
+            current_g = g_score[current]
+            if current_g + bounds[1 - side] - other_h[current] >= best:
+                pruned += 1
+                continue
+
+            nodes_explored += 1
+            self.report_progress(nodes_explored)
+            if self.tracer:
+                self.tracer.expand(grid.position(current))
+
+            # Update animation
+            if self.animate and nodes_explored % 3 == 0:
+                self.stats['nodes_explored'] = nodes_explored
+                currents = (current, None) if side == 0 else (None, current)
+                self.draw_maze(*currents, set(forward_open.cells()), set(backward_open.cells()))
+                time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
+
+            # Backward steps walk forward moves in reverse, which pay to enter the current cell
+            leave_cost = costs[current] if side else 0
+            parents = state.parents
+            for direction, offset in directions:
+                neighbor = current + offset
+
+                # Skip walls (including the border) and cells this side has closed
+                if flat[neighbor] == WALL or visited[neighbor]:
+                    continue
+
+                tentative_g = current_g + (leave_cost or costs[neighbor])
+                if tentative_g < g_score[neighbor]:
+                    if self.tracer and g_score[neighbor] == UNREACHED:
+                        self.tracer.discover(grid.position(neighbor))
+                    g_score[neighbor] = tentative_g
+                    parents[neighbor] = direction
+                    open_set.push(tentative_g + h[neighbor], neighbor)
+
+                    # Both searches have reached this cell: a candidate path
+                    if tentative_g + other_g[neighbor] < best:
+                        best = tentative_g + other_g[neighbor]
+                        meeting_point = neighbor
+
+            # Track maximum frontier size
+            max_frontier_size = max(max_frontier_size, len(forward_open) + len(backward_open))
+
+            # Stop when the deadline passes or the solve is cancelled
+            if self.should_stop(nodes_explored):
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'pruned': pruned,
+                    'max_frontier_size': max_frontier_size,
+                    'open_list': forward_open.name,
+                    **heuristic_stats,
+                    **self.deadline.stop_stats()
+                }
+
+        if meeting_point is None:
+            # No path found
+            return None, {
+                'nodes_explored': nodes_explored,
+                'pruned': pruned,
+                'max_frontier_size': max_frontier_size,
+                'open_list': forward_open.name,
+                **heuristic_stats
+            }
+
+        path = self.reconstruct_bidirectional_path(meeting_point)
+        self.end = path[-1]
+        return path, {
+            'nodes_explored': nodes_explored,
+            'pruned': pruned,
+            'max_frontier_size': max_frontier_size,
+            'meeting_point': grid.position(meeting_point),
+            'final_path_cost': best,
+            'open_list': forward_open.name,
+            **heuristic_stats,
+            'end_reached': self.end
+        }
+
+
+def main():
+    """Main function to run bidirectional A*."""
+    args = parse_solver_args("Solve a maze with bidirectional A* (NBA*).")
+    if args.json:
+        sys.exit(run_algorithm_json(BidirectionalAStarAlgorithm, 'bidirectional-astar', args))
+
+    try:
+        algorithm = BidirectionalAStarAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
+        path, stats = algorithm.run()
+
+        if path:
+            print(f"Bidirectional A* Path found! Length: {len(path)}")
+            print(f"Path cost: {stats['path_cost']}")
+            print(f"SUCCESS: Path successfully found using bidirectional A* algorithm")
+            print(f"Searches met at: {stats['meeting_point']}")
+        else:
+            print("Bidirectional A* No path found")
+            print("FAILURE: No path exists between start and end points")
+
+        print(f"Nodes explored: {stats['nodes_explored']}")
+        print(f"Time taken: {stats['execution_time']:.3f} seconds")
+        print(f"Max frontier size: {stats.get('max_frontier_size', 0)}")
+
+        if stats.get('timeout'):
+            print("Algorithm timed out")
+            print("FAILURE: Algorithm exceeded time limit")
+
+    except Exception as e:
+        print(f"Error running bidirectional A* algorithm: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
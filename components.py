@@ -0,0 +1,185 @@
+"""
+Connected-component index of a maze's open cells.
+
+Every non-wall cell gets the label of the region it belongs to, found with
+a vectorised union-find over the grid array. Each horizontal run of open
+cells starts as one tree rooted at its first cell. Each round then hooks the
+larger root of every open vertical pair of neighbours onto the smaller one,
+and pointer jumping flattens every cell onto its root. Roots only ever
+decrease, so no cycles form, and a few rounds settle even long serpentine
+corridors.
+
+Two cells are connected exactly when their labels match, so a solve whose
+start shares no label with any end is answered "no path" by a lookup instead
+of a search that floods everything reachable before giving up. Labels depend
+on the walls only, not on the start, ends or terrain, and are cached under a
+hash of the wall layout: every solve of the same walls reuses them.
+"""
+import logging
+import threading
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from config import COMPONENT_CONFIG
+from grid import Grid, WALL, layout_key
+from sized_cache import SizedLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def label_components(grid: Grid) -> Tuple[np.ndarray, int]:
+    """
+    Label the connected regions of a grid's open cells.
+
+    Args:
+        grid: Grid of the maze
+
+    Returns:
+        Tuple of (int32 labels indexed by flat cell id, 0 on walls and 1..count on open
+        cells, number of components)
+    """
+    open_cells = grid.cells.reshape(-1) != WALL
+    ids = np.arange(grid.size, dtype=np.int32)
+
+    # Every open cell starts out pointing at the first cell of its horizontal run
+    run_starts = open_cells.copy()
+    run_starts[1:] &= ~open_cells[:-1]
+    parent = np.maximum.accumulate(np.where(run_starts, ids, 0)).astype(np.int32)
+    parent[~open_cells] = ids[~open_cells]
+
+    # Open pairs of vertical neighbours join the runs; the wall border keeps ids in range
+    first = np.flatnonzero(open_cells[:-grid.width] & open_cells[grid.width:]).astype(np.int32)
+    second = first + grid.width
+
+    while first.size:
+        root_first = parent[first]
+        root_second = parent[second]
+        # Pairs already in one component stay that way, so they drop out of later rounds
+        split = root_first != root_second
+        if not split.any():
+            break
+        first, second = first[split], second[split]
+        root_first, root_second = root_first[split], root_second[split]
+        # Where a root is hooked several times one write wins; each points at a smaller root
+        parent[np.maximum(root_first, root_second)] = np.minimum(root_first, root_second)
+
+        # Pointer jumping until every cell points straight at its root
+        deep = np.flatnonzero(parent[parent] != parent)
+        while deep.size:
+            parent[deep] = parent[parent[deep]]
+            deep = deep[parent[parent[deep]] != parent[deep]]
+
+    roots = open_cells & (parent == ids)
+    numbers = np.cumsum(roots, dtype=np.int32)
+    labels = np.zeros(grid.size, dtype=np.int32)
+    labels[open_cells] = numbers[parent[open_cells]]
+    return labels, int(numbers[-1])
+
+
+class ComponentIndex:
+    """Component label of every cell of a wall layout."""
+
+    def __init__(self, grid: Grid):
+        """
+        Label the components of a grid.
+
+        Args:
+            grid: Grid of the maze; the index is valid for any grid with the same walls
+        """
+        self.width = grid.width
+        self.labels, self.count = label_components(grid)
+
+    def label(self, position: Tuple[int, int]) -> int:
+        """Component label of a position, 0 for a wall."""
+        return int(self.labels[(position[0] + 1) * self.width + position[1] + 1])
+
+    def connected(self, first: Tuple[int, int], second: Tuple[int, int]) -> bool:
+        """Whether a path of open cells joins two positions."""
+        label = self.label(first)
+        return label != 0 and label == self.label(second)
+
+    def reachable(self, start: int, ends: Iterable[int]) -> bool:
+        """
+        Whether any end can be reached from the start.
+
+        Args:
+            start: Flat cell id of the start
+            ends: Flat cell ids of the end points
+
+        Returns:
+            True if the start shares a component with at least one end
+        """
+        labels = self.labels
+        label = labels[start]
+        return label != 0 and any(labels[end] == label for end in ends)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the label array."""
+        return self.labels.nbytes
+
+
+class ComponentCache(SizedLRUCache):
+    """Thread-safe LRU cache of component indexes keyed by wall layout, bounded by total size."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for all indexes together
+        """
+        super().__init__(max_bytes or COMPONENT_CONFIG['MAX_BYTES'])
+
+    def index_for(self, grid: Grid) -> Tuple[ComponentIndex, bool]:
+        """
+        Get the cached component index for a grid's walls, labelling it on a miss.
+
+        Args:
+            grid: Grid of the maze
+
+        Returns:
+            Tuple of (index, whether it came from the cache)
+        """
+        key = layout_key(grid)
+        index = self.get(key)
+        if index is not None:
+            return index, True
+
+        index = ComponentIndex(grid)
+        self.put(key, index)
+        logger.debug(f"Labelled {index.count} components of a {grid.rows}x{grid.cols} maze")
+        return index, False
+
+
+_cache: Optional[ComponentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_component_cache() -> ComponentCache:
+    """Get the process-wide component cache; each solver worker process has its own."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ComponentCache()
+        return _cache
+
+
+def end_reachable(grid: Grid) -> bool:
+    """
+    Whether a grid's start shares a component with any of its end points.
+
+    Args:
+        grid: Grid with its start and end points located
+
+    Returns:
+        False if the maze has no start or no end, or every end lies in another region;
+        with COMPONENT_CONFIG['ENABLED'] off, only the first two are checked
+    """
+    if not COMPONENT_CONFIG['ENABLED']:
+        return grid.start is not None and bool(grid.ends)
+    if grid.start is None or not grid.ends:
+        return False
+    index, _ = get_component_cache().index_for(grid)
+    return index.reachable(grid.start, grid.ends)
@@ -10,7 +10,8 @@ APP_CONFIG = {
     'DEBUG': os.getenv('DEBUG', 'False').lower() == 'true',
     'HOST': os.getenv('HOST', '127.0.0.1'),
     'PORT': int(os.getenv('PORT', 5000)),
-    'SECRET_KEY': os.getenv('SECRET_KEY', 'maze-solver-secret-key')
+    'SECRET_KEY': os.getenv('SECRET_KEY', 'maze-solver-secret-key'),
+    'THREADED': os.getenv('THREADED', 'True').lower() == 'true'
 }
 
 # Maze settings
@@ -27,7 +28,88 @@ MAZE_CONFIG = {
 ALGORITHM_CONFIG = {
     'TIMEOUT_SECONDS': 30,
     'MAX_PATH_LENGTH': 10000,
-    'ANIMATION_DELAY': 0.05
+    'ANIMATION_DELAY': 0.05,
+    'PROGRESS_INTERVAL': 500,  # Nodes expanded between progress updates
+    'DEADLINE_CHECK_INTERVAL': 256,  # Nodes expanded between deadline/cancellation checks
+    'OPEN_LIST': os.getenv('OPEN_LIST', 'heap'),  # Default open list of A*, JPS and Dijkstra: heap, bucket, indexed-heap or radix
+    'WEIGHTED_OPEN_LIST': os.getenv('WEIGHTED_OPEN_LIST', 'bucket'),  # Default open list on mazes with terrain
+    'HEURISTIC': os.getenv('HEURISTIC', 'auto'),  # A*/JPS heuristic table: manhattan, exact (goal-tree distances) or auto
+    'COMPACT_STATE': True  # Flat per-cell arrays for search state; False keeps dicts of touched cells
+}
+
+# Solver worker pool settings
+WORKER_CONFIG = {
+    'ENABLED': os.getenv('WORKER_POOL', 'True').lower() == 'true',
+    'PROCESSES': int(os.getenv('WORKER_PROCESSES', os.cpu_count() or 1)),
+    'MAX_TASKS_PER_WORKER': int(os.getenv('WORKER_MAX_TASKS', 200)),
+    'MAX_MEMORY_MB': int(os.getenv('WORKER_MAX_MEMORY_MB', 512)),
+    'START_METHOD': os.getenv('WORKER_START_METHOD', 'spawn'),
+    'SOLVE_TIMEOUT_SECONDS': 60,
+    'KILL_GRACE_SECONDS': 5  # Extra time past the solve deadline before a worker is killed
+}
+
+# Asynchronous job settings
+JOB_CONFIG = {
+    'MAX_QUEUED': int(os.getenv('JOB_MAX_QUEUED', 32)),
+    'RUNNERS': WORKER_CONFIG['PROCESSES'],
+    'RESULT_TTL_SECONDS': 600,
+    'TIMEOUT_SECONDS': 300,
+    'RETRY_AFTER_SECONDS': 5
+}
+
+# Batch solve settings
+BATCH_CONFIG = {
+    'MAX_MAZES': 200,
+    'MAX_TASKS': 1000  # mazes x algorithms
+}
+
+# Live exploration stream (/solve/stream) settings
+STREAM_CONFIG = {
+    'DEFAULT_FPS': 20,
+    'MAX_FPS': 60,
+    'DEFAULT_MAX_EVENTS_PER_SECOND': 1000,  # expanded + frontier cells sent per second
+    'MAX_EVENTS_PER_SECOND': 20000,
+    'MAX_DURATION_SECONDS': 60  # Longer streams are sped up to finish in time
+}
+
+# Pre-generated random maze pool (/generate-random-mazes) settings
+MAZE_POOL_CONFIG = {
+    'ENABLED': os.getenv('MAZE_POOL', 'True').lower() == 'true',
+    'SIZE_PER_BUCKET': int(os.getenv('MAZE_POOL_SIZE', 20)),  # Ready mazes kept per maze size
+    'REFILL_PER_SECOND': float(os.getenv('MAZE_POOL_REFILL_PER_SECOND', 200)),  # Mazes generated per second
+    'PREWARM_SIZES': [MAZE_CONFIG['DEFAULT_SIZE']]  # Sizes filled at start-up; others on first request
+}
+
+# Solution cache settings
+CACHE_CONFIG = {
+    'ENABLED': os.getenv('SOLUTION_CACHE', 'True').lower() == 'true',
+    'MAX_BYTES': int(os.getenv('SOLUTION_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+}
+
+# Goal-rooted shortest-path tree cache used by the goal-tree solver
+GOAL_TREE_CONFIG = {
+    'MAX_BYTES': int(os.getenv('GOAL_TREE_CACHE_MAX_BYTES', 64 * 1024 * 1024))  # Per solver process
+}
+
+# Connected-component labels used to answer unreachable solves without searching
+COMPONENT_CONFIG = {
+    'ENABLED': os.getenv('COMPONENT_INDEX', 'True').lower() == 'true',
+    'MAX_BYTES': int(os.getenv('COMPONENT_CACHE_MAX_BYTES', 16 * 1024 * 1024))  # Per process
+}
+
+# Hierarchical A* (hpa) settings
+HPA_CONFIG = {
+    'CLUSTER_SIZE': int(os.getenv('HPA_CLUSTER_SIZE', 16)),  # Cluster side in cells
+    'MAX_BYTES': int(os.getenv('HPA_CACHE_MAX_BYTES', 64 * 1024 * 1024))  # Abstract graph cache, per solver process
+}
+
+# Reinforcement learning settings (tuned for web app performance)
+RL_CONFIG = {
+    'EPISODES': 300,
+    'ALPHA': 0.1,
+    'GAMMA': 0.9,
+    'EPSILON': 0.3,
+    'MAX_STEPS_PER_EPISODE': 300
 }
 
 # Colors
@@ -41,7 +123,18 @@ COLORS = {
     'DARK_GREY': (50, 50, 50),
     'YELLOW': (255, 255, 0),
     'LIGHT_BLUE': (173, 216, 230),
-    'ORANGE': (255, 165, 0)
+    'ORANGE': (255, 165, 0),
+    'SAND': (237, 201, 175),
+    'MUD': (139, 94, 60),
+    'WATER': (64, 164, 223)
+}
+
+# Terrain cells: cell value -> name, cost of entering the cell (1-255) and image colour.
+# Path, start and end cells cost 1, so Manhattan distance stays an admissible A* heuristic.
+TERRAIN_CONFIG = {
+    4: {'name': 'sand', 'cost': 2, 'color': 'SAND'},
+    5: {'name': 'mud', 'cost': 4, 'color': 'MUD'},
+    6: {'name': 'water', 'cost': 8, 'color': 'WATER'}
 }
 
 # File paths
@@ -50,7 +143,8 @@ PATHS = {
     'RANDOM_MAZE': 'random_maze.txt',
     'MAZE_IMAGE': 'maze.png',
     'SOLUTION_IMAGE': 'solution.png',
-    'LOG_FILE': 'maze_solver.log'
+    'LOG_FILE': 'maze_solver.log',
+    'WORKSPACE_ROOT': os.getenv('MAZE_WORKSPACE_ROOT')  # None uses the system temp dir
 }
 
 def setup_logging(level=logging.WARNING):
@@ -58,15 +152,17 @@ def setup_logging(level=logging.WARNING):
     # Suppress pygame welcome message
     os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
-    # Configure logging with less verbose output
-    logging.basicConfig(
-        level=level,
-        format='%(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(PATHS['LOG_FILE']),
-            logging.StreamHandler()
-        ]
-    )
+    # Several modules call this at import time; only the first call configures handlers
+    if not logging.getLogger().handlers:
+        # Configure logging with less verbose output; the log file is opened on first write
+        logging.basicConfig(
+            level=level,
+            format='%(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(PATHS['LOG_FILE'], delay=True),
+                logging.StreamHandler()
+            ]
+        )
 
     # Reduce werkzeug (Flask) logging verbosity
     logging.getLogger('werkzeug').setLevel(logging.ERROR)
@@ -89,58 +185,113 @@ def get_algorithm_script(algorithm: str) -> str:
     """Get the script filename for a given algorithm."""
     algorithm_map = {
         'astar': 'astar.py',
+        'jps': 'jps.py',
         'bfs': 'bfs.py',
+        'bfs-vector': 'vector_bfs.py',
         'dfs': 'dfs.py',
         'dijkstra': 'dijkstra.py',
         'bidirectional': 'bidirectional.py',
+        'bidirectional-astar': 'bidirectional_astar.py',
+        'hpa': 'hpa.py',
         'reinforcement': 'rl_solver.py',
         'rl': 'rl_solver.py'
     }
     return algorithm_map.get(algorithm.lower())
 
+def get_terrain_info() -> Dict[int, Dict[str, Any]]:
+    """Get the name, entry cost and colour of each terrain cell value."""
+    return {value: {'name': terrain['name'], 'cost': terrain['cost'], 'color': COLORS[terrain['color']]}
+            for value, terrain in TERRAIN_CONFIG.items()}
+
 def get_algorithm_info() -> Dict[str, Dict[str, str]]:
-    """Get information about available algorithms."""
+    """Get information about available algorithms; 'weighted' ones find the cheapest path over terrain."""
     return {
         'reinforcement': {
             'name': 'Reinforcement Learning (Q-Learning)',
             'description': 'AI agent learns optimal path through trial and error',
             'complexity': 'O(episodes × max_steps)',
             'optimal': False,
-            'complete': True
+            'complete': True,
+            'weighted': False
         },
         'astar': {
             'name': 'A* (A-Star)',
             'description': 'Optimal pathfinding using heuristics for fast performance',
             'complexity': 'O(b^d)',
             'optimal': True,
-            'complete': True
+            'complete': True,
+            'weighted': True
+        },
+        'jps': {
+            'name': 'Jump Point Search',
+            'description': 'A* that jumps across open areas, expanding only corners and forced turns',
+            'complexity': 'O(b^d)',
+            'optimal': True,
+            'complete': True,
+            'weighted': True
         },
         'bfs': {
             'name': 'Breadth-First Search',
             'description': 'Guarantees shortest path by exploring level by level',
             'complexity': 'O(b^d)',
             'optimal': True,
-            'complete': True
+            'complete': True,
+            'weighted': False
+        },
+        'bfs-vector': {
+            'name': 'Vectorized Breadth-First Search',
+            'description': 'BFS that expands each whole level at once with NumPy array operations',
+            'complexity': 'O(V + E)',
+            'optimal': True,
+            'complete': True,
+            'weighted': False
+        },
+        'goal-tree': {
+            'name': 'Goal Tree (cached BFS from the ends)',
+            'description': 'Builds one shortest-path tree from the end points per maze, then answers any start instantly',
+            'complexity': 'O(V + E) once per maze, then O(path length)',
+            'optimal': True,
+            'complete': True,
+            'weighted': False
         },
         'dfs': {
             'name': 'Depth-First Search',
             'description': 'Memory efficient but may not find shortest path',
             'complexity': 'O(b^m)',
             'optimal': False,
-            'complete': True
+            'complete': True,
+            'weighted': False
         },
         'dijkstra': {
             'name': 'Dijkstra\'s Algorithm',
             'description': 'Optimal for weighted graphs, similar to BFS for unweighted',
             'complexity': 'O((V + E) log V)',
             'optimal': True,
-            'complete': True
+            'complete': True,
+            'weighted': True
         },
         'bidirectional': {
             'name': 'Bidirectional Search',
             'description': 'Searches from both start and end simultaneously',
             'complexity': 'O(b^(d/2))',
             'optimal': True,
-            'complete': True
+            'complete': True,
+            'weighted': False
+        },
+        'bidirectional-astar': {
+            'name': 'Bidirectional A* (NBA*)',
+            'description': 'Two A* searches from the start and the ends that stop once no cheaper path can exist',
+            'complexity': 'O(b^(d/2))',
+            'optimal': True,
+            'complete': True,
+            'weighted': True
+        },
+        'hpa': {
+            'name': 'Hierarchical A* (HPA*)',
+            'description': 'A* over cached cluster entrances, refined only inside the clusters on the route; near-optimal',
+            'complexity': 'O(clusters on route × cluster size)',
+            'optimal': False,
+            'complete': True,
+            'weighted': True
         }
     }
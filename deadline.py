@@ -0,0 +1,64 @@
+"""
+Deadlines and cooperative cancellation for solver loops.
+
+A Deadline combines a monotonic-clock time limit with a cancellation flag.
+Solvers poll it every few expansions and stop early, returning what they
+have explored so far with a 'timeout' or 'cancelled' status.
+"""
+import time
+from typing import Optional
+
+from config import ALGORITHM_CONFIG
+
+
+class Deadline:
+    """Time limit and cancellation token shared between a request and its solver."""
+
+    def __init__(self, timeout: Optional[float] = None, check_interval: Optional[int] = None):
+        """
+        Initialize the deadline.
+
+        Args:
+            timeout: Seconds from now until the deadline; None for no time limit
+            check_interval: Expansions between clock checks in check()
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout if timeout is not None else None
+        self.check_interval = check_interval or ALGORITHM_CONFIG['DEADLINE_CHECK_INTERVAL']
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Ask the solver to stop at its next check."""
+        self.cancelled = True
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without a time limit."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the solver should stop now."""
+        return self.cancelled or (self.expires_at is not None and time.monotonic() >= self.expires_at)
+
+    def check(self, count: int) -> bool:
+        """
+        Cheap per-expansion check that only reads the clock every check_interval calls.
+
+        Args:
+            count: Running number of expansions (or steps) so far
+
+        Returns:
+            True if the solver should stop
+        """
+        return count % self.check_interval == 0 and self.expired()
+
+    @property
+    def status(self) -> str:
+        """Status to report for a search stopped by this deadline."""
+        return 'cancelled' if self.cancelled else 'timeout'
+
+    def stop_stats(self) -> dict:
+        """Statistics marking a search that was stopped early."""
+        status = self.status
+        return {'status': status, status: True, 'partial': True}
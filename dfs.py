@@ -5,7 +5,9 @@ import sys
 import time
 from typing import List, Tuple, Optional, Dict, Set
 from algorithm_base import PathfindingAlgorithm
-from utils import get_neighbors
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from grid import WALL
+from search_state import NO_PARENT
 from config import ALGORITHM_CONFIG
 
 class DFSAlgorithm(PathfindingAlgorithm):
@@ -22,8 +24,17 @@ class DFSAlgorithm(PathfindingAlgorithm):
         Returns:
             Tuple of (path, statistics)
         """
+        grid = self.grid
+        flat = grid.flat
+        goal_mask = grid.goal_mask
+        state = self.state = self.new_state()
+        visited = state.visited
+        parents = state.parents
+        # DFS explores neighbors in reverse order (right, left, down, up)
+        directions = state.directions[::-1]
+
         # Initialize stack with start position
-        self.stack.append(self.start)
+        self.stack.append(grid.start)
 
         nodes_explored = 0
         max_stack_size = 1
@@ -32,22 +43,25 @@ class DFSAlgorithm(PathfindingAlgorithm):
             current = self.stack.pop()
 
             # Skip if already visited
-            if current in self.visited:
+            if visited[current]:
                 continue
 
             # Mark as visited
-            self.visited.add(current)
+            visited[current] = 1
             nodes_explored += 1
+            self.report_progress(nodes_explored)
+            if self.tracer:
+                self.tracer.expand(grid.position(current))
 
             # Check if we reached any goal
-            if current in self.ends:
+            if goal_mask[current]:
                 # Update self.end to the reached end point for path reconstruction
-                self.end = current
+                self.end = grid.position(current)
                 path = self.reconstruct_path()
                 return path, {
                     'nodes_explored': nodes_explored,
                     'max_stack_size': max_stack_size,
-                    'end_reached': current
+                    'end_reached': self.end
                 }
 
             # Update animation
@@ -56,48 +70,47 @@ class DFSAlgorithm(PathfindingAlgorithm):
                 self.draw_maze(current, set(self.stack))
                 time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
 
-            # Explore neighbors (in reverse order for DFS)
-            neighbors = get_neighbors(current, self.rows, self.cols)
-            neighbors.reverse()  # DFS explores in reverse order
-
-            for neighbor in neighbors:
-                nr, nc = neighbor
+            # Explore neighbors
+            for direction, offset in directions:
+                neighbor = current + offset
 
-                # Skip walls and visited nodes
-                if self.maze[nr][nc] == 1 or neighbor in self.visited:
+                # Skip walls (including the border) and visited nodes
+                if flat[neighbor] == WALL or visited[neighbor]:
                     continue
 
                 # Add to stack and record path
-                if neighbor not in self.came_from:
+                if parents[neighbor] == NO_PARENT:
                     self.stack.append(neighbor)
-                    self.came_from[neighbor] = current
+                    parents[neighbor] = direction
+                    if self.tracer:
+                        self.tracer.discover(grid.position(neighbor))
 
             # Track maximum stack size
             max_stack_size = max(max_stack_size, len(self.stack))
 
-            # Timeout check
-            if time.time() - self.stats.get('start_time', time.time()) > ALGORITHM_CONFIG['TIMEOUT_SECONDS']:
-                break
+            # Stop when the deadline passes or the solve is cancelled
+            if self.should_stop(nodes_explored):
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'max_stack_size': max_stack_size,
+                    **self.deadline.stop_stats()
+                }
 
         # No path found
         return None, {
             'nodes_explored': nodes_explored,
-            'max_stack_size': max_stack_size,
-            'timeout': True
+            'max_stack_size': max_stack_size
         }
 
 def main():
     """Main function to run DFS algorithm."""
-    maze_file = sys.argv[1] if len(sys.argv) > 1 else "manual_maze.txt"
-
-    # Check for headless mode (no animation)
-    animate = True
-    if len(sys.argv) >= 3:
-        if sys.argv[2].lower() in ['false', 'headless', 'no-gui']:
-            animate = False
+    args = parse_solver_args("Solve a maze with Depth-First Search.")
+    if args.json:
+        sys.exit(run_algorithm_json(DFSAlgorithm, 'dfs', args))
 
     try:
-        algorithm = DFSAlgorithm(maze_file, animate)
+        algorithm = DFSAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
         path, stats = algorithm.run()
 
         # Print results with clear success/failure indication
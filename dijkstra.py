@@ -1,102 +1,130 @@
-import pygame
 import time
 import sys
-import heapq
-from utils import load_maze_from_file, find_start_end_positions
-from config import MAZE_CONFIG, COLORS
-
-# Constants
-CELL_SIZE = MAZE_CONFIG['CELL_SIZE']
-MARGIN = MAZE_CONFIG['MARGIN']
-WHITE = COLORS['WHITE']
-BLACK = COLORS['BLACK']
-GREEN = COLORS['GREEN']
-RED = COLORS['RED']
-BLUE = COLORS['BLUE']
-
-# Global variables (will be set in main)
-maze = None
-ROWS, COLS = 0, 0
-start, ends = None, []
-
-# Dijkstra Algorithm
-def dijkstra(maze, start, ends):
+from utils import load_maze_from_file, find_start_end_positions, save_maze_image
+from config import ALGORITHM_CONFIG
+from deadline import Deadline
+from grid import Grid, WALL, path_cost
+from components import end_reachable
+from open_list import make_open_list
+from solver_cli import parse_solver_args, make_deadline, build_result, write_json_result
+
+def dijkstra(maze, start, ends, progress_callback=None, explored=None, tracer=None, deadline=None,
+             open_list=None, reachable=None):
+    """
+    Find the cheapest path from start to the nearest end point.
+
+    Args:
+        maze: 2D list representing the maze, or a Grid
+        start: Start position (row, col)
+        ends: List of end positions
+        progress_callback: Optional callable receiving periodic progress dicts
+        explored: Optional set that collects every expanded position
+        tracer: Optional exploration tracer with expand(pos) and discover(pos) hooks
+        deadline: Optional Deadline checked every few expansions
+        open_list: Open list name (see open_list.OPEN_LISTS), or None for the configured default
+        reachable: Whether an end can be reached from the start, if already known; checked
+            against the maze's connected components otherwise
+
+    Returns:
+        Tuple of (path, statistics); path is None if no end is reachable
+    """
     start_time = time.time()
-    heap = [(0, start)]
+    grid = Grid.from_maze(maze, start, ends)
+    flat = grid.flat
+    costs = grid.costs
+    goal_mask = grid.goal_mask
+    offsets = grid.offsets
+    start = grid.cell_id(*start)
+    frontier = make_open_list(open_list, grid)
+    if reachable is None:
+        reachable = end_reachable(grid)
+    if not reachable:
+        # The start and every end lie in different regions: nothing to search
+        return None, {
+            'nodes_explored': 0,
+            'max_frontier_size': 0,
+            'open_list': frontier.name,
+            'unreachable': True,
+            'execution_time': time.time() - start_time
+        }
+    frontier.push(0, start)
     came_from = {}
     cost_so_far = {start: 0}
-    reached_end = None
-
-    while heap:
-        current_cost, current = heapq.heappop(heap)
-
-        if current in ends:
-            reached_end = current
+    nodes_explored = 0
+    max_frontier_size = 1
+
+    while frontier:
+        current_cost, current = frontier.pop()
+        if current_cost > cost_so_far[current]:
+            continue  # Stale duplicate of a cell re-pushed with a lower cost
+        nodes_explored += 1
+        if explored is not None:
+            explored.add(grid.position(current))
+        if progress_callback and nodes_explored % ALGORITHM_CONFIG['PROGRESS_INTERVAL'] == 0:
+            progress_callback({'nodes_explored': nodes_explored})
+        if tracer:
+            tracer.expand(grid.position(current))
+
+        if goal_mask[current]:
+            reached_end = grid.position(current)
             path = []
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
             path.reverse()
-            return path, time.time() - start_time, reached_end
-
-        for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-            nr, nc = current[0] + dr, current[1] + dc
-            neighbor = (nr, nc)
-
-            if 0 <= nr < ROWS and 0 <= nc < COLS and maze[nr][nc] != 1:
-                new_cost = cost_so_far[current] + 1
+            return grid.positions(path), {
+                'nodes_explored': nodes_explored,
+                'max_frontier_size': max_frontier_size,
+                'final_path_cost': current_cost,
+                'open_list': frontier.name,
+                'end_reached': reached_end,
+                'execution_time': time.time() - start_time
+            }
+
+        for offset in offsets:
+            neighbor = current + offset
+
+            # The wall border makes bounds checks unnecessary
+            if flat[neighbor] != WALL:
+                new_cost = current_cost + costs[neighbor]
                 if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
-                    heapq.heappush(heap, (new_cost, neighbor))
+                    frontier.push(new_cost, neighbor)
                     came_from[neighbor] = current
+                    if tracer:
+                        tracer.discover(grid.position(neighbor))
+
+        max_frontier_size = max(max_frontier_size, len(frontier))
+
+        # Stop when the deadline passes or the solve is cancelled
+        if deadline is not None and deadline.check(nodes_explored):
+            return None, {
+                'nodes_explored': nodes_explored,
+                'max_frontier_size': max_frontier_size,
+                'open_list': frontier.name,
+                'execution_time': time.time() - start_time,
+                **deadline.stop_stats()
+            }
+
+    return None, {
+        'nodes_explored': nodes_explored,
+        'max_frontier_size': max_frontier_size,
+        'open_list': frontier.name,
+        'execution_time': time.time() - start_time
+    }
 
-    return None, time.time() - start_time, None
-
-# Render maze solution and save as image
 def render_solution_to_image(maze, path, filename="solution.png"):
-    pygame.init()
-    surface = pygame.Surface(((CELL_SIZE + MARGIN) * COLS, (CELL_SIZE + MARGIN) * ROWS))
-
-    for r in range(ROWS):
-        for c in range(COLS):
-            color = WHITE
-            if maze[r][c] == 1:
-                color = BLACK
-            elif maze[r][c] == 2:
-                color = GREEN
-            elif maze[r][c] == 3:
-                color = RED
-            rect = pygame.Rect(
-                c * (CELL_SIZE + MARGIN),
-                r * (CELL_SIZE + MARGIN),
-                CELL_SIZE,
-                CELL_SIZE
-            )
-            pygame.draw.rect(surface, color, rect)
-
-    if path:
-        for r, c in path:
-            if (r, c) != start and (r, c) not in ends:
-                rect = pygame.Rect(
-                    c * (CELL_SIZE + MARGIN),
-                    r * (CELL_SIZE + MARGIN),
-                    CELL_SIZE,
-                    CELL_SIZE
-                )
-                pygame.draw.rect(surface, BLUE, rect)
-
-    pygame.image.save(surface, filename)
-    pygame.quit()
+    """Render the maze with the solution path highlighted."""
+    save_maze_image(maze, filename, path)
 
 def main():
     """Main function to run Dijkstra algorithm."""
-    global maze, ROWS, COLS, start, ends
+    args = parse_solver_args("Solve a maze with Dijkstra's algorithm.")
+    if args.json:
+        sys.exit(run_json(args))
 
     # Load maze
-    maze_file = sys.argv[1] if len(sys.argv) > 1 else "manual_maze.txt"
-    maze = load_maze_from_file(maze_file)
-
-    ROWS, COLS = len(maze), len(maze[0])
+    maze = load_maze_from_file(args.maze_file)
 
     # Find start and ends
     start, ends = find_start_end_positions(maze)
@@ -105,7 +133,8 @@ def main():
         raise ValueError("Start or End point not defined in the maze.")
 
     # Solve and render
-    path, time_taken, reached_end = dijkstra(maze, start, ends)
+    deadline = make_deadline(args) or Deadline(ALGORITHM_CONFIG['TIMEOUT_SECONDS'])
+    path, stats = dijkstra(maze, start, ends, deadline=deadline)
 
     # Always save maze image first
     render_maze_to_image(maze, "maze.png")
@@ -116,37 +145,56 @@ def main():
     # Print results with clear success/failure indication
     if path:
         print(f"Dijkstra Path found! Length: {len(path)}")
+        print(f"Path cost: {stats['final_path_cost']}")
         print(f"SUCCESS: Path successfully found using Dijkstra algorithm")
     else:
         print("Dijkstra No path found")
         print("FAILURE: No path exists between start and end points")
 
-    print(f"Time taken: {time_taken:.3f} seconds")
+    print(f"Nodes explored: {stats['nodes_explored']}")
+    print(f"Time taken: {stats['execution_time']:.3f} seconds")
+
+    if stats.get('timeout'):
+        print("Algorithm timed out")
+        print("FAILURE: Algorithm exceeded time limit")
+
+def run_json(args):
+    """Solve the maze headless and write a single JSON result document; returns the exit code."""
+    timings = {}
+    started = time.perf_counter()
+    try:
+        maze = load_maze_from_file(args.maze_file)
+        start, ends = find_start_end_positions(maze)
+        if not start or not ends:
+            raise ValueError("Start or End point not defined in the maze.")
+        timings['load'] = time.perf_counter() - started
+
+        phase = time.perf_counter()
+        deadline = make_deadline(args) or Deadline(ALGORITHM_CONFIG['TIMEOUT_SECONDS'])
+        path, stats = dijkstra(maze, start, ends, deadline=deadline)
+        timings['solve'] = time.perf_counter() - phase
+        stats.setdefault('status', 'found' if path is not None else 'no_path')
+        stats['success'] = path is not None
+        stats['path_length'] = len(path) if path else 0
+        stats['path_cost'] = path_cost(maze, path)
+
+        if args.images:
+            phase = time.perf_counter()
+            render_maze_to_image(maze, "maze.png")
+            render_solution_to_image(maze, path)
+            timings['images'] = time.perf_counter() - phase
+
+        result = build_result('dijkstra', args.maze_file, path, stats, timings)
+    except Exception as e:
+        result = build_result('dijkstra', args.maze_file, timings=timings, error=str(e) or type(e).__name__)
+
+    timings['total'] = time.perf_counter() - started
+    write_json_result(result)
+    return 0 if result['error'] is None else 1
 
 def render_maze_to_image(maze, filename="maze.png"):
     """Render just the maze without solution."""
-    pygame.init()
-    surface = pygame.Surface(((CELL_SIZE + MARGIN) * COLS, (CELL_SIZE + MARGIN) * ROWS))
-
-    for r in range(ROWS):
-        for c in range(COLS):
-            color = WHITE
-            if maze[r][c] == 1:
-                color = BLACK
-            elif maze[r][c] == 2:
-                color = GREEN
-            elif maze[r][c] == 3:
-                color = RED
-            rect = pygame.Rect(
-                c * (CELL_SIZE + MARGIN),
-                r * (CELL_SIZE + MARGIN),
-                CELL_SIZE,
-                CELL_SIZE
-            )
-            pygame.draw.rect(surface, color, rect)
-
-    pygame.image.save(surface, filename)
-    pygame.quit()
+    save_maze_image(maze, filename)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,247 @@
+"""
+Server-sent event stream of a solver's exploration for live web animation.
+
+The solver runs in a background thread with an ExplorationTracer attached,
+which records every expanded cell and every cell added to the frontier. The
+stream drains that log at the client's frame rate, sending each frame as a
+delta (cells expanded and cells newly added to the frontier) rather than the
+full frontier.
+
+No frame carries more cells than the client's max_events_per_second allows.
+Exploration that cannot be shown at that rate is decimated rather than
+replayed late:
+
+- The tracer buffers at most as many events as the stream could send in
+  STREAM_CONFIG['MAX_DURATION_SECONDS']. When full, it keeps every other
+  buffered event and from then on records every other one, so long searches
+  are sampled evenly and memory stays bounded.
+- Once the solver is done, each frame consumes enough of the backlog to finish
+  within the duration limit, and a frame holding more cells than its budget is
+  sampled down to the budget.
+"""
+import json
+import math
+import time
+import logging
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import STREAM_CONFIG, WORKER_CONFIG
+from deadline import Deadline
+from metrics import SOLVE_ERRORS, observe_solve
+from solver_engine import PreparedMaze, solve_grid
+from wire_format import encode_solution
+
+logger = logging.getLogger(__name__)
+
+EXPAND = 0
+DISCOVER = 1
+
+
+class ExplorationTracer:
+    """
+    Collects exploration events from a solver running in another thread.
+
+    Events are (kind, position, expansions so far) tuples, so the expansion count
+    stays exact when events are dropped.
+    """
+
+    def __init__(self, max_events: Optional[int] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            max_events: Events buffered before the buffer is thinned; None keeps every event
+        """
+        self.max_events = max_events
+        self.events: deque = deque()
+        self.expanded = 0
+        self.dropped = 0
+        # Only every stride-th event is recorded; doubles each time the buffer fills
+        self._stride = 1
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def expand(self, pos: Tuple[int, int]) -> None:
+        """Record that the solver expanded a cell."""
+        self.expanded += 1
+        self._record(EXPAND, pos)
+
+    def discover(self, pos: Tuple[int, int]) -> None:
+        """Record that the solver added a cell to its frontier."""
+        self._record(DISCOVER, pos)
+
+    def _record(self, kind: int, pos: Tuple[int, int]) -> None:
+        with self._lock:
+            self._seen += 1
+            if self._seen % self._stride:
+                self.dropped += 1
+                return
+            if self.max_events is not None and len(self.events) >= self.max_events:
+                kept = deque(islice(self.events, 0, None, 2))
+                self.dropped += len(self.events) - len(kept)
+                self.events = kept
+                self._stride *= 2
+            self.events.append((kind, pos, self.expanded))
+
+    def take(self, count: int) -> List[Tuple[int, Tuple[int, int], int]]:
+        """Remove and return up to count of the oldest buffered events."""
+        with self._lock:
+            return [self.events.popleft() for _ in range(min(count, len(self.events)))]
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered events not yet taken."""
+        return len(self.events)
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    Format one server-sent event.
+
+    Args:
+        event: Event name
+        data: JSON-serialisable payload
+
+    Returns:
+        SSE frame text
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _sample(cells: list, count: int) -> list:
+    """Pick count evenly spaced items of a list."""
+    return [cells[i * len(cells) // count] for i in range(count)]
+
+
+def _build_frame(events: list, expanded_seen: set, limit: int) -> Tuple[Dict[str, list], int]:
+    """
+    Turn a batch of raw events into a frame of expanded cells and frontier additions.
+
+    Args:
+        events: Events taken from the tracer
+        expanded_seen: Cells expanded in earlier frames, updated in place
+        limit: Most cells (expanded + frontier) the frame may hold
+
+    Returns:
+        Tuple of (frame, number of cells sampled away to fit the limit)
+    """
+    expanded = []
+    frontier = []
+    for kind, pos, _ in events:
+        if kind == EXPAND:
+            if pos not in expanded_seen:
+                expanded_seen.add(pos)
+                expanded.append(pos)
+        else:
+            frontier.append(pos)
+    # Cells expanded within the same frame never need to be drawn as frontier
+    frontier = [pos for pos in dict.fromkeys(frontier) if pos not in expanded_seen]
+
+    total = len(expanded) + len(frontier)
+    if total > limit:
+        # Keep both kinds in proportion, evenly spread over the batch
+        kept_expanded = len(expanded) * limit // total
+        expanded = _sample(expanded, kept_expanded)
+        frontier = _sample(frontier, limit - kept_expanded)
+    return {
+        'expanded': [list(pos) for pos in expanded],
+        'frontier': [list(pos) for pos in frontier]
+    }, max(0, total - limit)
+
+
+def stream_exploration(maze: PreparedMaze, algorithm: str, fps: Optional[float] = None,
+                       max_events_per_second: Optional[int] = None) -> Iterator[str]:
+    """
+    Solve a maze and yield its exploration as server-sent events.
+
+    Emits 'frame' events ({expanded, frontier, nodes_explored}), then one
+    'result' event with the path, explored cells and stats (or 'error'), then
+    'done' with the number of frames and of events decimated away to keep to
+    the rate.
+
+    Args:
+        maze: Validated maze
+        algorithm: Algorithm name
+        fps: Frames per second to send
+        max_events_per_second: Maximum cells (expanded + frontier) sent per second
+
+    Returns:
+        Iterator of SSE frame strings
+    """
+    fps = min(max(float(fps or STREAM_CONFIG['DEFAULT_FPS']), 1.0), STREAM_CONFIG['MAX_FPS'])
+    rate = min(max(int(max_events_per_second or STREAM_CONFIG['DEFAULT_MAX_EVENTS_PER_SECOND']), 1),
+               STREAM_CONFIG['MAX_EVENTS_PER_SECOND'])
+    frame_budget = max(1, math.ceil(rate / fps))
+    interval = 1.0 / fps
+
+    # More events than this cannot be sent at the client's rate within the duration limit
+    tracer = ExplorationTracer(rate * STREAM_CONFIG['MAX_DURATION_SECONDS'])
+    solve_deadline = Deadline(WORKER_CONFIG['SOLVE_TIMEOUT_SECONDS'])
+    outcome: Dict[str, Any] = {}
+
+    def solve() -> None:
+        try:
+            outcome['result'] = solve_grid(maze, algorithm, collect_explored=True, tracer=tracer,
+                                           deadline=solve_deadline)
+        except Exception as e:
+            outcome['error'] = e
+
+    solver_thread = threading.Thread(target=solve, name="exploration-stream", daemon=True)
+    solver_thread.start()
+
+    stream_end = time.monotonic() + STREAM_CONFIG['MAX_DURATION_SECONDS']
+    expanded_seen = set()
+    frames = 0
+    sampled_away = 0
+    try:
+        yield format_sse('start', {
+            'algorithm': algorithm,
+            'rows': maze.rows,
+            'cols': maze.cols,
+            'fps': fps,
+            'max_events_per_second': rate
+        })
+
+        next_frame = time.monotonic()
+        while True:
+            finished = not solver_thread.is_alive()
+            consume = frame_budget
+            if finished:
+                # Once the backlog size is known, consume it fast enough to finish within the
+                # duration limit; frames still hold at most frame_budget cells
+                frames_left = max(1, int((stream_end - time.monotonic()) * fps))
+                consume = max(consume, math.ceil(tracer.pending / frames_left))
+
+            batch = tracer.take(consume)
+            if batch:
+                frame, dropped = _build_frame(batch, expanded_seen, frame_budget)
+                frame['nodes_explored'] = batch[-1][2]
+                sampled_away += dropped
+                frames += 1
+                yield format_sse('frame', frame)
+            elif finished:
+                break
+
+            next_frame += interval
+            time.sleep(max(0.0, next_frame - time.monotonic()))
+
+        if 'error' in outcome:
+            SOLVE_ERRORS.inc(algorithm=algorithm)
+            yield format_sse('error', {'error': str(outcome['error'])})
+        else:
+            result = outcome['result']
+            observe_solve(algorithm, maze.rows, maze.cols, result.stats)
+            yield format_sse('result', {
+                'path_found': result.path_found,
+                'status': result.status,
+                # Same fields as a /solve response with path_encoding 'rle', so clients can stream instead
+                **encode_solution(maze.start, result.path, result.explored, maze.rows, maze.cols, 'rle'),
+                'stats': result.stats
+            })
+        yield format_sse('done', {'frames': frames, 'dropped_events': tracer.dropped + sampled_away})
+    finally:
+        # Stop the solver if the client disconnected mid-stream
+        solve_deadline.cancel()
@@ -0,0 +1,156 @@
+"""
+Goal-rooted shortest-path trees for repeated solves of the same maze.
+
+A GoalTree is one multi-source breadth-first search from all end points of a
+maze. It records every reachable cell's distance to the nearest end and the
+direction of its next step towards that end, so a path from any start is
+read off by following those directions, in O(path length), without searching
+again. Trees are cached under a hash of the wall layout and end points: moving
+the start reuses the cached tree, while changing any wall or end gives a new
+key, so a stale tree is never served and simply ages out of the LRU.
+"""
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from config import GOAL_TREE_CONFIG
+from deadline import Deadline
+from grid import Grid, WALL, layout_key
+from search_state import NO_PARENT, UNREACHED
+from sized_cache import SizedLRUCache
+
+logger = logging.getLogger(__name__)
+
+Position = Tuple[int, int]
+
+
+class GoalTree:
+    """Distance to the nearest end and next-step direction for every cell of a grid."""
+
+    def __init__(self, grid: Grid, deadline: Optional[Deadline] = None):
+        """
+        Build the tree with a level-at-a-time BFS outwards from every end point.
+
+        Args:
+            grid: Grid with its end points located
+            deadline: Deadline/cancellation token checked once per level
+
+        The build stops early if the deadline passes; check `complete` before reusing the tree.
+        """
+        self.grid = grid
+        self.distance = np.full(grid.size, UNREACHED, dtype=np.int32)
+        # Direction code (1 + index into grid.offsets) of the step towards the nearest end
+        self.next_step = bytearray(grid.size)
+        next_step = np.frombuffer(self.next_step, dtype=np.uint8)
+        self.complete = False
+        self.cells_reached = 0
+
+        ends = np.array(grid.ends, dtype=np.intp)
+        unseen = grid.cells.reshape(-1) != WALL
+        unseen[ends] = False
+        self.distance[ends] = 0
+        frontier = ends
+        level = 0
+
+        while frontier.size:
+            self.cells_reached += int(frontier.size)
+            level += 1
+            reached = []
+            for index, offset in enumerate(grid.offsets):
+                neighbors = frontier + offset
+                neighbors = neighbors[unseen[neighbors]]
+                if not neighbors.size:
+                    continue
+                unseen[neighbors] = False
+                self.distance[neighbors] = level
+                # Offsets come in opposite pairs (up/down, left/right), so index ^ 1 steps back
+                next_step[neighbors] = (index ^ 1) + 1
+                reached.append(neighbors)
+            frontier = np.concatenate(reached) if reached else frontier[:0]
+
+            if deadline is not None and deadline.expired():
+                return
+        self.complete = True
+
+    def path_from(self, start: Position) -> Optional[List[Position]]:
+        """
+        Follow next-step directions from a start to the nearest end.
+
+        Args:
+            start: Start position
+
+        Returns:
+            Positions from the first step after the start to the end, or None if no end is reachable
+        """
+        grid = self.grid
+        cell = grid.cell_id(*start)
+        if self.distance[cell] == UNREACHED:
+            return None
+
+        next_step = self.next_step
+        offsets = grid.offsets
+        path = []
+        step = next_step[cell]
+        while step != NO_PARENT:
+            cell += offsets[step - 1]
+            path.append(cell)
+            step = next_step[cell]
+        return grid.positions(path)
+
+    def reached_positions(self) -> List[Position]:
+        """Every position the tree reaches, i.e. every position with a path to an end."""
+        return self.grid.positions(np.flatnonzero(self.distance != UNREACHED).tolist())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the distance field, direction map and the grid they index."""
+        return self.distance.nbytes + len(self.next_step) + self.grid.nbytes
+
+
+class GoalTreeCache(SizedLRUCache):
+    """Thread-safe LRU cache of goal trees keyed by wall layout and ends, bounded by total size."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for all trees together
+        """
+        super().__init__(max_bytes or GOAL_TREE_CONFIG['MAX_BYTES'])
+
+    def tree_for(self, grid: Grid, deadline: Optional[Deadline] = None) -> Tuple[GoalTree, bool]:
+        """
+        Get the cached tree for a grid's walls and ends, building it on a miss.
+
+        Args:
+            grid: Grid with its end points located
+            deadline: Deadline/cancellation token for building the tree
+
+        Returns:
+            Tuple of (tree, whether it came from the cache); incomplete trees are not cached
+        """
+        key = layout_key(grid, ends=True)
+        tree = self.get(key)
+        if tree is not None:
+            return tree, True
+
+        tree = GoalTree(grid, deadline)
+        if tree.complete:
+            self.put(key, tree)
+        return tree, False
+
+
+_cache: Optional[GoalTreeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_goal_tree_cache() -> GoalTreeCache:
+    """Get the process-wide goal tree cache; each solver worker process has its own."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GoalTreeCache()
+        return _cache
@@ -0,0 +1,173 @@
+"""
+Compact maze grid shared by the solvers.
+
+Cells are stored once, one byte each, in a contiguous buffer padded with a
+border of walls. Every cell has a flat integer id, and its neighbours are
+`cell + offset` for four precomputed offsets, so neighbour lookups never need
+a bounds check. The buffer is exposed both as a bytearray for fast scalar
+access from Python loops and as a NumPy array view for vectorised work.
+A second byte per cell holds the cost of entering it: 1 for ordinary cells
+and the TERRAIN_CONFIG cost for terrain cells such as mud or water.
+"""
+import hashlib
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from config import TERRAIN_CONFIG
+from utils import MazeError
+
+# Cell values used in maze files and grids
+OPEN = 0
+WALL = 1
+START = 2
+END = 3
+
+Position = Tuple[int, int]
+
+# Cost of entering a cell, by cell value
+COST_TABLE = np.ones(256, dtype=np.uint8)
+for _value, _terrain in TERRAIN_CONFIG.items():
+    COST_TABLE[_value] = _terrain['cost']
+
+
+def path_cost(maze: Sequence[Sequence[int]], path: Optional[List[Position]]) -> int:
+    """
+    Total cost of walking a path.
+
+    Args:
+        maze: 2D list of cell values
+        path: Positions after the start, as returned by the solvers
+
+    Returns:
+        Sum of the entry costs of the path cells (the path length on mazes without terrain)
+    """
+    return sum(int(COST_TABLE[maze[row][col]]) for row, col in path) if path else 0
+
+
+class Grid:
+    """Wall-padded uint8 maze grid addressed by flat cell ids."""
+
+    def __init__(self, maze: Union[Sequence[Sequence[int]], np.ndarray],
+                 start: Optional[Position] = None, ends: Optional[List[Position]] = None):
+        """
+        Build a grid from a maze.
+
+        Args:
+            maze: 2D list or array of cell values (0=path, 1=wall, 2=start, 3=end)
+            start: Start position, if already known
+            ends: End positions, if already known
+
+        Raises:
+            MazeError: If the maze is not a non-empty rectangle of cell values 0-255
+        """
+        try:
+            values = np.asarray(maze)
+            if values.ndim != 2 or values.size == 0:
+                raise ValueError("expected a non-empty rectangular grid")
+            if values.min() < 0 or values.max() > 255:
+                raise ValueError("cell values must be between 0 and 255")
+        except (ValueError, TypeError) as e:
+            raise MazeError(f"Invalid maze grid: {e}")
+
+        self.rows, self.cols = values.shape
+        # Row stride of the padded buffer
+        self.width = self.cols + 2
+        self.size = (self.rows + 2) * self.width
+
+        self.flat = bytearray(b'\x01' * self.size)
+        self.cells = np.frombuffer(self.flat, dtype=np.uint8).reshape(self.rows + 2, self.width)
+        self.cells[1:-1, 1:-1] = values
+
+        # Up, down, left, right: the same order as utils.get_neighbors
+        self.offsets = (-self.width, self.width, -1, 1)
+
+        if start is None or not ends:
+            start_ids = np.flatnonzero(self.cells.reshape(-1) == START)
+            end_ids = np.flatnonzero(self.cells.reshape(-1) == END)
+            self.start = int(start_ids[-1]) if len(start_ids) else None
+            self.ends = [int(cell) for cell in end_ids]
+        else:
+            self.start = self.cell_id(*start)
+            self.ends = [self.cell_id(*end) for end in ends]
+
+        self.goal_mask = bytearray(self.size)
+        for cell in self.ends:
+            self.goal_mask[cell] = 1
+
+        # Cost of entering each cell; weighted if any cell costs more than a plain step
+        self.costs = bytearray(COST_TABLE[self.cells].tobytes())
+        self.weighted = bool(COST_TABLE[self.values()].max() > 1)
+
+    @classmethod
+    def from_maze(cls, maze: Union['Grid', Sequence[Sequence[int]], np.ndarray],
+                  start: Optional[Position] = None, ends: Optional[List[Position]] = None) -> 'Grid':
+        """Return maze unchanged if it is already a Grid, otherwise build one."""
+        if isinstance(maze, Grid):
+            return maze
+        return cls(maze, start, ends)
+
+    def cell_id(self, row: int, col: int) -> int:
+        """Flat id of a position; rows and columns -1 and rows/cols are the wall border."""
+        return (row + 1) * self.width + col + 1
+
+    def position(self, cell: int) -> Position:
+        """(row, col) of a flat cell id."""
+        row, col = divmod(cell, self.width)
+        return row - 1, col - 1
+
+    def positions(self, cells) -> List[Position]:
+        """(row, col) of each cell id in an iterable."""
+        width = self.width
+        return [(cell // width - 1, cell % width - 1) for cell in cells]
+
+    def is_open(self, cell: int) -> bool:
+        """Whether a cell can be entered."""
+        return self.flat[cell] != WALL
+
+    def is_goal(self, cell: int) -> bool:
+        """Whether a cell is an end point."""
+        return self.goal_mask[cell] == 1
+
+    def neighbors(self, cell: int) -> List[int]:
+        """Ids of the open cells next to a cell, in up, down, left, right order."""
+        flat = self.flat
+        return [cell + offset for offset in self.offsets if flat[cell + offset] != WALL]
+
+    def values(self) -> np.ndarray:
+        """The maze without its border, as a (rows, cols) uint8 array view."""
+        return self.cells[1:-1, 1:-1]
+
+    def to_list(self) -> List[List[int]]:
+        """The maze as nested lists of cell values."""
+        return self.values().tolist()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the cell and cost buffers."""
+        return self.size + len(self.costs)
+
+
+def layout_key(grid: Grid, ends: bool = False, costs: bool = False) -> str:
+    """
+    Hash the layout of a maze, for caches of structures precomputed per maze.
+
+    The start is always left out, so moving it never invalidates a cached structure.
+
+    Args:
+        grid: Grid to hash
+        ends: Include the end points, for structures built from the ends
+        costs: Include the terrain costs, for structures that depend on them; grids
+            without terrain hash the same either way
+
+    Returns:
+        Hex digest of the maze shape and wall cells, plus the requested parts
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{grid.rows}x{grid.cols}:".encode())
+    digest.update(np.packbits(grid.values() == WALL).tobytes())
+    if ends:
+        digest.update(np.asarray(sorted(grid.ends), dtype=np.int64).tobytes())
+    if costs and grid.weighted:
+        digest.update(bytes(grid.costs))
+    return digest.hexdigest()
@@ -0,0 +1,109 @@
+"""
+Precomputed A* heuristic tables.
+
+Instead of measuring the distance from a cell to every end point each time a
+neighbour is relaxed, A* and JPS build one table per solve holding the
+heuristic of every cell, indexed by flat cell id, and look values up in O(1).
+
+- 'manhattan': Manhattan distance to the nearest end, computed for all cells
+  at once with a separable distance transform: per column the distance to the
+  nearest end in that column, then per row the lower envelope of
+  `column distance + horizontal offset`, both as NumPy running minima. This
+  is O(cells) no matter how many end points the maze has.
+- 'exact': true maze distance to the nearest end, taken from the goal tree
+  (see goal_tree) of the maze. Every step costs at least 1, so it stays
+  admissible and consistent on terrain, and on mazes without terrain A*
+  only expands cells on shortest paths.
+- 'auto': 'exact' when a goal tree for the maze's walls and ends is cached
+  already, i.e. the maze is being reused, 'manhattan' otherwise.
+
+ALGORITHM_CONFIG['HEURISTIC'] picks the kind.
+"""
+from array import array
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from config import ALGORITHM_CONFIG
+from deadline import Deadline
+from goal_tree import get_goal_tree_cache
+from grid import Grid, layout_key
+from search_state import UNREACHED
+from utils import AlgorithmError
+
+HEURISTICS = ('auto', 'manhattan', 'exact')
+
+
+def _nearest_along(distance: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Relax distances along one axis: min over k of distance[k] + |i - k|.
+
+    Args:
+        distance: 2D int64 array of distances, large where unknown
+        axis: Axis to spread the distances along
+
+    Returns:
+        New array of the relaxed distances
+    """
+    index = np.arange(distance.shape[axis], dtype=np.int64)
+    index = index[:, None] if axis == 0 else index[None, :]
+    # Ends before i: i + min(d[k] - k); ends after i: -i + min(d[k] + k), scanning backwards
+    forward = np.minimum.accumulate(distance - index, axis=axis) + index
+    backward = np.flip(np.minimum.accumulate(np.flip(distance + index, axis), axis=axis), axis) - index
+    return np.minimum(forward, backward)
+
+
+def manhattan_table(grid: Grid, targets: Optional[List[int]] = None) -> np.ndarray:
+    """
+    Manhattan distance from every cell to the nearest end (or target).
+
+    Args:
+        grid: Grid with its end points located
+        targets: Cell ids to measure to instead of the ends
+
+    Returns:
+        int32 array indexed by flat cell id; UNREACHED everywhere if there are no targets
+    """
+    targets = grid.ends if targets is None else targets
+    if not targets:
+        return np.full(grid.size, UNREACHED, dtype=np.int32)
+
+    shape = grid.cells.shape
+    # Larger than any distance, small enough not to overflow when offsets are added
+    distance = np.full(shape, grid.size, dtype=np.int64)
+    distance.reshape(-1)[targets] = 0
+    distance = _nearest_along(_nearest_along(distance, 0), 1)
+    return distance.reshape(-1).astype(np.int32)
+
+
+def heuristic_table(grid: Grid, kind: Optional[str] = None,
+                    deadline: Optional[Deadline] = None) -> Tuple[array, str]:
+    """
+    Build the heuristic of every cell of a grid.
+
+    Args:
+        grid: Grid with its end points located
+        kind: One of HEURISTICS, or None for ALGORITHM_CONFIG['HEURISTIC']
+        deadline: Deadline/cancellation token for building a goal tree
+
+    Returns:
+        Tuple of (array('i') indexed by cell id, kind actually used: 'manhattan' or 'exact').
+        Exact tables hold UNREACHED on cells that cannot reach an end.
+
+    Raises:
+        AlgorithmError: If the kind is unknown
+    """
+    kind = str(kind or ALGORITHM_CONFIG['HEURISTIC']).lower()
+    if kind not in HEURISTICS:
+        raise AlgorithmError(f"Invalid heuristic '{kind}'. Supported: {', '.join(HEURISTICS)}")
+
+    if grid.ends and kind != 'manhattan':
+        cache = get_goal_tree_cache()
+        if kind == 'exact':
+            tree, _ = cache.tree_for(grid, deadline)
+        else:
+            tree = cache.peek(layout_key(grid, ends=True))
+        if tree is not None and tree.complete:
+            return array('i', tree.distance.tobytes()), 'exact'
+
+    return array('i', manhattan_table(grid).tobytes()), 'manhattan'
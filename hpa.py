@@ -0,0 +1,699 @@
+"""
+Hierarchical pathfinding (HPA*) for large grids.
+
+The grid is cut into square clusters of HPA_CONFIG['CLUSTER_SIZE'] cells a
+side. Preprocessing builds an abstract graph over it:
+
+- Entrances: along each border between two clusters, every run of cells that
+  are open on both sides gets one entrance pair in its middle, or one at each
+  end when the run is long. The two cells of a pair are abstract nodes joined
+  by a one-step edge.
+- Intra-cluster edges: the cost between every two entrance cells of a
+  cluster, found with a search that never leaves the cluster.
+
+A query connects the start to the entrances of its cluster, and the entrances
+of each end's cluster to the ends, with searches limited to those clusters,
+then runs A* over the abstract graph. Only the clusters on the abstract route
+are searched again at cell level to refine it into a path.
+
+The abstract graph depends on the walls and terrain costs but not on the start
+or ends, so it is cached per layout (see grid.layout_key) and re-solves of a
+maze only pay for the query. Paths are near-optimal rather than optimal:
+they cross cluster borders only at entrances. Stats report the path cost
+against a lower bound on the optimum: the exact distance when the maze's goal
+tree is cached, otherwise a search of the abstract graph with optimistic
+costs. A path can cross a border anywhere along an opening, not just at its
+entrance, so each edge there is cut by how far the cells an entrance stands
+for are from it (see AbstractGraph.lower_bound).
+"""
+import heapq
+import logging
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from algorithm_base import PathfindingAlgorithm
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from config import HPA_CONFIG
+from deadline import Deadline
+from grid import Grid, WALL, COST_TABLE, layout_key
+from sized_cache import SizedLRUCache
+from search_state import UNREACHED
+from heuristic import heuristic_table
+
+logger = logging.getLogger(__name__)
+
+# First row, end row, first column, end column of a cluster in padded grid coordinates (ends exclusive)
+Bounds = Tuple[int, int, int, int]
+
+# Border openings shorter than this get a single entrance in the middle, longer ones one at each end
+LONG_ENTRANCE = 6
+# Cells searched at once while building intra-cluster edges (bounds the temporary arrays)
+SEARCH_CHUNK_CELLS = 1 << 23
+# Abstract node numbers of the query's start and goal; entrance nodes are numbered from 0
+START_NODE = -1
+GOAL_NODE = -2
+
+
+def cluster_search(grid: Grid, sources: Dict[int, int], bounds: Bounds, reverse: bool = False,
+                   target: Optional[int] = None, visited: Optional[bytearray] = None,
+                   tracer=None) -> Tuple[Dict[int, int], Dict[int, int], int]:
+    """
+    Dijkstra search that never leaves one cluster.
+
+    Args:
+        grid: Grid being searched
+        sources: Cell id -> starting cost of each source cell
+        bounds: Cluster the search is confined to
+        reverse: Search towards the sources instead of away from them, i.e. pay
+            the cost of the cell being left rather than the cell being entered
+        target: Cell id to stop at, or None to settle the whole reachable cluster
+        visited: Flags to set on every settled cell, for drawing the explored cells
+        tracer: Optional exploration tracer told about every settled and newly reached cell
+
+    Returns:
+        Tuple of (cost of each reached cell, previous cell of each reached
+        non-source cell, number of cells settled)
+    """
+    flat, costs, width, offsets = grid.flat, grid.costs, grid.width, grid.offsets
+    first_row, end_row, first_col, end_col = bounds
+    distance = dict(sources)
+    previous: Dict[int, int] = {}
+    heap = [(cost, cell) for cell, cost in sources.items()]
+    heapq.heapify(heap)
+    settled = 0
+
+    while heap:
+        cost, cell = heapq.heappop(heap)
+        if cost > distance[cell]:
+            continue  # Stale duplicate
+        settled += 1
+        if visited is not None:
+            visited[cell] = 1
+        if tracer:
+            tracer.expand(grid.position(cell))
+        if cell == target:
+            break
+
+        leave_cost = costs[cell] if reverse else 0
+        for offset in offsets:
+            neighbor = cell + offset
+            if flat[neighbor] == WALL:
+                continue
+            row, col = divmod(neighbor, width)
+            if not (first_row <= row < end_row and first_col <= col < end_col):
+                continue
+            new_cost = cost + (leave_cost or costs[neighbor])
+            if new_cost < distance.get(neighbor, UNREACHED):
+                if tracer and neighbor not in distance:
+                    tracer.discover(grid.position(neighbor))
+                distance[neighbor] = new_cost
+                previous[neighbor] = cell
+                heapq.heappush(heap, (new_cost, neighbor))
+    return distance, previous, settled
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """(first, end) index pairs of the runs of True in a 1D mask, ends exclusive."""
+    changes = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return list(zip(changes[::2].tolist(), changes[1::2].tolist()))
+
+
+class AbstractGraph:
+    """Entrances between grid clusters and the costs between them, stored as flat arrays."""
+
+    def __init__(self, grid: Grid, cluster_size: Optional[int] = None, deadline: Optional[Deadline] = None):
+        """
+        Build the abstract graph of a grid.
+
+        Args:
+            grid: Grid to partition
+            cluster_size: Cluster side in cells, or None for HPA_CONFIG['CLUSTER_SIZE']
+            deadline: Deadline/cancellation token checked once per search level
+
+        The build stops early if the deadline passes; check `complete` before using the graph.
+        """
+        self.cluster_size = max(2, int(cluster_size or HPA_CONFIG['CLUSTER_SIZE']))
+        self.rows, self.cols, self.width, self.size = grid.rows, grid.cols, grid.width, grid.size
+        self.cluster_rows = -(-self.rows // self.cluster_size)
+        self.cluster_cols = -(-self.cols // self.cluster_size)
+        self.complete = False
+        self.build_time = 0.0
+        build_start = time.perf_counter()
+
+        # Nodes are entrance cells, numbered in order of cluster index, then cell id
+        pairs, pair_slack, pair_entry = self._entrance_pairs(grid)
+        cells = np.unique(pairs)
+        node_keys = np.sort(self.cluster_index(cells) * self.size + cells)
+        self.node_cells = node_keys % self.size
+        self.node_clusters = node_keys // self.size
+        # Nodes of cluster q are cluster_offsets[q]:cluster_offsets[q + 1]
+        self.cluster_offsets = np.searchsorted(self.node_clusters, np.arange(self.cluster_rows * self.cluster_cols + 1))
+
+        # One step across the border each way, paying for the cell entered
+        first, second = np.searchsorted(node_keys, self.cluster_index(pairs) * self.size + pairs).T
+        grid_costs = np.frombuffer(grid.costs, dtype=np.uint8)
+        sources = [first, second]
+        targets = [second, first]
+        costs = [grid_costs[pairs[:, 1]], grid_costs[pairs[:, 0]]]
+        # Optimistic costs for lower_bound: crossings enter the cheapest cell an entrance stands for
+        bound_costs = [pair_entry[:, 1], pair_entry[:, 0]]
+        # Most walking along the border between a node and any cell it stands for
+        self.node_slack = np.zeros(len(self.node_cells), dtype=np.int32)
+        np.maximum.at(self.node_slack, first, pair_slack[:, 0])
+        np.maximum.at(self.node_slack, second, pair_slack[:, 1])
+
+        intra = self._intra_cluster_edges(grid, deadline)
+        if intra is None:
+            return
+        for edges, intra_edges in zip((sources, targets, costs), intra):
+            edges.append(intra_edges)
+        intra_sources, intra_targets, intra_costs = intra
+        bound_costs.append(np.maximum(
+            intra_costs - self.node_slack[intra_sources] - self.node_slack[intra_targets], 0))
+
+        # Edges of node n are edge_offsets[n]:edge_offsets[n + 1]
+        sources = np.concatenate(sources)
+        order = np.argsort(sources, kind='stable')
+        self.edge_targets = np.concatenate(targets)[order].astype(np.int32)
+        self.edge_costs = np.concatenate(costs)[order].astype(np.int32)
+        self.edge_bound_costs = np.concatenate(bound_costs)[order].astype(np.int32)
+        self.edge_offsets = np.searchsorted(sources[order], np.arange(len(self.node_cells) + 1))
+
+        self.build_time = time.perf_counter() - build_start
+        self.complete = True
+        logger.info(f"Built abstract graph of {len(self.node_cells)} entrances and {len(self.edge_targets)} "
+                    f"edges in {self.build_time:.3f}s")
+
+    def cluster_index(self, cells):
+        """Index of the cluster each cell id (an int or an array of them) lies in, row-major."""
+        rows, cols = cells // self.width, cells % self.width
+        return (rows - 1) // self.cluster_size * self.cluster_cols + (cols - 1) // self.cluster_size
+
+    def bounds(self, cluster: int) -> Bounds:
+        """Padded-coordinate bounds of a cluster."""
+        size = self.cluster_size
+        first_row = 1 + cluster // self.cluster_cols * size
+        first_col = 1 + cluster % self.cluster_cols * size
+        return first_row, min(first_row + size, self.rows + 1), first_col, min(first_col + size, self.cols + 1)
+
+    def nodes(self, cluster: int) -> range:
+        """Node numbers of a cluster's entrances."""
+        return range(int(self.cluster_offsets[cluster]), int(self.cluster_offsets[cluster + 1]))
+
+    def edges(self, node: int) -> List[Tuple[int, int]]:
+        """(node, cost) of every edge out of a node."""
+        first, end = self.edge_offsets[node], self.edge_offsets[node + 1]
+        return list(zip(self.edge_targets[first:end].tolist(), self.edge_costs[first:end].tolist()))
+
+    def lower_bound(self, start_costs: Dict[int, int], goal_costs: Dict[int, int], direct_cost: int,
+                    max_expanded: int) -> int:
+        """
+        Lower bound on the cost of the shortest path from a query's start to any end.
+
+        A path that leaves the start's cluster crosses each border somewhere in
+        an opening, which is at most the node's slack from the entrance standing
+        for that stretch. Cutting every cost in and out of a node by its slack,
+        and charging crossings the cheapest cell of the stretch, leaves a graph
+        whose shortest route costs no more than any such path. The search may
+        stop early: no route it has not finished costs less than its open list's
+        smallest cost, so that is a bound too.
+
+        Args:
+            start_costs: Cost from the start to each entrance of its cluster, within the cluster
+            goal_costs: Cost from each entrance of an end's cluster to the nearest end, within the cluster
+            direct_cost: Cost from the start to the nearest end without leaving its cluster, or UNREACHED
+            max_expanded: Nodes to expand before settling for the open list's smallest cost
+
+        Returns:
+            The bound, or UNREACHED if no route reaches an end
+        """
+        slack = self.node_slack
+        best = direct_cost
+        g_score = {node: max(cost - int(slack[node]), 0) for node, cost in start_costs.items()}
+        open_set = [(cost, node) for node, cost in g_score.items()]
+        heapq.heapify(open_set)
+        closed = set()
+
+        while open_set:
+            cost, node = heapq.heappop(open_set)
+            if cost >= best:
+                break
+            if node in closed:
+                continue
+            if len(closed) == max_expanded:
+                return cost
+            closed.add(node)
+            if node in goal_costs:
+                best = min(best, cost + max(goal_costs[node] - int(slack[node]), 0))
+            first, end = self.edge_offsets[node], self.edge_offsets[node + 1]
+            steps = self.edge_bound_costs[first:end].tolist()
+            for neighbor, step in zip(self.edge_targets[first:end].tolist(), steps):
+                if neighbor not in closed and cost + step < g_score.get(neighbor, UNREACHED):
+                    g_score[neighbor] = cost + step
+                    heapq.heappush(open_set, (cost + step, neighbor))
+        return best
+
+    def _entrance_pairs(self, grid: Grid) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every entrance, with the stretch of border it stands for.
+
+        Returns:
+            Tuple of (n, 2) arrays: (cell, cell on the other side) ids; for each side,
+            the most it costs to walk along the border between the entrance cell and
+            any cell of its stretch; and the cheapest cell of the stretch to enter
+        """
+        open_cells = grid.cells != WALL
+        pairs, stretches = [], []
+        for cluster in range(self.cluster_rows * self.cluster_cols):
+            first_row, end_row, first_col, end_col = self.bounds(cluster)
+            # Border with the cluster to the right: columns end_col - 1 and end_col
+            if end_col <= self.cols:
+                both = open_cells[first_row:end_row, end_col - 1] & open_cells[first_row:end_row, end_col]
+                corner = first_row * self.width + end_col - 1
+                for offset, first, end in self._entrance_offsets(both):
+                    pairs.append((corner + offset * self.width, 1))
+                    stretches.append((corner + first * self.width, end - first, self.width))
+            # Border with the cluster below: rows end_row - 1 and end_row
+            if end_row <= self.rows:
+                both = open_cells[end_row - 1, first_col:end_col] & open_cells[end_row, first_col:end_col]
+                corner = (end_row - 1) * self.width + first_col
+                for offset, first, end in self._entrance_offsets(both):
+                    pairs.append((corner + offset, self.width))
+                    stretches.append((corner + first, end - first, 1))
+        if not pairs:
+            empty = np.zeros((0, 2), dtype=np.int64)
+            return empty, empty, empty
+
+        cells, steps = np.array(pairs, dtype=np.int64).T
+        firsts, lengths, alongs = np.array(stretches, dtype=np.int64).T
+        # Every cell of every stretch, stretch after stretch, on the near side of the border
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        along = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+        near = np.repeat(firsts, lengths) + np.repeat(alongs, lengths) * along
+        cell_costs = np.frombuffer(grid.costs, dtype=np.uint8).astype(np.int64)
+        slack, entry = [], []
+        for side in (near, near + np.repeat(steps, lengths)):
+            side_costs = cell_costs[side]
+            cheapest = np.minimum.reduceat(side_costs, starts)
+            slack.append(np.add.reduceat(side_costs, starts) - cheapest)
+            entry.append(cheapest)
+        return np.stack((cells, cells + steps), axis=1), np.stack(slack, axis=1), np.stack(entry, axis=1)
+
+    @staticmethod
+    def _entrance_offsets(both_open: np.ndarray) -> List[Tuple[int, int, int]]:
+        """
+        Positions along a border that get an entrance, given where both sides are open.
+
+        Returns:
+            (entrance, first, end) of each entrance and the stretch of the opening it stands for
+        """
+        offsets = []
+        for first, end in _runs(both_open):
+            if end - first < LONG_ENTRANCE:
+                offsets.append((first + (end - first - 1) // 2, first, end))
+            else:
+                middle = first + (end - first) // 2
+                offsets.extend(((first, first, middle), (end - 1, middle, end)))
+        return offsets
+
+    def _intra_cluster_edges(self, grid: Grid,
+                             deadline: Optional[Deadline]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Costs between the entrances of each cluster.
+
+        Every entrance gets its own copy of its cluster, walled in so it cannot be
+        left, and all copies are searched together with NumPy: a Dijkstra that
+        settles a whole cost level per step, with one bucket of cells per
+        pending cost (Dial's algorithm over arrays).
+
+        Returns:
+            (source nodes, target nodes, costs) arrays, or None if the deadline passed
+        """
+        size = self.cluster_size
+        stride = size + 2
+        local_size = stride * stride
+        clusters = self.cluster_rows * self.cluster_cols
+        node_clusters = self.node_clusters
+
+        # Each cluster's cells in a (size + 2)^2 block ringed with walls, one row per cluster
+        inner = np.full((self.cluster_rows * size, self.cluster_cols * size), WALL, dtype=np.uint8)
+        inner[:self.rows, :self.cols] = grid.values()
+        blocks = np.full((clusters, stride, stride), WALL, dtype=np.uint8)
+        blocks[:, 1:-1, 1:-1] = inner.reshape(self.cluster_rows, size, self.cluster_cols, size) \
+            .swapaxes(1, 2).reshape(clusters, size, size)
+        blocks = blocks.reshape(clusters, local_size)
+        open_blocks = blocks != WALL
+        cost_blocks = COST_TABLE[blocks]
+
+        # Each node's cell within its block, and the node at each block cell
+        rows, cols = self.node_cells // self.width, self.node_cells % self.width
+        node_local = ((rows - 1) % size + 1) * stride + (cols - 1) % size + 1
+        node_at = np.full((clusters, local_size), -1, dtype=np.int64)
+        node_at[node_clusters, node_local] = np.arange(len(node_local))
+
+        sources, targets, costs = [], [], []
+        chunk = max(1, SEARCH_CHUNK_CELLS // local_size)
+        for first in range(0, len(node_local), chunk):
+            instances = np.arange(first, min(first + chunk, len(node_local)))
+            instance_clusters = node_clusters[instances]
+            open_cells = open_blocks[instance_clusters].reshape(-1)
+            cell_costs = cost_blocks[instance_clusters].reshape(-1)
+            seen = np.zeros(open_cells.size, dtype=bool)
+            # Scratch space for dropping duplicate cells from a level in O(n)
+            owner = np.zeros(open_cells.size, dtype=np.int32)
+            # Pending cells by the cost they are reached at; ids are instance * local_size + block cell
+            buckets = {0: [(instances - first) * local_size + node_local[instances]]}
+
+            while buckets:
+                distance = min(buckets)
+                frontier = np.concatenate(buckets.pop(distance))
+                frontier = frontier[~seen[frontier]]
+                if not frontier.size:
+                    continue
+                # Keep one copy of each cell: the last write of its position wins
+                positions = np.arange(frontier.size, dtype=np.int32)
+                owner[frontier] = positions
+                frontier = frontier[owner[frontier] == positions]
+                seen[frontier] = True
+
+                instance, cell = np.divmod(frontier, local_size)
+                target = node_at[instance_clusters[instance], cell]
+                hit = (target >= 0) & (target != instance + first)
+                if hit.any():
+                    sources.append(instance[hit] + first)
+                    targets.append(target[hit])
+                    costs.append(np.full(int(hit.sum()), distance, dtype=np.int64))
+
+                for offset in (-stride, stride, -1, 1):
+                    neighbors = frontier + offset
+                    neighbors = neighbors[open_cells[neighbors] & ~seen[neighbors]]
+                    if not neighbors.size:
+                        continue
+                    if not grid.weighted:
+                        buckets.setdefault(distance + 1, []).append(neighbors)
+                        continue
+                    step = cell_costs[neighbors]
+                    for cost in np.unique(step).tolist():
+                        buckets.setdefault(distance + cost, []).append(neighbors[step == cost])
+
+                if deadline is not None and deadline.expired():
+                    return None
+
+        if not sources:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(sources), np.concatenate(targets), np.concatenate(costs)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the node and edge arrays."""
+        arrays = (self.node_cells, self.node_clusters, self.cluster_offsets, self.node_slack,
+                  self.edge_offsets, self.edge_targets, self.edge_costs, self.edge_bound_costs)
+        return sum(array.nbytes for array in arrays)
+
+
+class AbstractGraphCache(SizedLRUCache):
+    """Thread-safe LRU cache of abstract graphs keyed by cost layout and cluster size, bounded by total size."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        super().__init__(max_bytes or HPA_CONFIG['MAX_BYTES'])
+
+    def graph_for(self, grid: Grid, cluster_size: Optional[int] = None,
+                  deadline: Optional[Deadline] = None) -> Tuple[AbstractGraph, bool]:
+        """
+        Get the cached abstract graph of a grid, building it on a miss.
+
+        Args:
+            grid: Grid to partition
+            cluster_size: Cluster side in cells, or None for HPA_CONFIG['CLUSTER_SIZE']
+            deadline: Deadline/cancellation token for building the graph
+
+        Returns:
+            Tuple of (graph, whether it came from the cache); incomplete graphs are not cached
+        """
+        cluster_size = int(cluster_size or HPA_CONFIG['CLUSTER_SIZE'])
+        key = f"{layout_key(grid, costs=True)}:{cluster_size}"
+        graph = self.get(key)
+        if graph is not None:
+            return graph, True
+
+        graph = AbstractGraph(grid, cluster_size, deadline)
+        if graph.complete:
+            self.put(key, graph)
+        return graph, False
+
+
+_cache: Optional[AbstractGraphCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_abstract_graph_cache() -> AbstractGraphCache:
+    """Get the process-wide abstract graph cache; each solver worker process has its own."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AbstractGraphCache()
+        return _cache
+
+
+def preprocess(maze, cluster_size: Optional[int] = None,
+               deadline: Optional[Deadline] = None) -> Tuple[AbstractGraph, bool]:
+    """
+    Build (or find) the abstract graph of a maze ahead of its first HPA* query.
+
+    Args:
+        maze: Grid, or 2D list/array of cell values
+        cluster_size: Cluster side in cells, or None for HPA_CONFIG['CLUSTER_SIZE']
+        deadline: Deadline/cancellation token for building the graph
+
+    Returns:
+        Tuple of (graph, whether it was already cached)
+    """
+    return get_abstract_graph_cache().graph_for(Grid.from_maze(maze), cluster_size, deadline)
+
+
+class HPAStarAlgorithm(PathfindingAlgorithm):
+    """Hierarchical A*: A* over cluster entrances, refined cluster by cluster."""
+
+    def __init__(self, maze_file: str, animate: bool = True):
+        super().__init__(maze_file, animate)
+        self.cluster_size = None  # Cluster side in cells, or None for HPA_CONFIG['CLUSTER_SIZE']
+        self.graph = None  # Abstract graph used by the last solve
+
+    def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+        """
+        Solve maze using hierarchical A*.
+
+        Returns:
+            Tuple of (path, statistics)
+        """
+        grid = self.grid
+        start = grid.start
+        state = self.state = self.new_state()
+        # Cells settled by the cluster-level searches, for drawing the explored cells
+        visited = state.visited
+
+        preprocess_start = time.perf_counter()
+        graph, cached = get_abstract_graph_cache().graph_for(grid, self.cluster_size, self.deadline)
+        self.graph = graph
+        graph_stats = {
+            'graph_cached': cached,
+            'preprocess_time': time.perf_counter() - preprocess_start,
+            'cluster_size': graph.cluster_size,
+            'abstract_nodes': len(graph.node_cells) if graph.complete else 0,
+            'abstract_edges': len(graph.edge_targets) if graph.complete else 0
+        }
+        if not graph.complete:
+            return None, {'nodes_explored': 0, **graph_stats, **self.deadline.stop_stats()}
+
+        query_start = time.perf_counter()
+        nodes_explored = 0
+
+        # Connect the start to the entrances of its cluster, and directly to any end in it
+        node_cells = graph.node_cells.tolist()
+        start_cluster = graph.cluster_index(start)
+        start_distance, start_previous, settled = cluster_search(
+            grid, {start: 0}, graph.bounds(start_cluster), visited=visited, tracer=self.tracer)
+        nodes_explored += settled
+        start_edges = [(node, start_distance[node_cells[node]])
+                       for node in graph.nodes(start_cluster) if node_cells[node] in start_distance]
+        direct_end = min((end for end in grid.ends if end in start_distance),
+                         key=start_distance.__getitem__, default=None)
+        if direct_end is not None:
+            start_edges.append((GOAL_NODE, start_distance[direct_end]))
+
+        # Connect the entrances of each end's cluster to the nearest end in that cluster
+        goal_cost: Dict[int, int] = {}
+        goal_previous: Dict[int, Dict[int, int]] = {}
+        end_clusters: Dict[int, List[int]] = {}
+        for end in grid.ends:
+            end_clusters.setdefault(graph.cluster_index(end), []).append(end)
+        for cluster, ends in end_clusters.items():
+            distance, previous, settled = cluster_search(
+                grid, {end: 0 for end in ends}, graph.bounds(cluster), reverse=True, visited=visited,
+                tracer=self.tracer)
+            nodes_explored += settled
+            for node in graph.nodes(cluster):
+                cell = node_cells[node]
+                if cell in distance:
+                    goal_cost[node] = distance[cell]
+                    goal_previous[node] = previous
+
+        # A* over the abstract graph. Edges cost what walking them costs, so the
+        # per-cell heuristic table (see heuristic) stays admissible and consistent
+        heuristic, heuristic_kind = heuristic_table(grid, deadline=self.deadline)
+        if heuristic[start] == UNREACHED:
+            # Exact distances show the start cannot reach an end
+            return None, {'nodes_explored': nodes_explored, 'abstract_expanded': 0, **graph_stats,
+                          'query_time': time.perf_counter() - query_start}
+        g_score = {START_NODE: 0}
+        previous_node: Dict[int, int] = {}
+        open_set = [(heuristic[start], START_NODE)]
+        closed = set()
+        abstract_expanded = 0
+
+        while open_set:
+            _, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == GOAL_NODE:
+                break
+            closed.add(node)
+            abstract_expanded += 1
+            if self.tracer and node != START_NODE:
+                self.tracer.expand(grid.position(node_cells[node]))
+
+            if node == START_NODE:
+                edges = start_edges
+            else:
+                edges = graph.edges(node)
+                if node in goal_cost:
+                    edges.append((GOAL_NODE, goal_cost[node]))
+            node_g = g_score[node]
+            for neighbor, cost in edges:
+                tentative_g = node_g + cost
+                if neighbor not in closed and tentative_g < g_score.get(neighbor, UNREACHED):
+                    if self.tracer and neighbor != GOAL_NODE and neighbor not in g_score:
+                        self.tracer.discover(grid.position(node_cells[neighbor]))
+                    g_score[neighbor] = tentative_g
+                    previous_node[neighbor] = node
+                    h = 0 if neighbor == GOAL_NODE else heuristic[node_cells[neighbor]]
+                    heapq.heappush(open_set, (tentative_g + h, neighbor))
+
+            if self.should_stop(abstract_expanded):
+                return None, {'nodes_explored': nodes_explored, 'abstract_expanded': abstract_expanded,
+                              **graph_stats, **self.deadline.stop_stats()}
+
+        if GOAL_NODE not in g_score:
+            # No path found
+            return None, {
+                'nodes_explored': nodes_explored,
+                'abstract_expanded': abstract_expanded,
+                **graph_stats,
+                'heuristic': heuristic_kind,
+                'query_time': time.perf_counter() - query_start
+            }
+
+        # Abstract route from the start to the goal, as entrance node numbers
+        route = []
+        node = previous_node[GOAL_NODE]
+        while node != START_NODE:
+            route.append(node)
+            node = previous_node[node]
+        route.reverse()
+
+        # Refine it into cells, searching again only inside the clusters it crosses
+        route_cells = [node_cells[node] for node in route]
+        route_clusters = graph.node_clusters[route].tolist()
+        cells = self._walk_back(start_previous, route_cells[0] if route else direct_end, start)
+        clusters_refined = 0
+        for index in range(1, len(route)):
+            cell, next_cell = route_cells[index - 1], route_cells[index]
+            cluster = route_clusters[index - 1]
+            if route_clusters[index] != cluster:
+                cells.append(next_cell)  # Step across a cluster border
+                continue
+            _, previous, settled = cluster_search(grid, {cell: 0}, graph.bounds(cluster),
+                                                  target=next_cell, visited=visited, tracer=self.tracer)
+            nodes_explored += settled
+            clusters_refined += 1
+            cells.extend(self._walk_back(previous, next_cell, cell))
+        if route:
+            cell = route_cells[-1]
+            previous = goal_previous[route[-1]]
+            while cell in previous:
+                cell = previous[cell]
+                cells.append(cell)
+
+        path = grid.positions(cells)
+        self.end = path[-1]
+        path_cost = g_score[GOAL_NODE]
+        lower_bound = heuristic[start]
+        if heuristic_kind != 'exact' or grid.weighted:
+            # The exact table counts steps, which is the optimal cost only without terrain
+            lower_bound = max(lower_bound, graph.lower_bound(
+                {node: cost for node, cost in start_edges if node != GOAL_NODE}, goal_cost,
+                start_distance[direct_end] if direct_end is not None else UNREACHED, abstract_expanded))
+        return path, {
+            'nodes_explored': nodes_explored,
+            'abstract_expanded': abstract_expanded,
+            'clusters_refined': clusters_refined,
+            **graph_stats,
+            'heuristic': heuristic_kind,
+            'query_time': time.perf_counter() - query_start,
+            'final_path_cost': path_cost,
+            # Never more than the optimal cost, so the path is within this factor of it
+            'lower_bound': lower_bound,
+            'optimality_bound': round(path_cost / lower_bound, 3) if lower_bound else 1.0,
+            'end_reached': self.end
+        }
+
+    @staticmethod
+    def _walk_back(previous: Dict[int, int], cell: int, origin: int) -> List[int]:
+        """Cell ids from just after origin to cell, following previous links back from cell."""
+        cells = []
+        while cell != origin:
+            cells.append(cell)
+            cell = previous[cell]
+        cells.reverse()
+        return cells
+
+
+def main():
+    """Main function to run hierarchical A*."""
+    args = parse_solver_args("Solve a maze with hierarchical A* (HPA*).")
+    if args.json:
+        sys.exit(run_algorithm_json(HPAStarAlgorithm, 'hpa', args))
+
+    try:
+        algorithm = HPAStarAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
+        path, stats = algorithm.run()
+
+        if path:
+            print(f"HPA* Path found! Length: {len(path)}")
+            print(f"Path cost: {stats['path_cost']} (at most {stats['optimality_bound']}x optimal)")
+            print(f"SUCCESS: Path successfully found using hierarchical A* algorithm")
+        else:
+            print("HPA* No path found")
+            print("FAILURE: No path exists between start and end points")
+
+        print(f"Nodes explored: {stats['nodes_explored']}")
+        print(f"Preprocessing time: {stats.get('preprocess_time', 0):.3f} seconds")
+        print(f"Query time: {stats.get('query_time', 0):.3f} seconds")
+        print(f"Time taken: {stats['execution_time']:.3f} seconds")
+
+        if stats.get('timeout'):
+            print("Algorithm timed out")
+            print("FAILURE: Algorithm exceeded time limit")
+
+    except Exception as e:
+        print(f"Error running HPA* algorithm: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Background solve jobs for the asynchronous /jobs API.
+
+Jobs wait in a bounded queue and are run by a small set of runner threads,
+either on the solver worker pool or in-process. Clients poll for status and
+progress and can cancel a job while it is queued or running.
+"""
+import time
+import uuid
+import queue
+import logging
+import threading
+from concurrent.futures import CancelledError
+from typing import Any, Dict, List, Optional
+
+from config import JOB_CONFIG, WORKER_CONFIG
+from deadline import Deadline
+from metrics import SOLVE_ERRORS, observe_solve
+from solver_engine import solve_grid
+from worker_pool import get_solver_pool
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue cannot accept more work."""
+    pass
+
+
+class JobCancelled(Exception):
+    """Raised inside an in-process solve when its job has been cancelled."""
+    pass
+
+
+class SolveJob:
+    """State of a single asynchronous solve."""
+
+    def __init__(self, maze: List[List[int]], algorithm: str):
+        self.job_id = uuid.uuid4().hex
+        self.maze = maze
+        self.algorithm = algorithm
+        self.status = 'queued'
+        self.progress: Dict[str, Any] = {}
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self.deadline = None
+        self.cancel_requested = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in ('completed', 'failed', 'cancelled')
+
+    def update_progress(self, progress: Dict[str, Any]) -> None:
+        """Record a progress update, aborting in-process solves that were cancelled."""
+        if self.cancel_requested:
+            raise JobCancelled()
+        self.progress.update(progress)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable view of the job."""
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'algorithm': self.algorithm,
+            'progress': dict(self.progress),
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'result': self.result.to_dict() if self.result else None,
+            'error': self.error
+        }
+
+
+class JobManager:
+    """Bounded queue of solve jobs processed by background runner threads."""
+
+    def __init__(self, max_queued: Optional[int] = None, runners: Optional[int] = None,
+                 result_ttl: Optional[float] = None):
+        """
+        Initialize the manager and start its runner threads.
+
+        Args:
+            max_queued: Maximum number of jobs waiting to run
+            runners: Number of jobs that may run at the same time
+            result_ttl: Seconds a finished job is kept for polling
+        """
+        self.queue = queue.Queue(maxsize=max_queued or JOB_CONFIG['MAX_QUEUED'])
+        self.result_ttl = result_ttl or JOB_CONFIG['RESULT_TTL_SECONDS']
+        self.jobs: Dict[str, SolveJob] = {}
+        self._lock = threading.Lock()
+
+        runner_count = runners or JOB_CONFIG['RUNNERS']
+        self._runners = [
+            threading.Thread(target=self._run, name=f"job-runner-{i}", daemon=True)
+            for i in range(runner_count)
+        ]
+        for runner in self._runners:
+            runner.start()
+
+    def submit(self, maze: List[List[int]], algorithm: str) -> SolveJob:
+        """
+        Queue a new solve job.
+
+        Args:
+            maze: Validated 2D maze grid
+            algorithm: Algorithm name
+
+        Returns:
+            The queued job
+
+        Raises:
+            JobQueueFull: If the queue is at capacity
+        """
+        self._prune()
+        job = SolveJob(maze, algorithm)
+        with self._lock:
+            try:
+                self.queue.put_nowait(job)
+            except queue.Full:
+                raise JobQueueFull(f"Job queue is full ({self.queue.maxsize} jobs waiting)")
+            self.jobs[job.job_id] = job
+        logger.info(f"Queued job {job.job_id} ({algorithm})")
+        return job
+
+    def get(self, job_id: str) -> Optional[SolveJob]:
+        """Get a job by id."""
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[SolveJob]:
+        """
+        Cancel a queued or running job; finished jobs are forgotten instead.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The job, or None if it does not exist
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if job.finished:
+                del self.jobs[job_id]
+                return job
+
+            job.cancel_requested = True
+            if job.status == 'queued':
+                self._finish(job, 'cancelled')
+            elif job.future is not None:
+                get_solver_pool().cancel(job.future)
+            elif job.deadline is not None:
+                job.deadline.cancel()
+        logger.info(f"Cancellation requested for job {job_id}")
+        return job
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a runner."""
+        return self.queue.qsize()
+
+    def _finish(self, job: SolveJob, status: str, error: Optional[str] = None) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        job.maze = None
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the result TTL."""
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self.jobs.items()
+                       if job.finished and job.finished_at < cutoff]
+            for job_id in expired:
+                del self.jobs[job_id]
+
+    def _run(self) -> None:
+        """Runner loop: take queued jobs and solve them."""
+        while True:
+            job = self.queue.get()
+            with self._lock:
+                if job.cancel_requested:
+                    continue
+                job.status = 'running'
+                job.started_at = time.time()
+                if WORKER_CONFIG['ENABLED']:
+                    job.future = get_solver_pool().submit(
+                        job.maze, job.algorithm,
+                        timeout=JOB_CONFIG['TIMEOUT_SECONDS'],
+                        progress_callback=job.update_progress
+                    )
+                else:
+                    job.deadline = Deadline(JOB_CONFIG['TIMEOUT_SECONDS'])
+
+            try:
+                if job.future is not None:
+                    result = job.future.result()
+                else:
+                    result = solve_grid(job.maze, job.algorithm, progress_callback=job.update_progress,
+                                        deadline=job.deadline)
+            except (JobCancelled, CancelledError):
+                self._finish(job, 'cancelled')
+                logger.info(f"Job {job.job_id} cancelled")
+                continue
+            except Exception as e:
+                SOLVE_ERRORS.inc(algorithm=job.algorithm)
+                self._finish(job, 'failed', str(e) or type(e).__name__)
+                logger.error(f"Job {job.job_id} failed: {e}")
+                continue
+
+            if result.status == 'cancelled':
+                self._finish(job, 'cancelled')
+                logger.info(f"Job {job.job_id} cancelled")
+                continue
+
+            observe_solve(job.algorithm, len(job.maze), len(job.maze[0]), result.stats)
+            job.result = result
+            self._finish(job, 'completed')
+            logger.info(f"Job {job.job_id} completed: path_found={result.path_found}")
+
+
+_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Get the process-wide job manager, starting it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
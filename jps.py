@@ -0,0 +1,270 @@
+"""
+Jump Point Search for 4-connected uniform-cost grids.
+
+JPS is A* that skips over runs of cells with only one sensible continuation.
+From each expanded jump point it scans straight lines and only stops (adds a
+successor to the open set) at an end point or at a cell with a forced
+neighbour, i.e. an open side cell whose own straight approach is blocked.
+Moves are canonically vertical first: a vertical scan also stops wherever a
+horizontal scan from it would find a jump point, while a horizontal scan
+never turns on its own. Paths stay optimal, and open rooms take a handful of
+expansions instead of one per cell.
+
+Jumping assumes every step costs the same, so on mazes with terrain the
+search runs as plain A* instead.
+
+Straight scans are made cheap with stop tables precomputed with NumPy: for
+each scan direction, a byte per cell that is set on walls, end points and
+forced-neighbour cells. A horizontal scan is then a single bytearray.find()
+along the row.
+"""
+import sys
+import time
+from typing import List, Tuple, Optional, Dict
+
+import numpy as np
+
+from astar import AStarAlgorithm
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from grid import WALL
+from search_state import cell_flags, cell_values, NO_PARENT, UNREACHED
+from open_list import make_open_list
+from config import ALGORITHM_CONFIG
+
+
+def _stop_tables(grid) -> Tuple[bytearray, bytearray, bytearray, bytearray]:
+    """
+    Precompute where straight scans stop.
+
+    Args:
+        grid: Grid being searched
+
+    Returns:
+        Stop tables for scans moving (right, left, down, up), each a bytearray
+        indexed by cell id holding 1 on walls, ends and cells with a forced neighbour
+    """
+    open_cells = grid.cells != WALL
+    goals = np.frombuffer(grid.goal_mask, dtype=np.uint8).reshape(open_cells.shape).astype(bool)
+    rows, cols = grid.rows, grid.cols
+    inner = (slice(1, rows + 1), slice(1, cols + 1))
+
+    def shifted(dr: int, dc: int) -> np.ndarray:
+        """Open flags of the cell (dr, dc) away from each inner cell."""
+        return open_cells[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc]
+
+    up, down, left, right = shifted(-1, 0), shifted(1, 0), shifted(0, -1), shifted(0, 1)
+    forced = {
+        # Moving right, a side cell is forced when the cell behind it (to the left) is blocked
+        'right': (up & ~shifted(-1, -1)) | (down & ~shifted(1, -1)),
+        'left': (up & ~shifted(-1, 1)) | (down & ~shifted(1, 1)),
+        'down': (left & ~shifted(-1, -1)) | (right & ~shifted(-1, 1)),
+        'up': (left & ~shifted(1, -1)) | (right & ~shifted(1, 1)),
+    }
+
+    tables = []
+    for name in ('right', 'left', 'down', 'up'):
+        stop = ~open_cells | goals
+        stop[inner] |= forced[name]
+        tables.append(bytearray(stop.astype(np.uint8).tobytes()))
+    return tuple(tables)
+
+
+class JumpPointSearchAlgorithm(AStarAlgorithm):
+    """Jump Point Search: A* over jump points of a 4-connected grid."""
+
+    def __init__(self, maze_file: str, animate: bool = True):
+        super().__init__(maze_file, animate)
+        self.jump_parent = None  # Jump point each jump point was reached from, per cell id
+
+    def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+        """
+        Solve maze using Jump Point Search.
+
+        Returns:
+            Tuple of (path, statistics)
+        """
+        if self.grid.weighted:
+            # Skipping over cells would skip their terrain costs
+            self.jump_parent = None
+            path, stats = super().solve()
+            return path, {**stats, 'jump_points': 0, 'fallback': 'astar'}
+
+        grid = self.grid
+        flat = grid.flat
+        goal_mask = grid.goal_mask
+        start = grid.start
+        width = grid.width
+        state = self.state = self.new_state()
+        visited = state.visited
+        # Direction of the straight segment each jump point was entered by
+        parents = state.parents
+        g_score = self.g_score = cell_values(grid, self.compact_state)
+        open_flags = self.open_flags = cell_flags(grid, self.compact_state)
+        jump_parent = self.jump_parent = cell_values(grid, self.compact_state)
+        open_set = self.open_set = make_open_list(self.open_list_kind, grid, self.compact_state)
+        stop_right, stop_left, stop_down, stop_up = _stop_tables(grid)
+        heuristic_stats = self.build_heuristic()
+        h = self.heuristic_table
+        if h[start] == UNREACHED:
+            return None, {'nodes_explored': 0, 'jump_points': 0, 'max_frontier_size': 0,
+                          'open_list': open_set.name, **heuristic_stats}
+
+        def jump_horizontal(cell: int, step: int) -> Optional[int]:
+            """First jump point scanning from cell by step (+1/-1), or None at a wall."""
+            stop = stop_right.find(1, cell) if step > 0 else stop_left.rfind(1, 0, cell + 1)
+            return None if flat[stop] == WALL else stop
+
+        def jump_vertical(cell: int, step: int) -> Optional[int]:
+            """First jump point scanning from cell by step (+/-width), or None at a wall."""
+            stops = stop_down if step > 0 else stop_up
+            while not stops[cell]:
+                # Stop where a horizontal scan would turn off this column
+                if flat[stop_right.find(1, cell + 1)] != WALL or flat[stop_left.rfind(1, 0, cell)] != WALL:
+                    return cell
+                cell += step
+            return None if flat[cell] == WALL else cell
+
+        # (direction code, step, scan) per direction, in grid.offsets order
+        moves = [(direction, offset, jump_vertical if abs(offset) == width else jump_horizontal)
+                 for direction, offset in state.directions]
+        # Directions worth scanning after entering a cell in each direction: no reversing.
+        # The start has no parent direction and scans all four.
+        successors = {NO_PARENT: moves}
+        for direction, offset, _ in moves:
+            successors[direction] = [move for move in moves if move[1] != -offset]
+
+        g_score[start] = 0
+        open_set.push(h[start], start)
+        open_flags[start] = 1
+
+        nodes_explored = 0
+        jump_points = 1
+        max_frontier_size = 0
+
+        while open_set:
+            current_f, current = open_set.pop()
+            if visited[current]:
+                continue
+            open_flags[current] = 0
+
+            # Check if we reached any goal
+            if goal_mask[current]:
+                self.end = grid.position(current)
+                path = self.reconstruct_path()
+                return path, {
+                    'nodes_explored': nodes_explored,
+                    'jump_points': jump_points,
+                    'max_frontier_size': max_frontier_size,
+                    'open_list': open_set.name,
+                    **heuristic_stats,
+                    'final_path_cost': g_score[current],
+                    'end_reached': self.end
+                }
+
+            visited[current] = 1
+            nodes_explored += 1
+            self.report_progress(nodes_explored)
+            if self.tracer:
+                self.tracer.expand(grid.position(current))
+
+            if self.animate:
+                self.stats['nodes_explored'] = nodes_explored
+                self.draw_maze(current, set(open_set.cells()))
+                time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
+
+            current_g = g_score[current]
+            for direction, step, scan in successors[parents[current]]:
+                jump_point = scan(current + step, step)
+                if jump_point is None or visited[jump_point]:
+                    continue
+
+                tentative_g = current_g + abs(jump_point - current) // abs(step)
+                if tentative_g < g_score[jump_point]:
+                    if g_score[jump_point] == UNREACHED:
+                        jump_points += 1
+                    g_score[jump_point] = tentative_g
+                    parents[jump_point] = direction
+                    jump_parent[jump_point] = current
+                    # Queue it, or lower its f_score if it is already queued
+                    open_set.push(tentative_g + h[jump_point], jump_point)
+                    if not open_flags[jump_point]:
+                        open_flags[jump_point] = 1
+                        if self.tracer:
+                            self.tracer.discover(grid.position(jump_point))
+
+            max_frontier_size = max(max_frontier_size, len(open_set))
+
+            if self.should_stop(nodes_explored):
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'jump_points': jump_points,
+                    'max_frontier_size': max_frontier_size,
+                    'open_list': open_set.name,
+                    **heuristic_stats,
+                    **self.deadline.stop_stats()
+                }
+
+        # No path found
+        return None, {
+            'nodes_explored': nodes_explored,
+            'jump_points': jump_points,
+            'max_frontier_size': max_frontier_size,
+            'open_list': open_set.name,
+            **heuristic_stats
+        }
+
+    def reconstruct_path(self) -> List[Tuple[int, int]]:
+        """Reconstruct the path from start to end, filling in the cells between jump points."""
+        if self.jump_parent is None:
+            return super().reconstruct_path()  # Plain A* search on a weighted grid
+        grid = self.grid
+        start = grid.start
+        cell = grid.cell_id(*self.end)
+        if cell != start and self.jump_parent[cell] == UNREACHED:
+            return []
+
+        path = []
+        while cell != start:
+            step = grid.offsets[self.state.parents[cell] - 1]
+            previous = self.jump_parent[cell]
+            while cell != previous:
+                path.append(cell)
+                cell -= step
+        path.reverse()
+        return grid.positions(path)
+
+
+def main():
+    """Main function to run Jump Point Search."""
+    args = parse_solver_args("Solve a maze with Jump Point Search.")
+    if args.json:
+        sys.exit(run_algorithm_json(JumpPointSearchAlgorithm, 'jps', args))
+
+    try:
+        algorithm = JumpPointSearchAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
+        path, stats = algorithm.run()
+
+        if path:
+            print(f"JPS Path found! Length: {len(path)}")
+            print(f"SUCCESS: Path successfully found using Jump Point Search")
+        else:
+            print("JPS No path found")
+            print("FAILURE: No path exists between start and end points")
+
+        print(f"Nodes explored: {stats['nodes_explored']}")
+        print(f"Jump points: {stats.get('jump_points', 0)}")
+        print(f"Time taken: {stats['execution_time']:.3f} seconds")
+        print(f"Max frontier size: {stats.get('max_frontier_size', 0)}")
+
+        if stats.get('timeout'):
+            print("Algorithm timed out")
+            print("FAILURE: Algorithm exceeded time limit")
+
+    except Exception as e:
+        print(f"Error running JPS algorithm: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
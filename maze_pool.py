@@ -0,0 +1,140 @@
+"""
+Pool of pre-generated random mazes for /generate-random-mazes.
+
+A background producer thread keeps a bounded number of ready mazes for each
+maze size (bucket) and refills buckets at a limited rate, off the request
+path. Requests pop mazes from their bucket and only generate synchronously
+when it runs dry, which is counted as a miss.
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from config import MAZE_POOL_CONFIG
+from web_maze_generator import WebMazeGenerator, generated_size
+
+logger = logging.getLogger(__name__)
+
+
+class MazePool:
+    """Per-size buckets of ready random mazes, refilled by a producer thread."""
+
+    def __init__(self, size_per_bucket: Optional[int] = None, refill_per_second: Optional[float] = None,
+                 prewarm_sizes: Optional[Iterable[int]] = None):
+        """
+        Initialize the pool and start its producer thread.
+
+        Args:
+            size_per_bucket: Ready mazes kept for each maze size
+            refill_per_second: Maximum number of mazes the producer generates per second
+            prewarm_sizes: Maze sizes to fill straight away; other sizes are filled
+                once they are first requested
+        """
+        self.size_per_bucket = size_per_bucket or MAZE_POOL_CONFIG['SIZE_PER_BUCKET']
+        self.refill_per_second = refill_per_second or MAZE_POOL_CONFIG['REFILL_PER_SECOND']
+        self.buckets: Dict[int, deque] = {}
+        self.hits = 0
+        self.misses = 0
+        self._condition = threading.Condition()
+        self._stopped = False
+        # Numpy generators are not thread-safe, so the producer keeps its own per size
+        self._generators: Dict[int, WebMazeGenerator] = {}
+
+        sizes = MAZE_POOL_CONFIG['PREWARM_SIZES'] if prewarm_sizes is None else prewarm_sizes
+        for size in sizes:
+            self.buckets.setdefault(generated_size(size), deque())
+
+        self._producer = threading.Thread(target=self._produce, name="maze-pool-producer", daemon=True)
+        self._producer.start()
+
+    def take(self, size: int, count: int) -> List[List[List[int]]]:
+        """
+        Take ready mazes from the pool, generating any shortfall synchronously.
+
+        Args:
+            size: Requested maze size
+            count: Number of mazes
+
+        Returns:
+            List of mazes, each a 2D list (0=path, 1=wall)
+        """
+        size = generated_size(size)
+        with self._condition:
+            bucket = self.buckets.setdefault(size, deque())
+            mazes = [bucket.popleft() for _ in range(min(count, len(bucket)))]
+            self.hits += len(mazes)
+            self.misses += count - len(mazes)
+            self._condition.notify()
+
+        if len(mazes) < count:
+            logger.debug(f"Maze pool miss: generating {count - len(mazes)} {size}x{size} mazes in-request")
+            mazes.extend(WebMazeGenerator(size).generate_multiple_mazes(count - len(mazes)))
+        return mazes
+
+    def _next_bucket(self) -> Optional[int]:
+        """Size of the emptiest bucket that needs refilling, if any. Caller holds the lock."""
+        needy = [size for size, bucket in self.buckets.items() if len(bucket) < self.size_per_bucket]
+        return min(needy, key=lambda size: len(self.buckets[size])) if needy else None
+
+    def _produce(self) -> None:
+        """Producer loop: refill the emptiest bucket, one maze at a time, at the configured rate."""
+        interval = 1.0 / self.refill_per_second
+        while True:
+            with self._condition:
+                size = self._next_bucket()
+                while size is None and not self._stopped:
+                    self._condition.wait()
+                    size = self._next_bucket()
+                if self._stopped:
+                    return
+
+            generator = self._generators.get(size)
+            if generator is None:
+                generator = self._generators[size] = WebMazeGenerator(size)
+            try:
+                maze = generator.generate_single_maze()
+            except Exception as e:
+                logger.error(f"Maze pool producer failed for size {size}: {e}")
+                time.sleep(1.0)
+                continue
+
+            with self._condition:
+                bucket = self.buckets[size]
+                if len(bucket) < self.size_per_bucket:
+                    bucket.append(maze)
+            time.sleep(interval)
+
+    def stop(self) -> None:
+        """Stop the producer thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._producer.join(timeout=1.0)
+
+    def get_stats(self) -> Dict:
+        """Report hit/miss counters and the number of ready mazes per size."""
+        with self._condition:
+            requested = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / requested if requested else 0.0,
+                'ready': {size: len(bucket) for size, bucket in sorted(self.buckets.items())},
+                'size_per_bucket': self.size_per_bucket,
+                'refill_per_second': self.refill_per_second
+            }
+
+
+_pool: Optional[MazePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_maze_pool() -> MazePool:
+    """Get the process-wide maze pool, starting its producer on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MazePool()
+        return _pool
@@ -0,0 +1,253 @@
+"""
+Minimal Prometheus metrics for the web app.
+
+Counters, gauges and histograms with labels are kept in a process-wide
+registry and rendered in the Prometheus text exposition format by /metrics.
+Counters and gauges may be backed by a callback so values another component
+already tracks, such as queue depth or cache hits, are read at scrape time.
+"""
+import math
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Default latency buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Buckets for node counts and frontier sizes (cells of grids up to 50x50 and beyond)
+COUNT_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 100000)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label pairs as {a="1",b="2"}, or an empty string without labels."""
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float]]:
+        """Yield (suffix, label values, value) samples."""
+        return []
+
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, values, value in self.samples():
+            names = self.labelnames + (('le',) if len(values) > len(self.labelnames) else ())
+            lines.append(f"{self.name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+        return lines
+
+
+class _ValueMetric(_Metric):
+    """Metric holding one value per label set, optionally read from a callback at scrape time."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], Dict[LabelValues, float]]] = None):
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names
+            callback: Optional callable returning {label values: value} at scrape time,
+                for values another component already tracks
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def samples(self):
+        if self.callback is not None:
+            values = self.callback()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [('', tuple(key), value) for key, value in sorted(values.items())]
+
+
+class Counter(_ValueMetric):
+    """Monotonically increasing count."""
+
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Increase the counter for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_ValueMetric):
+    """Value that can go up and down."""
+
+    metric_type = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        """Set the gauge for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """Record an observation for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a with-block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key in sorted(self._counts):
+                cumulative = 0
+                for bound, count in zip(self.buckets, self._counts[key]):
+                    cumulative += count
+                    samples.append(('_bucket', key + (_format_value(bound),), cumulative))
+                samples.append(('_sum', key, self._sums[key]))
+                samples.append(('_count', key, cumulative))
+        return samples
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric, returning it for assignment."""
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    'maze_http_requests_total', 'HTTP requests handled.', ('endpoint', 'method', 'status')))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    'maze_http_request_duration_seconds', 'HTTP request latency in seconds.', ('endpoint', 'method')))
+SOLVES = REGISTRY.register(Counter(
+    'maze_solves_total', 'Completed solves.', ('algorithm', 'path_found')))
+SOLVE_ERRORS = REGISTRY.register(Counter(
+    'maze_solve_errors_total', 'Solves that raised an error, or stopped at their deadline or on cancellation.',
+    ('algorithm',)))
+SOLVE_LATENCY = REGISTRY.register(Histogram(
+    'maze_solve_duration_seconds', 'Solver execution time in seconds.', ('algorithm', 'size')))
+NODES_EXPLORED = REGISTRY.register(Histogram(
+    'maze_solve_nodes_explored', 'Nodes expanded per solve.', ('algorithm',), COUNT_BUCKETS))
+MAX_FRONTIER = REGISTRY.register(Histogram(
+    'maze_solve_max_frontier', 'Largest frontier (open set, queue or stack) per solve.', ('algorithm',),
+    COUNT_BUCKETS))
+RENDER_LATENCY = REGISTRY.register(Histogram(
+    'maze_render_duration_seconds', 'Time spent rendering and encoding responses.', ('stage',)))
+
+# Stats keys the solvers use for their frontier high-water mark
+_FRONTIER_KEYS = ('max_frontier_size', 'max_queue_size', 'max_stack_size')
+
+
+def observe_solve(algorithm: str, rows: int, cols: int, stats: Dict) -> None:
+    """
+    Record a completed solve from the stats dict the solver returned.
+
+    Solves stopped by their deadline or cancelled return normally, with a
+    'status' of 'timeout' or 'cancelled' in their stats; they count as errors too.
+
+    Args:
+        algorithm: Algorithm name
+        rows: Number of rows in the maze
+        cols: Number of columns in the maze
+        stats: Solver statistics
+    """
+    algorithm = algorithm.lower()
+    SOLVES.inc(algorithm=algorithm, path_found=str(bool(stats.get('success'))).lower())
+    if stats.get('status', 'found') not in ('found', 'no_path'):
+        SOLVE_ERRORS.inc(algorithm=algorithm)
+    if 'execution_time' in stats:
+        SOLVE_LATENCY.observe(stats['execution_time'], algorithm=algorithm, size=f"{rows}x{cols}")
+    if 'nodes_explored' in stats:
+        NODES_EXPLORED.observe(stats['nodes_explored'], algorithm=algorithm)
+    for key in _FRONTIER_KEYS:
+        if key in stats:
+            MAX_FRONTIER.observe(stats[key], algorithm=algorithm)
+            break
+
+
+def render_metrics() -> str:
+    """Render the process-wide registry in the Prometheus text format."""
+    return REGISTRY.render()
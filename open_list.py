@@ -0,0 +1,241 @@
+"""
+Open lists (priority queues of cell ids) for the best-first solvers.
+
+A* and Dijkstra pick their open list by name per solve:
+
+- 'heap': binary heap (heapq) with lazy duplicates; re-pushing a cell adds a
+  second entry and the solver skips the stale one when it is popped.
+- 'bucket': Dial's bucket queue, one bucket per integer priority and a cursor
+  over the lowest non-empty bucket, for O(1) push and amortised O(1) pop. It
+  needs small non-negative integer priorities that never drop below the last
+  popped one, which holds for path costs and consistent A* f-scores on grids.
+- 'indexed-heap': binary heap that tracks where each cell sits, so pushing a
+  cell that is already queued decreases its key instead of duplicating it.
+- 'radix': monotone radix heap, buckets by the highest bit in which a priority
+  differs from the last popped one. Each entry moves down at most once per
+  bit, so it stays fast when terrain makes step costs vary, without the
+  one-bucket-per-cost growth of Dial's queue.
+
+Without an explicit choice, solvers use ALGORITHM_CONFIG['OPEN_LIST'], or
+ALGORITHM_CONFIG['WEIGHTED_OPEN_LIST'] on mazes with terrain.
+
+Heap entries are single integers `priority * grid.size + cell`, which order
+exactly like `(priority, cell)` tuples without allocating a tuple per push.
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple, Type
+
+from config import ALGORITHM_CONFIG
+from grid import Grid
+from search_state import cell_values
+from utils import AlgorithmError
+
+
+class HeapOpenList:
+    """Binary heap of cells with lazy duplicate entries."""
+
+    name = 'heap'
+
+    def __init__(self, grid: Grid, compact: bool = True):
+        self.size = grid.size
+        self.heap: List[int] = []
+
+    def push(self, priority: int, cell: int) -> None:
+        """Queue a cell; a cell pushed again keeps its older entry until that is popped."""
+        heapq.heappush(self.heap, priority * self.size + cell)
+
+    def pop(self) -> Tuple[int, int]:
+        """Remove and return (priority, cell) with the lowest priority, ties to the lowest cell id."""
+        return divmod(heapq.heappop(self.heap), self.size)
+
+    def cells(self) -> List[int]:
+        """Queued cell ids, for drawing the frontier."""
+        return [key % self.size for key in self.heap]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class BucketOpenList:
+    """Dial's bucket queue: a list of cells per integer priority."""
+
+    name = 'bucket'
+
+    def __init__(self, grid: Grid, compact: bool = True):
+        self.buckets: List[List[int]] = []
+        # Lowest priority that may hold cells
+        self.cursor = 0
+        self.count = 0
+
+    def push(self, priority: int, cell: int) -> None:
+        """Queue a cell at a non-negative integer priority; duplicates are kept, like HeapOpenList."""
+        buckets = self.buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(cell)
+        if priority < self.cursor:
+            self.cursor = priority
+        self.count += 1
+
+    def pop(self) -> Tuple[int, int]:
+        """Remove and return (priority, cell) with the lowest priority, newest first among ties."""
+        buckets = self.buckets
+        cursor = self.cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self.cursor = cursor
+        self.count -= 1
+        return cursor, buckets[cursor].pop()
+
+    def cells(self) -> List[int]:
+        """Queued cell ids, for drawing the frontier."""
+        return [cell for bucket in self.buckets[self.cursor:] for cell in bucket]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class IndexedHeapOpenList:
+    """Binary heap with one entry per cell and decrease-key."""
+
+    name = 'indexed-heap'
+
+    def __init__(self, grid: Grid, compact: bool = True):
+        self.size = grid.size
+        self.heap: List[int] = []
+        # Heap index of each queued cell, -1 if the cell is not queued
+        self.index = cell_values(grid, compact, default=-1)
+
+    def push(self, priority: int, cell: int) -> None:
+        """Queue a cell, or lower its priority if it is queued already; higher priorities are ignored."""
+        key = priority * self.size + cell
+        position = self.index[cell]
+        if position < 0:
+            self.heap.append(key)
+            self._sift_up(len(self.heap) - 1, key)
+        elif key < self.heap[position]:
+            self._sift_up(position, key)
+
+    def pop(self) -> Tuple[int, int]:
+        """Remove and return (priority, cell) with the lowest priority, ties to the lowest cell id."""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.index[top % self.size] = -1
+        if heap:
+            self._sift_down(0, last)
+        return divmod(top, self.size)
+
+    def _sift_up(self, position: int, key: int) -> None:
+        """Place key at position and move it up past larger parents."""
+        heap, index, size = self.heap, self.index, self.size
+        while position:
+            parent = (position - 1) >> 1
+            parent_key = heap[parent]
+            if parent_key <= key:
+                break
+            heap[position] = parent_key
+            index[parent_key % size] = position
+            position = parent
+        heap[position] = key
+        index[key % size] = position
+
+    def _sift_down(self, position: int, key: int) -> None:
+        """Place key at position and move it down past smaller children."""
+        heap, index, size = self.heap, self.index, self.size
+        end = len(heap)
+        child = 2 * position + 1
+        while child < end:
+            if child + 1 < end and heap[child + 1] < heap[child]:
+                child += 1
+            child_key = heap[child]
+            if key <= child_key:
+                break
+            heap[position] = child_key
+            index[child_key % size] = position
+            position = child
+            child = 2 * position + 1
+        heap[position] = key
+        index[key % size] = position
+
+    def cells(self) -> List[int]:
+        """Queued cell ids, for drawing the frontier."""
+        return [key % self.size for key in self.heap]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class RadixOpenList:
+    """Monotone radix heap of cells."""
+
+    name = 'radix'
+
+    def __init__(self, grid: Grid, compact: bool = True):
+        self.size = grid.size
+        # Bucket i holds priorities whose highest bit differing from `last` is bit i - 1
+        self.buckets: List[List[int]] = [[]]
+        self.last = 0
+        self.count = 0
+
+    def push(self, priority: int, cell: int) -> None:
+        """Queue a cell at an integer priority no lower than the last popped one; duplicates are kept."""
+        index = (priority ^ self.last).bit_length()
+        buckets = self.buckets
+        if index >= len(buckets):
+            buckets.extend([] for _ in range(index + 1 - len(buckets)))
+        buckets[index].append(priority * self.size + cell)
+        self.count += 1
+
+    def pop(self) -> Tuple[int, int]:
+        """Remove and return (priority, cell) with the lowest priority."""
+        buckets = self.buckets
+        size = self.size
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            # Redistribute the first non-empty bucket around its minimum, which becomes `last`
+            bucket = buckets[index]
+            buckets[index] = []
+            last = self.last = min(bucket) // size
+            for key in bucket:
+                buckets[(key // size ^ last).bit_length()].append(key)
+        self.count -= 1
+        return divmod(buckets[0].pop(), size)
+
+    def cells(self) -> List[int]:
+        """Queued cell ids, for drawing the frontier."""
+        return [key % self.size for bucket in self.buckets for key in bucket]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+OPEN_LISTS: Dict[str, Type] = {
+    open_list.name: open_list
+    for open_list in (HeapOpenList, BucketOpenList, IndexedHeapOpenList, RadixOpenList)
+}
+
+
+def make_open_list(name: Optional[str], grid: Grid, compact: bool = True):
+    """
+    Create an empty open list by name.
+
+    Args:
+        name: One of OPEN_LISTS, or None for the configured default for the grid
+        grid: Grid whose cell ids will be queued
+        compact: Whether per-cell bookkeeping uses flat arrays (see search_state)
+
+    Returns:
+        Open list with push(priority, cell), pop(), cells() and len()
+
+    Raises:
+        AlgorithmError: If the name is unknown
+    """
+    if name is None:
+        name = ALGORITHM_CONFIG['WEIGHTED_OPEN_LIST' if grid.weighted else 'OPEN_LIST']
+    open_list = OPEN_LISTS.get(str(name).lower())
+    if open_list is None:
+        raise AlgorithmError(f"Invalid open list '{name}'. Supported: {', '.join(OPEN_LISTS)}")
+    return open_list(grid, compact)
@@ -3,11 +3,17 @@ import numpy as np
 import sys
 import time
 from utils import load_maze_from_file, find_start_end_positions, save_maze_image
-from config import MAZE_CONFIG, COLORS
+from config import RL_CONFIG, ALGORITHM_CONFIG
+from deadline import Deadline
+from grid import Grid, WALL, path_cost
+from components import end_reachable
+from solver_cli import parse_solver_args, make_deadline, build_result, write_json_result
 
 class QLearningSolver:
-    def __init__(self, maze, start, end, episodes=1000, alpha=0.1, gamma=0.9, epsilon=0.2, max_steps_per_episode=1000):
+    def __init__(self, maze, start, end, episodes=1000, alpha=0.1, gamma=0.9, epsilon=0.2, max_steps_per_episode=1000, verbose=True,
+                 reachable=None):
         self.maze = maze
+        self.grid = Grid.from_maze(maze, start, [end])
         self.start = start
         self.end = end
         self.episodes = episodes
@@ -17,47 +23,76 @@ class QLearningSolver:
         self.epsilon_decay = 0.995  # Decay epsilon over time
         self.epsilon_min = 0.01
         self.max_steps_per_episode = max_steps_per_episode
-        self.rows = len(maze)
-        self.cols = len(maze[0])
-        self.q_table = np.zeros((self.rows, self.cols, 4))  # 4 directions: R, L, D, U
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+        # States are flat cell ids of the grid, so the Q-table has one row per padded cell
+        self.q_table = np.zeros((self.grid.size, 4))  # 4 directions: R, L, D, U
         self.actions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # Right, Left, Down, Up
+        self.action_offsets = [dc + dr * self.grid.width for dr, dc in self.actions]
+        self.start_cell = self.grid.cell_id(*start)
+        self.end_cell = self.grid.cell_id(*end)
+        # Whether the goal shares a connected region with the start; if not, no episode can succeed
+        self.reachable = end_reachable(self.grid) if reachable is None else reachable
+        # Manhattan distance from every cell to the goal, for reward shaping
+        cell_rows, cell_cols = np.divmod(np.arange(self.grid.size), self.grid.width)
+        self.goal_distance = (np.abs(cell_rows - 1 - end[0]) + np.abs(cell_cols - 1 - end[1])).tolist()
         self.successful_episodes = 0
+        self.total_steps = 0
         self.training_stats = []
+        self.verbose = verbose
+        self.episodes_done = 0
+        self.stopped_early = False
 
-    def is_valid(self, pos):
-        r, c = pos
-        return 0 <= r < self.rows and 0 <= c < self.cols and self.maze[r][c] != 1
+    def log(self, message):
+        """Print a progress message unless the solver runs quietly."""
+        if self.verbose:
+            print(message)
+
+    def is_valid(self, cell):
+        """Whether the agent can enter a cell; the grid's wall border covers moves off the maze."""
+        return self.grid.flat[cell] != WALL
 
     def choose_action(self, state):
         if np.random.rand() < self.epsilon:
             return np.random.randint(4)
-        return np.argmax(self.q_table[state[0]][state[1]])
+        return np.argmax(self.q_table[state])
 
     def get_reward(self, current_state, next_state):
         """Calculate reward based on the action taken."""
         if not self.is_valid(next_state):
             return -10  # Heavy penalty for hitting walls
-        elif next_state == self.end:
+        elif next_state == self.end_cell:
             return 100  # Large reward for reaching the goal
         elif next_state == current_state:
             return -5   # Penalty for staying in place
         else:
             # Small penalty for each step + distance-based reward
-            distance_to_goal = abs(next_state[0] - self.end[0]) + abs(next_state[1] - self.end[1])
-            return -1 - distance_to_goal * 0.1
+            return -1 - self.goal_distance[next_state] * 0.1
+
+    def train(self, progress_callback=None, deadline=None):
+        """
+        Train the Q-table over the configured number of episodes.
 
-    def train(self):
-        print(f"Training Q-Learning agent for {self.episodes} episodes...")
+        Args:
+            progress_callback: Optional callable receiving a progress dict after each episode
+            deadline: Optional Deadline checked every few steps; training stops early
+                (keeping the Q-table learned so far) once it expires
+        """
+        if not self.reachable:
+            self.log("The goal cannot be reached from the start; skipping training")
+            return
+
+        self.log(f"Training Q-Learning agent for {self.episodes} episodes...")
 
         for episode in range(self.episodes):
-            state = self.start
+            state = self.start_cell
             steps = 0
             episode_reward = 0
 
             # Episode loop with step limit
-            while state != self.end and steps < self.max_steps_per_episode:
+            while state != self.end_cell and steps < self.max_steps_per_episode:
                 action = self.choose_action(state)
-                next_state = (state[0] + self.actions[action][0], state[1] + self.actions[action][1])
+                next_state = state + self.action_offsets[action]
 
                 # Calculate reward
                 reward = self.get_reward(state, next_state)
@@ -68,193 +103,198 @@ class QLearningSolver:
                     next_state = state
 
                 # Q-learning update
-                old_value = self.q_table[state[0]][state[1]][action]
-                next_max = np.max(self.q_table[next_state[0]][next_state[1]])
-                self.q_table[state[0]][state[1]][action] = \
+                old_value = self.q_table[state, action]
+                next_max = np.max(self.q_table[next_state])
+                self.q_table[state, action] = \
                     (1 - self.alpha) * old_value + self.alpha * (reward + self.gamma * next_max)
 
                 state = next_state
                 steps += 1
 
+                if deadline is not None and deadline.check(self.total_steps + steps):
+                    self.stopped_early = True
+                    break
+
+            self.total_steps += steps
+            self.episodes_done = episode + 1
+
             # Track successful episodes
-            if state == self.end:
+            if state == self.end_cell:
                 self.successful_episodes += 1
 
             # Decay epsilon
             if self.epsilon > self.epsilon_min:
                 self.epsilon *= self.epsilon_decay
 
+            if progress_callback:
+                progress_callback({
+                    'episodes_done': episode + 1,
+                    'episodes': self.episodes,
+                    'successful_episodes': self.successful_episodes
+                })
+
             # Log progress every 100 episodes
             if (episode + 1) % 100 == 0:
                 success_rate = self.successful_episodes / (episode + 1) * 100
-                print(f"Episode {episode + 1}/{self.episodes}, Success Rate: {success_rate:.1f}%, "
-                      f"Epsilon: {self.epsilon:.3f}, Steps: {steps}, Reward: {episode_reward:.1f}")
+                self.log(f"Episode {episode + 1}/{self.episodes}, Success Rate: {success_rate:.1f}%, "
+                         f"Epsilon: {self.epsilon:.3f}, Steps: {steps}, Reward: {episode_reward:.1f}")
 
-        final_success_rate = self.successful_episodes / self.episodes * 100
-        print(f"Training completed! Final success rate: {final_success_rate:.1f}%")
+            if self.stopped_early:
+                self.log(f"Training stopped after {self.episodes_done} episodes ({deadline.status})")
+                break
+
+        final_success_rate = self.successful_episodes / max(self.episodes_done, 1) * 100
+        self.log(f"Training completed! Final success rate: {final_success_rate:.1f}%")
+
+    def visited_positions(self):
+        """Positions whose Q-values were ever updated, i.e. the states the agent visited."""
+        return self.grid.positions(np.flatnonzero(np.any(self.q_table != 0, axis=1)).tolist())
 
     def get_path(self, max_path_length=1000):
-        """Extract the learned path from start to end using the Q-table."""
+        """
+        Extract the learned path from start to end using the Q-table.
+
+        Returns:
+            Positions after the start, like the other solvers' paths; the last one is the
+            end only if extraction reached it
+        """
+        if not self.reachable:
+            return []
+
         path = []
-        state = self.start
+        state = self.start_cell
         visited = set()
         steps = 0
+        position = self.grid.position
 
-        print(f"Extracting path from {self.start} to {self.end}...")
+        self.log(f"Extracting path from {self.start} to {self.end}...")
 
-        while state != self.end and state not in visited and steps < max_path_length:
+        while state != self.end_cell and state not in visited and steps < max_path_length:
             visited.add(state)
-            path.append(state)
 
             # Choose the best action based on Q-values
-            action = np.argmax(self.q_table[state[0]][state[1]])
-            next_state = (state[0] + self.actions[action][0], state[1] + self.actions[action][1])
+            action = np.argmax(self.q_table[state])
+            next_state = state + self.action_offsets[action]
 
             # Check if the move is valid
             if not self.is_valid(next_state):
-                print(f"Invalid move from {state} with action {action}")
+                self.log(f"Invalid move from {position(state)} with action {action}")
                 # Try other actions if the best one is invalid
-                q_values = self.q_table[state[0]][state[1]]
+                q_values = self.q_table[state]
                 sorted_actions = np.argsort(q_values)[::-1]  # Sort in descending order
 
                 found_valid = False
                 for alt_action in sorted_actions:
-                    alt_next_state = (state[0] + self.actions[alt_action][0], state[1] + self.actions[alt_action][1])
+                    alt_next_state = state + self.action_offsets[alt_action]
                     if self.is_valid(alt_next_state) and alt_next_state not in visited:
                         next_state = alt_next_state
                         found_valid = True
                         break
 
                 if not found_valid:
-                    print(f"No valid moves from {state}, path extraction failed")
+                    self.log(f"No valid moves from {position(state)}, path extraction failed")
                     break
 
             state = next_state
+            path.append(state)
             steps += 1
 
-        # Add the end state if we reached it
-        if state == self.end:
-            path.append(state)
-            print(f"Successfully found path with {len(path)} steps")
+        if state == self.end_cell:
+            self.log(f"Successfully found path with {len(path)} steps")
         else:
-            print(f"Path extraction failed. Stopped at {state} after {steps} steps")
+            self.log(f"Path extraction failed. Stopped at {position(state)} after {steps} steps")
             if steps >= max_path_length:
-                print("Maximum path length exceeded")
+                self.log("Maximum path length exceeded")
             elif state in visited:
-                print("Detected loop in path")
+                self.log("Detected loop in path")
 
-        return path
+        return self.grid.positions(path)
 
 def draw_solution_path_on_image(maze, path, filename="solution.png"):
-    import pygame
-    pygame.init()
-    rows, cols = len(maze), len(maze[0])
-    surface = pygame.Surface(((MAZE_CONFIG['CELL_SIZE'] + MAZE_CONFIG['MARGIN']) * cols,
-                               (MAZE_CONFIG['CELL_SIZE'] + MAZE_CONFIG['MARGIN']) * rows))
-
-    for r in range(rows):
-        for c in range(cols):
-            color = COLORS['WHITE']
-            if maze[r][c] == 1:
-                color = COLORS['BLACK']
-            elif maze[r][c] == 2:
-                color = COLORS['GREEN']
-            elif maze[r][c] == 3:
-                color = COLORS['RED']
-            rect = pygame.Rect(
-                c * (MAZE_CONFIG['CELL_SIZE'] + MAZE_CONFIG['MARGIN']),
-                r * (MAZE_CONFIG['CELL_SIZE'] + MAZE_CONFIG['MARGIN']),
-                MAZE_CONFIG['CELL_SIZE'],
-                MAZE_CONFIG['CELL_SIZE']
-            )
-            pygame.draw.rect(surface, color, rect)
-
-    for r, c in path:
-        if maze[r][c] not in [2, 3]:
-            rect = pygame.Rect(
-                c * (MAZE_CONFIG['CELL_SIZE'] + MAZE_CONFIG['MARGIN']),
-                r * (MAZE_CONFIG['CELL_SIZE'] + MAZE_CONFIG['MARGIN']),
-                MAZE_CONFIG['CELL_SIZE'],
-                MAZE_CONFIG['CELL_SIZE']
-            )
-            pygame.draw.rect(surface, COLORS['BLUE'], rect)
-
-    pygame.image.save(surface, filename)
-    pygame.quit()
+    """Render the maze with the agent's path highlighted."""
+    save_maze_image(maze, filename, path)
 
 def main():
-    try:
-        # Parse command line arguments
-        maze_file = sys.argv[1] if len(sys.argv) > 1 else "custom_maze.txt"
-        headless_mode = len(sys.argv) > 2 and sys.argv[2] == "headless"
+    args = parse_solver_args("Solve a maze with a Q-learning agent.", default_maze="custom_maze.txt")
+    quiet = args.headless
+    timings = {}
+    load_start_time = time.time()
 
-        if not headless_mode:
-            print(f"Loading maze from: {maze_file}")
+    try:
+        if not quiet:
+            print(f"Loading maze from: {args.maze_file}")
 
-        maze = load_maze_from_file(maze_file)
+        maze = load_maze_from_file(args.maze_file)
         start, ends = find_start_end_positions(maze)
 
         if not start or not ends:
             raise ValueError("Start or End point missing.")
 
         end = ends[0]
+        timings['load'] = time.time() - load_start_time
 
-        if not headless_mode:
+        if not quiet:
             print(f"Maze loaded: {len(maze)}x{len(maze[0])}")
             print(f"Start: {start}, End: {end}")
 
-        # Create solver with reasonable parameters
+        # Create solver with reasonable parameters; training output only when watching
         solver = QLearningSolver(
             maze, start, end,
-            episodes=300,  # Reduced for web app performance
-            alpha=0.1,
-            gamma=0.9,
-            epsilon=0.3,  # Higher initial exploration
-            max_steps_per_episode=300
+            episodes=RL_CONFIG['EPISODES'],
+            alpha=RL_CONFIG['ALPHA'],
+            gamma=RL_CONFIG['GAMMA'],
+            epsilon=RL_CONFIG['EPSILON'],
+            max_steps_per_episode=RL_CONFIG['MAX_STEPS_PER_EPISODE'],
+            verbose=not quiet
         )
 
         start_time = time.time()
-
-        # Train with reduced verbosity in headless mode
-        if headless_mode:
-            # Temporarily redirect stdout to suppress training output
-            import io
-            import contextlib
-
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                solver.train()
-        else:
-            solver.train()
-
+        deadline = make_deadline(args) or Deadline(ALGORITHM_CONFIG['TIMEOUT_SECONDS'])
+        solver.train(deadline=deadline)
         training_time = time.time() - start_time
 
-        if not headless_mode:
+        if not quiet:
             print(f"\nTraining completed in {training_time:.2f} seconds")
 
         # Extract path
         path_start_time = time.time()
-
-        if headless_mode:
-            # Suppress path extraction output in headless mode
-            import io
-            import contextlib
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                path = solver.get_path()
-        else:
-            path = solver.get_path()
-
+        path = solver.get_path()
         path_time = time.time() - path_start_time
+        timings['solve'] = time.time() - start_time
+        path_found = len(path) > 0 and path[-1] == end
 
-        # Always save images (required by web app)
-        save_maze_image(maze, "maze.png")
-        draw_solution_path_on_image(maze, path, "solution.png")
+        if args.images:
+            images_start_time = time.time()
+            save_maze_image(maze, "maze.png")
+            draw_solution_path_on_image(maze, path, "solution.png")
+            timings['images'] = time.time() - images_start_time
 
-        # Results - format for web app compatibility
         total_time = time.time() - start_time
-        path_found = len(path) > 0 and path[-1] == end
+        timings['total'] = time.time() - load_start_time
+
+        if args.json:
+            stats = {
+                'nodes_explored': solver.total_steps,
+                'episodes': solver.episodes,
+                'episodes_done': solver.episodes_done,
+                'successful_episodes': solver.successful_episodes,
+                'training_time': training_time,
+                'path_extraction_time': path_time,
+                'execution_time': timings['solve'],
+                'success': path_found,
+                'path_length': len(path) if path_found else 0,
+                'path_cost': path_cost(maze, path) if path_found else 0,
+                'status': 'found' if path_found else 'no_path'
+            }
+            if not solver.reachable:
+                stats['unreachable'] = True
+            if solver.stopped_early:
+                stats.update(deadline.stop_stats())
+            write_json_result(build_result('reinforcement', args.maze_file, path if path_found else None,
+                                           stats, timings))
+            return
 
+        # Results - format for web app compatibility
         if path_found:
             print(f"RL Path found! Length: {len(path)}")
             print(f"SUCCESS: Path successfully found using Reinforcement Learning algorithm")
@@ -264,15 +304,23 @@ def main():
 
         print(f"Time taken: {total_time:.3f} seconds")
 
-        if not headless_mode:
+        if solver.stopped_early:
+            print(f"Training stopped early after {solver.episodes_done} episodes: time limit reached")
+
+        if not quiet:
             print(f"\n=== DETAILED RESULTS ===")
             print(f"Training time: {training_time:.2f} seconds")
             print(f"Path extraction time: {path_time:.2f} seconds")
             print(f"Success rate: {solver.successful_episodes}/{solver.episodes} ({solver.successful_episodes/solver.episodes*100:.1f}%)")
 
     except Exception as e:
+        if args.json:
+            timings['total'] = time.time() - load_start_time
+            write_json_result(build_result('reinforcement', args.maze_file, timings=timings,
+                                           error=str(e) or type(e).__name__))
+            sys.exit(1)
         print(f"FAILURE: Error in RL solver: {e}")
-        if not (len(sys.argv) > 2 and sys.argv[2] == "headless"):
+        if not quiet:
             import traceback
             traceback.print_exc()
 
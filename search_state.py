@@ -0,0 +1,98 @@
+"""
+Per-cell search state for the grid solvers.
+
+Visited flags, parent links and costs are indexed by the flat cell ids of a
+Grid. In compact mode they are flat arrays sized to the grid: one byte per
+cell for visited flags, and one byte per cell for parents, which are stored
+as the direction the search took into the cell instead of the parent's id.
+Sparse mode offers the same indexing interface backed by dicts that only hold
+the cells the search touched, which needs less memory when a search explores
+a small part of a very large grid.
+"""
+from array import array
+from typing import List, Union
+
+import numpy as np
+
+from grid import Grid
+
+# Parent direction of a cell the search has not linked to a parent
+NO_PARENT = 0
+# Cost of a cell the search has not reached yet
+UNREACHED = 2 ** 31 - 1
+
+
+class SparseCells(dict):
+    """Dict of cell id -> value that reads missing cells as a default, like a pre-filled array."""
+
+    __slots__ = ('default',)
+
+    def __init__(self, default: int = 0):
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, cell: int) -> int:
+        return self.default
+
+
+CellFlags = Union[bytearray, SparseCells]
+CellValues = Union[array, SparseCells]
+
+
+def cell_flags(grid: Grid, compact: bool = True) -> CellFlags:
+    """Per-cell flags that read as 0 until set, indexed by cell id."""
+    return bytearray(grid.size) if compact else SparseCells(0)
+
+
+def cell_values(grid: Grid, compact: bool = True, default: int = UNREACHED) -> CellValues:
+    """Per-cell integers (such as path costs) that read as default until set, indexed by cell id."""
+    return array('i', [default]) * grid.size if compact else SparseCells(default)
+
+
+class SearchState:
+    """Visited flags and parent directions of one search over a grid."""
+
+    def __init__(self, grid: Grid, compact: bool = True):
+        """
+        Initialize empty search state.
+
+        Args:
+            grid: Grid being searched
+            compact: Flat arrays sized to the grid if True, dicts of touched cells if False
+        """
+        self.grid = grid
+        self.compact = compact
+        self.visited = cell_flags(grid, compact)
+        # Direction into each cell: 1 + index into grid.offsets, or NO_PARENT
+        self.parents = cell_flags(grid, compact)
+        # (direction code, offset) pairs for the neighbour loops
+        self.directions = tuple(enumerate(grid.offsets, 1))
+
+    def parent(self, cell: int) -> int:
+        """Id of the cell the search reached a cell from; the cell must have a parent."""
+        return cell - self.grid.offsets[self.parents[cell] - 1]
+
+    def path_to(self, cell: int) -> List[int]:
+        """
+        Follow parent links back from a cell.
+
+        Args:
+            cell: Cell id the path ends at
+
+        Returns:
+            Cell ids from the first step after the root to the cell, in order
+        """
+        parents = self.parents
+        offsets = self.grid.offsets
+        path = []
+        while parents[cell] != NO_PARENT:
+            path.append(cell)
+            cell -= offsets[parents[cell] - 1]
+        path.reverse()
+        return path
+
+    def visited_cells(self) -> List[int]:
+        """Ids of every visited cell."""
+        if self.compact:
+            return np.flatnonzero(np.frombuffer(self.visited, dtype=np.uint8)).tolist()
+        return [cell for cell, flag in self.visited.items() if flag]
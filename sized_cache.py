@@ -0,0 +1,97 @@
+"""
+Thread-safe, byte-bounded LRU cache.
+
+The goal-tree, abstract-graph and component caches all hold one structure per
+maze layout, keyed by a grid layout hash (see grid.layout_key), and bound
+their memory by the structures' own `nbytes`. They share this class and add
+only the method that builds a structure on a miss. The solution cache holds
+solve results instead and measures them with its own size_of.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SizedLRUCache:
+    """Thread-safe LRU cache of sized values, bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for all values together
+        """
+        self.max_bytes = max_bytes
+        # Key -> (value, size in bytes), least recently used first
+        self._values: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def size_of(self, value: Any) -> int:
+        """Bytes a value counts against the budget: its `nbytes`."""
+        return value.nbytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a value, marking it as recently used."""
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._values.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Look up a value without counting a hit or miss, marking it as recently used if present."""
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            self._values.move_to_end(key)
+            return item[0]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting least-recently-used values to fit the budget."""
+        size = self.size_of(value)
+        if size > self.max_bytes:
+            logger.info(f"Not caching {type(value).__name__} of {size} bytes (budget {self.max_bytes})")
+            return
+
+        with self._lock:
+            old = self._values.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            while self._values and self.current_bytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._values.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+            self._values[key] = (value, size)
+            self.current_bytes += size
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._values.clear()
+            self.current_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and memory usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._values),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,65 @@
+"""
+Content-addressed cache of solved mazes.
+
+Entries are keyed by a canonical hash of the maze grid plus the algorithm and
+its parameters, hold the path, stats and encoded images of a solve, and are
+evicted least-recently-used once the cache exceeds its byte budget.
+"""
+import json
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+from config import CACHE_CONFIG
+from sized_cache import SizedLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def maze_hash(maze: List[List[int]]) -> str:
+    """
+    Compute a canonical hash of a maze grid.
+
+    Args:
+        maze: 2D list representing the maze
+
+    Returns:
+        Hex digest identifying the grid contents and shape
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{len(maze)}x{len(maze[0])}:".encode())
+    digest.update(bytes(int(cell) & 0xFF for row in maze for cell in row))
+    return digest.hexdigest()
+
+
+class SolutionCache(SizedLRUCache):
+    """Thread-safe LRU cache of solve results bounded by total size."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for all entries together
+        """
+        super().__init__(max_bytes or CACHE_CONFIG['MAX_BYTES'])
+
+    @staticmethod
+    def make_key(maze: List[List[int]], algorithm: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a maze, algorithm and parameter set.
+
+        Args:
+            maze: 2D list representing the maze
+            algorithm: Algorithm name
+            params: Extra parameters that influence the result
+
+        Returns:
+            Cache key string
+        """
+        params_part = json.dumps(params or {}, sort_keys=True)
+        return f"{maze_hash(maze)}:{algorithm.lower()}:{params_part}"
+
+    def size_of(self, entry: Dict[str, Any]) -> int:
+        """Approximate the memory footprint of a cache entry in bytes."""
+        return len(json.dumps(entry, default=str))
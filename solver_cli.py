@@ -0,0 +1,132 @@
+"""
+Shared command-line handling for the standalone solver scripts.
+
+Every solver script accepts the historical `<maze_file> [headless]`
+arguments plus `--json`, which writes a single JSON document (path, stats,
+timings and error) to stdout instead of human-readable output. In JSON mode
+no images are written unless `--images` is given.
+"""
+import sys
+import json
+import time
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+from deadline import Deadline
+
+# Second positional argument values that disable the animation window
+HEADLESS_MODES = ['false', 'headless', 'no-gui']
+
+
+def parse_solver_args(description: str, default_maze: str = "manual_maze.txt",
+                      argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line of a solver script.
+
+    Args:
+        description: Help text for the script
+        default_maze: Maze file used when none is given
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Namespace with maze_file, headless, json, images and timeout
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('maze_file', nargs='?', default=default_maze, help="Maze file to solve")
+    parser.add_argument('mode', nargs='?', default=None,
+                        help="'headless' (or 'false'/'no-gui') to run without the animation window")
+    parser.add_argument('--json', action='store_true',
+                        help="Write one JSON result document to stdout; implies headless")
+    parser.add_argument('--images', action='store_true',
+                        help="Also write maze.png/solution.png in --json mode")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Seconds before the search gives up (default: ALGORITHM_CONFIG['TIMEOUT_SECONDS'])")
+    args = parser.parse_args(argv)
+    args.headless = args.json or (args.mode is not None and args.mode.lower() in HEADLESS_MODES)
+    # Outside JSON mode images are always written, as before
+    args.images = args.images or not args.json
+    return args
+
+
+def make_deadline(args: argparse.Namespace) -> Optional[Deadline]:
+    """Deadline for the --timeout argument, or None to use the solver default."""
+    return Deadline(args.timeout) if args.timeout is not None else None
+
+
+def build_result(algorithm: str, maze_file: str, path: Optional[List[Tuple[int, int]]] = None,
+                 stats: Optional[Dict[str, Any]] = None, timings: Optional[Dict[str, float]] = None,
+                 error: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the JSON result document of a solver run.
+
+    Args:
+        algorithm: Algorithm name
+        maze_file: Maze file that was solved
+        path: Positions along the path, or None if no path was found
+        stats: Solver statistics
+        timings: Wall-clock seconds per phase (load, solve, images, total)
+        error: Error message if the run failed
+
+    Returns:
+        JSON-serialisable result dict
+    """
+    stats = dict(stats or {})
+    path_found = bool(path)
+    return {
+        'algorithm': algorithm,
+        'maze_file': maze_file,
+        'success': error is None and path_found,
+        'path_found': path_found,
+        'status': 'error' if error else stats.get('status', 'found' if path_found else 'no_path'),
+        'path_length': len(path) if path else 0,
+        'path': [list(pos) for pos in path] if path else [],
+        'stats': stats,
+        'timings': timings if timings is not None else {},
+        'error': error
+    }
+
+
+def write_json_result(result: Dict[str, Any], stream=None) -> None:
+    """Write a result document as a single line of JSON."""
+    stream = stream or sys.stdout
+    stream.write(json.dumps(result, default=str) + "\n")
+    stream.flush()
+
+
+def run_algorithm_json(algorithm_class, name: str, args: argparse.Namespace) -> int:
+    """
+    Run a PathfindingAlgorithm subclass headless and write its JSON result.
+
+    Args:
+        algorithm_class: PathfindingAlgorithm subclass to run
+        name: Algorithm name reported in the result
+        args: Parsed arguments from parse_solver_args()
+
+    Returns:
+        Process exit code (0 unless the run raised an error)
+    """
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    try:
+        algorithm = algorithm_class(args.maze_file, animate=False)
+        if algorithm.maze is None:
+            algorithm.load_maze()
+        timings['load'] = time.perf_counter() - started
+        algorithm.deadline = make_deadline(args)
+
+        phase = time.perf_counter()
+        path, stats = algorithm.execute()
+        timings['solve'] = time.perf_counter() - phase
+
+        if args.images:
+            phase = time.perf_counter()
+            algorithm.save_images(path)
+            timings['images'] = time.perf_counter() - phase
+
+        result = build_result(name, args.maze_file, path, stats, timings)
+    except Exception as e:
+        result = build_result(name, args.maze_file, timings=timings, error=str(e) or type(e).__name__)
+
+    timings['total'] = time.perf_counter() - started
+    write_json_result(result)
+    return 0 if result['error'] is None else 1
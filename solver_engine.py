@@ -0,0 +1,338 @@
+"""
+In-process solver engine.
+
+Maps the algorithm names used by the web app to the solver implementations
+and runs them directly, returning structured results instead of parsing the
+output of a solver subprocess.
+"""
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from config import RL_CONFIG, ALGORITHM_CONFIG
+from deadline import Deadline
+from utils import find_start_end_positions, validate_maze_positions, AlgorithmError
+from astar import AStarAlgorithm
+from bfs import BFSAlgorithm
+from vector_bfs import VectorBFSAlgorithm
+from dfs import DFSAlgorithm
+from jps import JumpPointSearchAlgorithm
+from bidirectional import BidirectionalAlgorithm
+from bidirectional_astar import BidirectionalAStarAlgorithm
+from hpa import HPAStarAlgorithm
+from dijkstra import dijkstra
+from goal_tree import get_goal_tree_cache
+from components import end_reachable
+from grid import Grid, path_cost
+from rl_solver import QLearningSolver
+from open_list import OPEN_LISTS
+
+logger = logging.getLogger(__name__)
+
+Path = List[Tuple[int, int]]
+ProgressCallback = Optional[Callable[[Dict[str, Any]], None]]
+SolverOutput = Tuple[Optional[Path], Dict[str, Any], Optional[Path]]
+SolverFunction = Callable[..., SolverOutput]
+
+
+@dataclass
+class PreparedMaze:
+    """A validated maze with its start and end positions already located."""
+    grid: List[List[int]]
+    start: Tuple[int, int]
+    ends: List[Tuple[int, int]]
+    # Whether any end can be reached from the start, once unreachable_result() has checked
+    reachable: Optional[bool] = None
+
+    @property
+    def rows(self) -> int:
+        """Number of rows in the maze."""
+        return len(self.grid)
+
+    @property
+    def cols(self) -> int:
+        """Number of columns in the maze."""
+        return len(self.grid[0])
+
+
+def prepare_maze(maze: Union[List[List[int]], PreparedMaze]) -> PreparedMaze:
+    """
+    Validate a maze and locate its start and end positions once.
+
+    The result can be solved with several algorithms without repeating this work.
+
+    Args:
+        maze: 2D list representing the maze, or an already prepared maze
+
+    Returns:
+        PreparedMaze for the grid
+
+    Raises:
+        MazeError: If the maze has no start or end position
+    """
+    if isinstance(maze, PreparedMaze):
+        return maze
+    validate_maze_positions(maze)
+    start, ends = find_start_end_positions(maze)
+    return PreparedMaze(grid=maze, start=start, ends=ends)
+
+
+@dataclass
+class SolveResult:
+    """Outcome of solving a single maze with a single algorithm."""
+    algorithm: str
+    path: Path = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+    explored: Path = field(default_factory=list)
+
+    @property
+    def path_found(self) -> bool:
+        """Whether the solver reached an end point."""
+        return bool(self.path)
+
+    @property
+    def status(self) -> str:
+        """How the search ended: 'found', 'no_path', 'timeout' or 'cancelled'."""
+        return self.stats.get('status', 'found' if self.path else 'no_path')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable representation of the result."""
+        return {
+            'algorithm': self.algorithm,
+            'path_found': self.path_found,
+            'status': self.status,
+            'path': [list(pos) for pos in self.path],
+            'explored': [list(pos) for pos in self.explored],
+            'stats': self.stats
+        }
+
+
+def _class_solver(algorithm_class) -> SolverFunction:
+    """Wrap a PathfindingAlgorithm subclass as a solver function."""
+    def solve(maze: PreparedMaze, progress_callback: ProgressCallback = None,
+              collect_explored: bool = False, tracer=None, deadline: Optional[Deadline] = None,
+              open_list: Optional[str] = None) -> SolverOutput:
+        algorithm = algorithm_class.from_grid(maze.grid, start=maze.start, ends=maze.ends)
+        algorithm.progress_callback = progress_callback
+        algorithm.tracer = tracer
+        algorithm.deadline = deadline
+        if open_list and hasattr(algorithm, 'open_list_kind'):
+            algorithm.open_list_kind = open_list
+        algorithm.reachable = maze.reachable
+        path, stats = algorithm.execute()
+        explored = list(algorithm.explored_cells()) if collect_explored else None
+        return path, dict(stats), explored
+    return solve
+
+
+def _solve_dijkstra(maze: PreparedMaze, progress_callback: ProgressCallback = None,
+                    collect_explored: bool = False, tracer=None,
+                    deadline: Optional[Deadline] = None, open_list: Optional[str] = None) -> SolverOutput:
+    """Run Dijkstra's algorithm on an in-memory maze."""
+    explored = set() if collect_explored else None
+    path, stats = dijkstra(maze.grid, maze.start, maze.ends, progress_callback, explored, tracer, deadline,
+                           open_list, maze.reachable)
+    stats.setdefault('status', 'found' if path is not None else 'no_path')
+    stats['success'] = path is not None
+    stats['path_length'] = len(path) if path else 0
+    stats['path_cost'] = path_cost(maze.grid, path)
+    return path, stats, (list(explored) if collect_explored else None)
+
+
+def _solve_goal_tree(maze: PreparedMaze, progress_callback: ProgressCallback = None,
+                     collect_explored: bool = False, tracer=None,
+                     deadline: Optional[Deadline] = None, open_list: Optional[str] = None) -> SolverOutput:
+    """
+    Answer a solve from the cached shortest-path tree rooted at the maze's end points.
+
+    The tree is built on the first solve of a wall layout and reused while only
+    the start moves, so repeat solves walk the path without searching. The tracer
+    and explored cells of a cached solve are just the path, the only cells it touches.
+    """
+    start_time = time.time()
+    grid = Grid(maze.grid, maze.start, maze.ends)
+    tree, cached = get_goal_tree_cache().tree_for(grid, deadline)
+
+    path = tree.path_from(maze.start) if tree.complete else None
+    if tracer and path:
+        for pos in path:
+            tracer.expand(pos)
+
+    stats = {
+        'nodes_explored': len(path or []) if cached else tree.cells_reached,
+        'tree_cached': cached,
+        'tree_cells': tree.cells_reached,
+        'execution_time': time.time() - start_time,
+        'success': path is not None,
+        'path_length': len(path) if path else 0,
+        'path_cost': path_cost(maze.grid, path),
+        'status': 'found' if path is not None else 'no_path'
+    }
+    if path:
+        stats['end_reached'] = path[-1]
+    if not tree.complete:
+        stats.update(deadline.stop_stats())
+
+    explored = None
+    if collect_explored:
+        explored = (path or []) if cached else tree.reached_positions()
+    return path, stats, explored
+
+
+def _solve_reinforcement(maze: PreparedMaze, progress_callback: ProgressCallback = None,
+                         collect_explored: bool = False, tracer=None,
+                         deadline: Optional[Deadline] = None, open_list: Optional[str] = None) -> SolverOutput:
+    """
+    Train a Q-learning agent on an in-memory maze and extract its path.
+
+    Training has no node expansion order, so a tracer receives no events. If
+    the deadline expires, the path is extracted from the partly trained Q-table.
+    """
+    start_time = time.time()
+    end = maze.ends[0]
+
+    solver = QLearningSolver(
+        maze.grid, maze.start, end,
+        episodes=RL_CONFIG['EPISODES'],
+        alpha=RL_CONFIG['ALPHA'],
+        gamma=RL_CONFIG['GAMMA'],
+        epsilon=RL_CONFIG['EPSILON'],
+        max_steps_per_episode=RL_CONFIG['MAX_STEPS_PER_EPISODE'],
+        verbose=False,
+        # The agent only heads for the first end, so a check against all of them says nothing
+        reachable=maze.reachable if len(maze.ends) == 1 else None
+    )
+    solver.train(progress_callback, deadline)
+    training_time = time.time() - start_time
+    path = solver.get_path()
+
+    path_found = len(path) > 0 and path[-1] == end
+    explored = None
+    if collect_explored:
+        explored = solver.visited_positions()
+
+    stats = {
+        'nodes_explored': solver.total_steps,
+        'episodes': solver.episodes,
+        'episodes_done': solver.episodes_done,
+        'successful_episodes': solver.successful_episodes,
+        'training_time': training_time,
+        'execution_time': time.time() - start_time,
+        'success': path_found,
+        'path_length': len(path) if path_found else 0,
+        'path_cost': path_cost(maze.grid, path) if path_found else 0,
+        'status': 'found' if path_found else 'no_path'
+    }
+    if not solver.reachable:
+        stats['unreachable'] = True
+    if solver.stopped_early:
+        stats.update(deadline.stop_stats())
+    return (path if path_found else None), stats, explored
+
+
+def unreachable_result(maze: PreparedMaze, algorithm: str) -> Optional[SolveResult]:
+    """
+    Answer a solve without running the algorithm when no end can be reached.
+
+    The start and ends are compared by their connected-component labels (see
+    components), cached per wall layout, so an unsolvable maze costs one lookup
+    instead of a search that floods everything reachable from the start. Callers
+    use it to avoid dispatching a solve at all, e.g. to a worker process. The
+    outcome is kept on maze.reachable, so solving the same prepared maze
+    afterwards does not check again.
+
+    Args:
+        maze: Prepared maze
+        algorithm: Algorithm name, recorded on the result
+
+    Returns:
+        A 'no_path' SolveResult if the start shares no region with any end, otherwise None
+    """
+    start_time = time.time()
+    if maze.reachable is None:
+        maze.reachable = end_reachable(Grid(maze.grid, maze.start, maze.ends))
+    if maze.reachable:
+        return None
+    stats = {
+        'nodes_explored': 0,
+        'unreachable': True,
+        'execution_time': time.time() - start_time,
+        'success': False,
+        'path_length': 0,
+        'path_cost': 0,
+        'status': 'no_path'
+    }
+    return SolveResult(algorithm=algorithm.lower(), stats=stats)
+
+
+# Registry of in-process solvers keyed by the names accepted by the web API
+SOLVER_REGISTRY: Dict[str, SolverFunction] = {
+    'astar': _class_solver(AStarAlgorithm),
+    'jps': _class_solver(JumpPointSearchAlgorithm),
+    'bfs': _class_solver(BFSAlgorithm),
+    'bfs-vector': _class_solver(VectorBFSAlgorithm),
+    'dfs': _class_solver(DFSAlgorithm),
+    'dijkstra': _solve_dijkstra,
+    'goal-tree': _solve_goal_tree,
+    'bidirectional': _class_solver(BidirectionalAlgorithm),
+    'bidirectional-astar': _class_solver(BidirectionalAStarAlgorithm),
+    'hpa': _class_solver(HPAStarAlgorithm),
+    'reinforcement': _solve_reinforcement,
+    'rl': _solve_reinforcement
+}
+
+
+def get_solver(algorithm: str) -> Optional[SolverFunction]:
+    """Get the in-process solver for a given algorithm name."""
+    return SOLVER_REGISTRY.get(algorithm.lower())
+
+
+def get_supported_algorithms() -> List[str]:
+    """Get the names of all algorithms the engine can run."""
+    return list(SOLVER_REGISTRY)
+
+
+def solve_grid(maze: Union[List[List[int]], PreparedMaze], algorithm: str,
+               progress_callback: ProgressCallback = None, collect_explored: bool = False,
+               tracer=None, deadline: Optional[Deadline] = None, open_list: Optional[str] = None) -> SolveResult:
+    """
+    Solve an in-memory maze with the requested algorithm.
+
+    Args:
+        maze: 2D list representing the maze, or a PreparedMaze to skip validation
+        algorithm: Algorithm name (see SOLVER_REGISTRY)
+        progress_callback: Optional callable receiving periodic progress dicts
+        collect_explored: Whether to return every position the search visited
+        tracer: Optional exploration tracer with expand(pos) and discover(pos) hooks;
+            only usable in-process
+        deadline: Deadline/cancellation token checked inside the search loop;
+            defaults to ALGORITHM_CONFIG['TIMEOUT_SECONDS'] from now
+        open_list: Open list of the best-first solvers (A*, JPS, Dijkstra), one of
+            open_list.OPEN_LISTS; defaults to ALGORITHM_CONFIG['OPEN_LIST']
+
+    Returns:
+        SolveResult with the path (empty if none was found) and statistics; stats['status']
+        is 'found', 'no_path', or 'timeout'/'cancelled' for a search stopped early. The
+        search solvers answer a maze whose ends all lie in other regions than the start
+        without searching, setting stats['unreachable']
+
+    Raises:
+        AlgorithmError: If the algorithm or open list is unknown
+        MazeError: If the maze has no start or end position
+    """
+    solver = get_solver(algorithm)
+    if solver is None:
+        raise AlgorithmError(
+            f"Invalid algorithm '{algorithm}'. Supported: {', '.join(get_supported_algorithms())}"
+        )
+    if open_list is not None and open_list not in OPEN_LISTS:
+        raise AlgorithmError(f"Invalid open list '{open_list}'. Supported: {', '.join(OPEN_LISTS)}")
+
+    if deadline is None:
+        deadline = Deadline(ALGORITHM_CONFIG['TIMEOUT_SECONDS'])
+    path, stats, explored = solver(prepare_maze(maze), progress_callback=progress_callback,
+                                   collect_explored=collect_explored, tracer=tracer, deadline=deadline,
+                                   open_list=open_list)
+    logger.info(f"{algorithm} solved in-process: {stats}")
+    return SolveResult(algorithm=algorithm.lower(), path=path or [], stats=stats, explored=explored or [])
@@ -5,10 +5,9 @@ import os
 import ast
 import base64
 import logging
-import pygame
 import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
-from config import COLORS, PATHS, MAZE_CONFIG
+from config import COLORS, PATHS, MAZE_CONFIG, TERRAIN_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +19,26 @@ class AlgorithmError(Exception):
     """Custom exception for algorithm-related errors."""
     pass
 
+# Path, wall, start and end cells plus the terrain cells of TERRAIN_CONFIG
+CELL_VALUES = frozenset([0, 1, 2, 3, *TERRAIN_CONFIG])
+
+def check_cell_values(maze: List[List[int]]) -> None:
+    """
+    Check that every cell holds a known cell value.
+
+    Args:
+        maze: 2D list representing the maze
+
+    Raises:
+        MazeError: At the first cell that is not a path, wall, start, end or terrain value
+    """
+    for r, row in enumerate(maze):
+        for c, value in enumerate(row):
+            if value not in CELL_VALUES or isinstance(value, bool):
+                terrain = ", ".join(f"{v}={t['name']}" for v, t in TERRAIN_CONFIG.items())
+                raise MazeError(f"Invalid cell value {value!r} at row {r + 1}, column {c + 1}; "
+                                f"expected 0-3 or a terrain value ({terrain})")
+
 def load_maze_from_file(filename: str) -> List[List[int]]:
     """
     Load maze from file with proper error handling.
@@ -67,6 +86,7 @@ def load_maze_from_file(filename: str) -> List[List[int]]:
         for i, row in enumerate(maze):
             if len(row) != cols:
                 raise MazeError(f"Inconsistent row length at row {i+1}")
+        check_cell_values(maze)
                 
         logger.info(f"Successfully loaded maze from {filename}: {rows}x{cols}")
         return maze
@@ -118,6 +138,30 @@ def validate_maze_positions(maze: List[List[int]]) -> None:
 
     logger.info(f"Maze validation passed: start={start}, ends={ends}")
 
+def validate_maze_grid(maze: Any, size: int) -> None:
+    """
+    Validate a maze grid submitted through the web API.
+
+    Args:
+        maze: Nested list received from the client
+        size: Expected number of rows and columns
+
+    Raises:
+        MazeError: If the grid has the wrong shape, cell values or start/end points
+    """
+    if not isinstance(maze, list) or len(maze) != size or \
+            any(not isinstance(row, list) or len(row) != size for row in maze):
+        raise MazeError(f"Maze must be {size}x{size}")
+    check_cell_values(maze)
+
+    start_count = sum(row.count(2) for row in maze)
+    end_count = sum(row.count(3) for row in maze)
+
+    if start_count != 1:
+        raise MazeError("Maze must have exactly one start point (green)")
+    if end_count < 1:
+        raise MazeError("Maze must have at least one end point (red)")
+
 def encode_image_to_base64(image_path: str) -> str:
     """
     Encode image file to base64 string.
@@ -141,6 +185,71 @@ def encode_image_to_base64(image_path: str) -> str:
         logger.error(f"Error encoding image {image_path}: {e}")
         raise
 
+def import_pygame():
+    """
+    Import pygame on first use.
+
+    Only the animation window needs pygame; headless solves and PNG output
+    never load it, which keeps solver start-up fast.
+
+    Returns:
+        The pygame module
+    """
+    # Keep stdout clean for --json output: hide the pygame banner
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import pygame
+    return pygame
+
+# Palette of the rendered images: cell values 0-3, the path, terrain, then grey for borders and unknown cells
+_CELL_COLORS = ['WHITE', 'BLACK', 'GREEN', 'RED', 'BLUE'] + [terrain['color'] for terrain in TERRAIN_CONFIG.values()]
+_PALETTE = np.array([COLORS[name] for name in _CELL_COLORS] + [COLORS['GREY']], dtype=np.uint8)
+_PATH_INDEX = _CELL_COLORS.index('BLUE')
+_UNKNOWN_INDEX = len(_CELL_COLORS)
+# Cell value -> palette index
+_CELL_INDEX = np.full(256, _UNKNOWN_INDEX, dtype=np.uint8)
+_CELL_INDEX[:4] = np.arange(4)
+for _index, _value in enumerate(TERRAIN_CONFIG, _PATH_INDEX + 1):
+    _CELL_INDEX[_value] = _index
+
+def render_maze_array(maze: List[List[int]], path: Optional[List[Tuple[int, int]]] = None) -> np.ndarray:
+    """
+    Render a maze to an RGB pixel array.
+
+    Each cell is a CELL_SIZE square with a one-pixel grey border, placed after
+    a MARGIN-wide grey gap, matching the layout of the animation window.
+
+    Args:
+        maze: 2D list representing the maze
+        path: Optional path to highlight in the maze
+
+    Returns:
+        uint8 array of shape (height, width, 3)
+    """
+    cell_size = MAZE_CONFIG['CELL_SIZE']
+    margin = MAZE_CONFIG['MARGIN']
+    pitch = cell_size + margin
+
+    grid = np.asarray(maze)
+    cells = np.full(grid.shape, _UNKNOWN_INDEX, dtype=np.uint8)
+    known = (grid >= 0) & (grid < len(_CELL_INDEX))
+    cells[known] = _CELL_INDEX[grid[known]]
+    if path:
+        rows, cols = np.array(path).T
+        on_path = np.zeros(grid.shape, dtype=bool)
+        on_path[rows, cols] = True
+        cells[on_path & (grid != 2) & (grid != 3)] = _PATH_INDEX
+
+    # Pixels inside a cell's border, per axis; everything else stays grey
+    def interior(length: int) -> np.ndarray:
+        offset = np.arange(length * pitch) % pitch
+        return (offset > margin) & (offset < margin + cell_size - 1)
+
+    ys = np.arange(grid.shape[0] * pitch) // pitch
+    xs = np.arange(grid.shape[1] * pitch) // pitch
+    pixels = cells[np.ix_(ys, xs)]
+    pixels[~np.outer(interior(grid.shape[0]), interior(grid.shape[1]))] = _UNKNOWN_INDEX
+    return _PALETTE[pixels]
+
 def save_maze_image(maze: List[List[int]], filename: str, path: Optional[List[Tuple[int, int]]] = None) -> None:
     """
     Save maze as PNG image.
@@ -150,47 +259,10 @@ def save_maze_image(maze: List[List[int]], filename: str, path: Optional[List[Tu
         filename: Output filename
         path: Optional path to highlight in the maze
     """
+    from PIL import Image
+
     try:
-        rows, cols = len(maze), len(maze[0])
-        cell_size = MAZE_CONFIG['CELL_SIZE']
-        margin = MAZE_CONFIG['MARGIN']
-        
-        # Create surface
-        surface = pygame.Surface(((cell_size + margin) * cols, (cell_size + margin) * rows))
-        surface.fill(COLORS['GREY'])
-        
-        # Draw maze
-        for row in range(rows):
-            for col in range(cols):
-                val = maze[row][col]
-                pos = (row, col)
-                
-                # Determine color
-                if val == 0:  # Path
-                    color = COLORS['WHITE']
-                elif val == 1:  # Wall
-                    color = COLORS['BLACK']
-                elif val == 2:  # Start
-                    color = COLORS['GREEN']
-                elif val == 3:  # End
-                    color = COLORS['RED']
-                else:
-                    color = COLORS['GREY']
-                
-                # Highlight path if provided
-                if path and pos in path and val not in [2, 3]:
-                    color = COLORS['BLUE']
-                
-                # Draw cell
-                rect = [
-                    (margin + cell_size) * col + margin,
-                    (margin + cell_size) * row + margin,
-                    cell_size, cell_size
-                ]
-                pygame.draw.rect(surface, color, rect)
-                pygame.draw.rect(surface, COLORS['GREY'], rect, 1)
-        
-        pygame.image.save(surface, filename)
+        Image.fromarray(render_maze_array(maze, path), 'RGB').save(filename, optimize=False)
         logger.info(f"Maze image saved to {filename}")
         
     except Exception as e:
@@ -0,0 +1,149 @@
+"""
+Vectorised breadth-first search.
+
+Instead of popping one cell at a time from a queue, the whole wavefront is
+expanded at once: the frontier is an array of cell ids, and each level shifts
+it by the four neighbour offsets and keeps the shifted cells that are open and
+unseen, using NumPy masks over the flat grid. Parents are recorded as
+direction codes in the same flat array the other solvers use, so paths are
+rebuilt exactly like BFS paths and have the same (shortest) length.
+"""
+import sys
+import time
+from typing import List, Tuple, Optional, Dict
+
+import numpy as np
+
+from algorithm_base import PathfindingAlgorithm
+from solver_cli import parse_solver_args, run_algorithm_json, make_deadline
+from search_state import SearchState
+from grid import WALL
+from config import ALGORITHM_CONFIG
+
+
+class VectorBFSAlgorithm(PathfindingAlgorithm):
+    """Level-synchronous Breadth-First Search over NumPy frontier arrays."""
+
+    def new_state(self) -> SearchState:
+        """Create empty search state; the vectorised loops need the flat-array storage."""
+        return SearchState(self.grid, compact=True)
+
+    def solve(self) -> Tuple[Optional[List[Tuple[int, int]]], Dict]:
+        """
+        Solve maze by expanding the BFS wavefront one level at a time.
+
+        Returns:
+            Tuple of (path, statistics)
+        """
+        grid = self.grid
+        state = self.state = self.new_state()
+        visited = np.frombuffer(state.visited, dtype=np.uint8)
+        parents = np.frombuffer(state.parents, dtype=np.uint8)
+        goal_mask = np.frombuffer(grid.goal_mask, dtype=np.uint8).astype(bool)
+        # Open cells the wavefront has not reached yet; the wall border keeps shifts in bounds
+        unseen = grid.cells.reshape(-1) != WALL
+
+        frontier = np.array([grid.start], dtype=np.intp)
+        unseen[grid.start] = False
+        visited[grid.start] = 1
+
+        nodes_explored = 0
+        max_queue_size = 1
+        next_progress = ALGORITHM_CONFIG['PROGRESS_INTERVAL']
+
+        while frontier.size:
+            # Any goal in the current level ends the search at the shortest distance
+            goals = frontier[goal_mask[frontier]]
+            if goals.size:
+                nodes_explored += 1
+                self.end = grid.position(int(goals[0]))
+                if self.tracer:
+                    self.tracer.expand(self.end)
+                path = self.reconstruct_path()
+                return path, {
+                    'nodes_explored': nodes_explored,
+                    'max_queue_size': max_queue_size,
+                    'end_reached': self.end
+                }
+
+            nodes_explored += int(frontier.size)
+            if self.tracer:
+                for pos in grid.positions(frontier.tolist()):
+                    self.tracer.expand(pos)
+
+            # Shift the whole frontier in each direction; earlier directions win ties,
+            # so every new cell gets exactly one parent
+            reached = []
+            for direction, offset in state.directions:
+                neighbors = frontier + offset
+                neighbors = neighbors[unseen[neighbors]]
+                if not neighbors.size:
+                    continue
+                unseen[neighbors] = False
+                visited[neighbors] = 1
+                parents[neighbors] = direction
+                reached.append(neighbors)
+            frontier = np.concatenate(reached) if reached else frontier[:0]
+            max_queue_size = max(max_queue_size, int(frontier.size))
+
+            if self.tracer:
+                for pos in grid.positions(frontier.tolist()):
+                    self.tracer.discover(pos)
+
+            if self.progress_callback and nodes_explored >= next_progress:
+                self.progress_callback({'nodes_explored': nodes_explored})
+                next_progress = nodes_explored + ALGORITHM_CONFIG['PROGRESS_INTERVAL']
+
+            if self.animate:
+                self.stats['nodes_explored'] = nodes_explored
+                self.draw_maze(None, set(frontier.tolist()))
+                time.sleep(ALGORITHM_CONFIG['ANIMATION_DELAY'])
+
+            # One level is a lot of expansions, so check the deadline on every level
+            if self.deadline is not None and self.deadline.expired():
+                return None, {
+                    'nodes_explored': nodes_explored,
+                    'max_queue_size': max_queue_size,
+                    **self.deadline.stop_stats()
+                }
+
+        # No path found
+        return None, {
+            'nodes_explored': nodes_explored,
+            'max_queue_size': max_queue_size
+        }
+
+
+def main():
+    """Main function to run the vectorised BFS algorithm."""
+    args = parse_solver_args("Solve a maze with vectorised Breadth-First Search.")
+    if args.json:
+        sys.exit(run_algorithm_json(VectorBFSAlgorithm, 'bfs-vector', args))
+
+    try:
+        algorithm = VectorBFSAlgorithm(args.maze_file, animate=not args.headless)
+        algorithm.deadline = make_deadline(args)
+        path, stats = algorithm.run()
+
+        if path:
+            print(f"Vector BFS Path found! Length: {len(path)}")
+            print(f"SUCCESS: Path successfully found using vectorised BFS algorithm")
+        else:
+            print("Vector BFS No path found")
+            print("FAILURE: No path exists between start and end points")
+
+        print(f"Nodes explored: {stats['nodes_explored']}")
+        print(f"Time taken: {stats['execution_time']:.3f} seconds")
+        print(f"Max frontier size: {stats.get('max_queue_size', 0)}")
+
+        if stats.get('timeout'):
+            print("Algorithm timed out")
+            print("FAILURE: Algorithm exceeded time limit")
+
+    except Exception as e:
+        print(f"Error running vectorised BFS algorithm: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,48 +8,81 @@ import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
 import numpy as np
-import random
-from typing import List, Tuple
+from typing import List, Optional
 import logging
 
+from grid import Grid, OPEN
+from components import label_components
+
 logger = logging.getLogger(__name__)
 
+# Size range the generator supports; requested sizes are clamped into it
+MIN_GENERATED_SIZE = 8
+MAX_GENERATED_SIZE = 30
+
+# Random mazes drawn before giving up on a solvable one and using the fallback maze
+GENERATION_ATTEMPTS = 10
+
+def generated_size(size: int) -> int:
+    """Size of the mazes generated for a requested size."""
+    return max(MIN_GENERATED_SIZE, min(MAX_GENERATED_SIZE, size))
+
 class WebMazeGenerator:
     """Generate random mazes for web interface without GUI dependencies."""
     
-    def __init__(self, size: int = 25):
+    def __init__(self, size: int = 25, rng: Optional[np.random.Generator] = None):
         """
         Initialize maze generator.
 
         Args:
-            size: Size of the maze (size x size)
+            size: Size of the maze (size x size), clamped between 8 and 30
+            rng: Random number generator; a generator must not be shared between threads
         """
-        self.size = max(8, min(30, size))  # Clamp size between 8 and 30
+        self.size = generated_size(size)
+        self.rng = rng or np.random.default_rng()
         
     def generate_single_maze(self, should_be_solvable: bool = True) -> List[List[int]]:
         """
         Generate a single random maze without pre-set start and end points.
 
         Args:
-            should_be_solvable: Whether this maze should have a solution (ignored for now)
+            should_be_solvable: Whether any start and end placed on path cells must be
+                connected. Mazes whose largest region holds no more than half of the path
+                cells are rejected and drawn again, and the small islands left in an
+                accepted maze are filled with walls.
 
         Returns:
             2D list representing the maze (0=path, 1=wall) - no start/end points set
         """
+        if not should_be_solvable:
+            return self._generate_candidate().tolist()
+
+        for _ in range(GENERATION_ATTEMPTS):
+            maze = self._generate_candidate()
+            labels = self._region_labels(maze)
+            sizes = np.bincount(labels.reshape(-1))[1:]
+            if sizes.size and sizes.max() * 2 > sizes.sum():
+                maze[labels != sizes.argmax() + 1] = 1
+                return maze.tolist()
+
+        logger.debug(f"No solvable {self.size}x{self.size} maze in {GENERATION_ATTEMPTS} attempts, using fallback")
+        return self._generate_fallback_maze()
+
+    def _generate_candidate(self) -> np.ndarray:
+        """
+        Draw one random maze, which may be split into several regions.
+
+        Returns:
+            Maze array (0=path, 1=wall)
+        """
         # Initialize maze with walls
-        maze = np.ones((self.size, self.size), dtype=int)
+        maze = np.ones((self.size, self.size), dtype=np.int8)
 
-        # Create random paths in the interior
-        for row in range(1, self.size - 1):
-            for col in range(1, self.size - 1):
-                # 40% chance of being a wall, 60% chance of being a path
-                maze[row][col] = random.choice([0, 0, 0, 1, 1])
+        # Create random paths in the interior: 40% chance of being a wall, 60% chance of being a path
+        maze[1:-1, 1:-1] = self.rng.random((self.size - 2, self.size - 2)) < 0.4
 
         # Ensure corners are paths to provide good starting options
-        maze[0][0] = 0  # Top-left
-        maze[0][self.size - 1] = 0  # Top-right
-        maze[self.size - 1][0] = 0  # Bottom-left
-        maze[self.size - 1][self.size - 1] = 0  # Bottom-right
+        maze[[0, 0, -1, -1], [0, -1, 0, -1]] = 0
 
         # Carve some guaranteed paths for connectivity
         self._carve_connectivity_paths(maze)
@@ -57,7 +90,21 @@ class WebMazeGenerator:
         # Add some random path connections
         self._add_random_connections(maze)
 
-        return maze.tolist()
+        return maze
+
+    @staticmethod
+    def _region_labels(maze: np.ndarray) -> np.ndarray:
+        """
+        Label the connected regions of a maze's path cells.
+
+        Args:
+            maze: The maze array
+
+        Returns:
+            Array of the maze's shape holding 0 on walls and a region number on path cells
+        """
+        grid = Grid.from_maze(maze)
+        return label_components(grid)[0].reshape(grid.cells.shape)[1:-1, 1:-1]
     
     def _carve_connectivity_paths(self, maze: np.ndarray) -> None:
         """
@@ -68,28 +115,19 @@ class WebMazeGenerator:
         """
         # Create a few connecting paths to ensure the maze isn't too fragmented
 
-        # Horizontal path across the middle
-        mid_row = self.size // 2
-        for col in range(0, self.size, 2):
-            if col < self.size:
-                maze[mid_row][col] = 0
-
-        # Vertical path down the middle
-        mid_col = self.size // 2
-        for row in range(0, self.size, 2):
-            if row < self.size:
-                maze[row][mid_col] = 0
+        # Horizontal and vertical paths across the middle
+        mid = self.size // 2
+        maze[mid, ::2] = 0
+        maze[::2, mid] = 0
 
         # Connect corners to center with some paths
         # Top-left to center
-        for i in range(min(self.size // 3, 5)):
-            if i < self.size and i < self.size:
-                maze[i][i] = 0
+        head = np.arange(min(self.size // 3, 5))
+        maze[head, head] = 0
 
         # Bottom-right to center
-        for i in range(max(self.size - self.size // 3, self.size - 5), self.size):
-            if i >= 0 and i < self.size:
-                maze[i][i] = 0
+        tail = np.arange(max(self.size - self.size // 3, self.size - 5), self.size)
+        maze[tail, tail] = 0
     
     def _add_random_connections(self, maze: np.ndarray) -> None:
         """
@@ -98,18 +136,13 @@ class WebMazeGenerator:
         Args:
             maze: The maze array to modify
         """
-        # Add some random horizontal connections
-        for _ in range(self.size // 4):
-            row = random.randint(1, self.size - 2)
-            col = random.randint(1, self.size - 2)
-            
-            # Create a small path cluster
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    nr, nc = row + dr, col + dc
-                    if 0 <= nr < self.size and 0 <= nc < self.size:
-                        if random.random() < 0.6:  # 60% chance
-                            maze[nr][nc] = 0
+        # Open cells around a few random interior centres, each with a 60% chance
+        clusters = self.size // 4
+        centres = self.rng.integers(1, self.size - 1, size=(clusters, 2))
+        offsets = np.array([(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)])
+        cells = (centres[:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+        cells = cells[self.rng.random(len(cells)) < 0.6]
+        maze[cells[:, 0], cells[:, 1]] = 0
     
     def generate_multiple_mazes(self, count: int = 5) -> List[List[List[int]]]:
         """
@@ -122,18 +155,15 @@ class WebMazeGenerator:
             List of mazes, each maze is a 2D list (0=path, 1=wall)
         """
         mazes = []
-        print(f"🎲 Generating {count} random mazes (no start/end points)")
+        logger.debug(f"Generating {count} random {self.size}x{self.size} mazes")
 
         for i in range(count):
             try:
-                maze = self.generate_single_maze()
-                mazes.append(maze)
-                print(f"✅ Generated maze {i+1}: ready for start/end point selection")
+                mazes.append(self.generate_single_maze())
             except Exception as e:
-                print(f"❌ Error generating maze {i + 1}: {e}")
+                logger.warning(f"Error generating maze {i + 1}, using fallback: {e}")
                 # Generate a simple fallback maze
-                fallback_maze = self._generate_fallback_maze()
-                mazes.append(fallback_maze)
+                mazes.append(self._generate_fallback_maze())
 
         return mazes
     
@@ -144,31 +174,19 @@ class WebMazeGenerator:
         Returns:
             Simple maze without start/end points
         """
-        maze = np.ones((self.size, self.size), dtype=int)
+        maze = np.ones((self.size, self.size), dtype=np.int8)
 
         # Create simple cross pattern
-        mid_row = self.size // 2
-        mid_col = self.size // 2
-
-        # Horizontal line
-        for col in range(self.size):
-            maze[mid_row][col] = 0
-
-        # Vertical line
-        for row in range(self.size):
-            maze[row][mid_col] = 0
+        mid = self.size // 2
+        maze[mid, :] = 0
+        maze[:, mid] = 0
 
-        # Add some interior paths
-        for i in range(2, self.size - 2, 2):
-            for j in range(2, self.size - 2, 2):
-                if random.random() < 0.3:  # 30% chance
-                    maze[i][j] = 0
+        # Add some interior paths (30% chance)
+        interior = maze[2:self.size - 2:2, 2:self.size - 2:2]
+        interior[self.rng.random(interior.shape) < 0.3] = 0
 
         # Ensure corners are paths
-        maze[0][0] = 0
-        maze[0][self.size - 1] = 0
-        maze[self.size - 1][0] = 0
-        maze[self.size - 1][self.size - 1] = 0
+        maze[[0, 0, -1, -1], [0, -1, 0, -1]] = 0
 
         return maze.tolist()
     
@@ -185,36 +203,14 @@ class WebMazeGenerator:
         if not maze or len(maze) == 0:
             return False
         
-        # Find all path cells
-        path_cells = []
-        for i in range(len(maze)):
-            for j in range(len(maze[0])):
-                if maze[i][j] == 0:
-                    path_cells.append((i, j))
-        
-        if len(path_cells) < 2:
+        # The region of the first path cell should hold most path cells
+        labels = self._region_labels(np.asarray(maze))
+        path_labels = labels[np.asarray(maze) == OPEN]
+
+        if len(path_labels) < 2:
             return False  # Need at least 2 path cells
-        
-        # Simple connectivity check using BFS from first path cell
-        start = path_cells[0]
-        visited = set()
-        queue = [start]
-        visited.add(start)
-        
-        while queue:
-            row, col = queue.pop(0)
-            
-            # Check all 4 directions
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = row + dr, col + dc
-                
-                if (0 <= nr < len(maze) and 0 <= nc < len(maze[0]) and 
-                    (nr, nc) not in visited and maze[nr][nc] == 0):
-                    visited.add((nr, nc))
-                    queue.append((nr, nc))
-        
-        # Check if we can reach most path cells
-        reachable_ratio = len(visited) / len(path_cells)
+
+        reachable_ratio = np.count_nonzero(labels == path_labels[0]) / len(path_labels)
         return reachable_ratio > 0.5  # At least 50% of paths should be reachable
 
 
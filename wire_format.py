@@ -0,0 +1,254 @@
+"""
+Compact encodings for sending solutions to web clients.
+
+Paths can be sent as a start position plus a run-length encoded string of
+moves (e.g. "R3D2L1"), and sets of cells as a base64 bitmap, instead of
+rendered PNG images. Maze grids can be sent bit-packed (2 bits per cell) or
+run-length encoded instead of nested JSON lists.
+"""
+import base64
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Single-letter move codes keyed by (row delta, col delta)
+DIRECTION_CODES = {(-1, 0): 'U', (1, 0): 'D', (0, -1): 'L', (0, 1): 'R'}
+DIRECTION_DELTAS = {code: delta for delta, code in DIRECTION_CODES.items()}
+
+
+def encode_path_rle(start: Tuple[int, int], path: List[Tuple[int, int]]) -> str:
+    """
+    Encode a path as run-length encoded moves from the start position.
+
+    Args:
+        start: Start position (row, col)
+        path: Positions along the path; may or may not include the start
+
+    Returns:
+        Move string such as "R3D2"; empty if the path is empty
+
+    Raises:
+        ValueError: If consecutive positions are not adjacent
+    """
+    runs = []
+    previous = start
+    for pos in path:
+        if tuple(pos) == tuple(previous):
+            continue
+        delta = (pos[0] - previous[0], pos[1] - previous[1])
+        code = DIRECTION_CODES.get(delta)
+        if code is None:
+            raise ValueError(f"Path is not contiguous between {previous} and {pos}")
+        if runs and runs[-1][0] == code:
+            runs[-1][1] += 1
+        else:
+            runs.append([code, 1])
+        previous = pos
+    return ''.join(f"{code}{count}" for code, count in runs)
+
+
+def decode_path_rle(start: Tuple[int, int], encoded: str) -> List[Tuple[int, int]]:
+    """
+    Decode a run-length encoded move string back into positions.
+
+    Args:
+        start: Start position (row, col)
+        encoded: Move string produced by encode_path_rle()
+
+    Returns:
+        Positions visited after the start, in order
+    """
+    path = []
+    row, col = start
+    for code, count in re.findall(r'([UDLR])(\d+)', encoded):
+        dr, dc = DIRECTION_DELTAS[code]
+        for _ in range(int(count)):
+            row, col = row + dr, col + dc
+            path.append((row, col))
+    return path
+
+
+def encode_cell_bitmap(cells: Iterable[Tuple[int, int]], rows: int, cols: int) -> str:
+    """
+    Encode a set of cells as a base64 row-major bitmap (most significant bit first).
+
+    Args:
+        cells: Positions to mark
+        rows: Number of rows in the maze
+        cols: Number of columns in the maze
+
+    Returns:
+        Base64 string of ceil(rows * cols / 8) bytes
+    """
+    bitmap = bytearray((rows * cols + 7) // 8)
+    for row, col in cells:
+        index = row * cols + col
+        bitmap[index >> 3] |= 0x80 >> (index & 7)
+    return base64.b64encode(bytes(bitmap)).decode('ascii')
+
+
+def decode_cell_bitmap(encoded: str, rows: int, cols: int) -> List[Tuple[int, int]]:
+    """
+    Decode a base64 cell bitmap back into positions.
+
+    Args:
+        encoded: String produced by encode_cell_bitmap()
+        rows: Number of rows in the maze
+        cols: Number of columns in the maze
+
+    Returns:
+        Marked positions in row-major order
+    """
+    bitmap = base64.b64decode(encoded)
+    return [
+        divmod(index, cols)
+        for index in range(rows * cols)
+        if bitmap[index >> 3] & (0x80 >> (index & 7))
+    ]
+
+
+def encode_solution(start: Optional[Tuple[int, int]], path: List[Tuple[int, int]],
+                    explored: List[Tuple[int, int]], rows: int, cols: int,
+                    path_encoding: str = 'coords') -> dict:
+    """
+    Build the compact JSON representation of a solution.
+
+    Args:
+        start: Start position (row, col)
+        path: Positions along the path
+        explored: Positions the search visited
+        rows: Number of rows in the maze
+        cols: Number of columns in the maze
+        path_encoding: 'coords' for coordinate lists, 'rle' for move string + bitmap
+
+    Returns:
+        Dict to merge into the API response
+    """
+    if path_encoding == 'rle':
+        return {
+            'path_encoding': 'rle',
+            'start': list(start) if start else None,
+            'path_rle': encode_path_rle(start, path) if start else '',
+            'explored_bitmap': encode_cell_bitmap(explored, rows, cols)
+        }
+    return {
+        'path_encoding': 'coords',
+        'start': list(start) if start else None,
+        'path': [list(pos) for pos in path],
+        'explored': [list(pos) for pos in explored]
+    }
+
+
+# Maze grid encodings accepted and produced by the API
+MAZE_ENCODINGS = ['grid', 'packed', 'rle']
+
+# Longest run stored in one RLE byte: 2 bits of cell value, 6 bits of length - 1
+_MAX_RUN = 64
+
+
+def _pack_maze(cells: List[int]) -> bytes:
+    """Pack cell values 4 to a byte, first cell in the most significant bits."""
+    packed = bytearray((len(cells) + 3) // 4)
+    for index, value in enumerate(cells):
+        packed[index >> 2] |= (value & 3) << (6 - 2 * (index & 3))
+    return bytes(packed)
+
+
+def _unpack_maze(data: bytes, count: int) -> List[int]:
+    """Unpack `count` 2-bit cell values."""
+    if len(data) * 4 < count:
+        raise ValueError("Packed maze data is shorter than rows x cols")
+    return [(data[index >> 2] >> (6 - 2 * (index & 3))) & 3 for index in range(count)]
+
+
+def _rle_maze(cells: List[int]) -> bytes:
+    """Run-length encode cell values, one (value, run length) pair per byte."""
+    runs = bytearray()
+    index = 0
+    while index < len(cells):
+        value = cells[index] & 3
+        length = 1
+        while length < _MAX_RUN and index + length < len(cells) and cells[index + length] == value:
+            length += 1
+        runs.append((value << 6) | (length - 1))
+        index += length
+    return bytes(runs)
+
+
+def _unrle_maze(data: bytes, count: int) -> List[int]:
+    """Expand run-length encoded cell values, which must cover exactly `count` cells."""
+    cells: List[int] = []
+    for byte in data:
+        cells.extend([byte >> 6] * ((byte & 0x3F) + 1))
+        if len(cells) > count:
+            break
+    if len(cells) != count:
+        raise ValueError("RLE maze data does not cover rows x cols cells")
+    return cells
+
+
+def encode_maze(maze: List[List[int]], encoding: str = 'grid') -> Union[List[List[int]], Dict[str, Any]]:
+    """
+    Encode a maze grid for the wire.
+
+    Args:
+        maze: 2D list representing the maze (cell values 0-3; terrain needs 'grid')
+        encoding: 'grid' for nested lists, 'packed' for 2 bits per cell,
+            'rle' for run-length encoded cells
+
+    Returns:
+        The grid itself, or a dict {encoding, rows, cols, data} with base64 data
+
+    Raises:
+        ValueError: If the encoding is unknown, or a compact encoding is asked for a maze with terrain
+    """
+    if encoding == 'grid':
+        return maze
+    cells = [int(cell) for row in maze for cell in row]
+    if any(cell > 3 for cell in cells):
+        raise ValueError(f"Maze encoding '{encoding}' holds cell values 0-3 only; send terrain mazes as 'grid'")
+    if encoding == 'packed':
+        data = _pack_maze(cells)
+    elif encoding == 'rle':
+        data = _rle_maze(cells)
+    else:
+        raise ValueError(f"Unknown maze encoding '{encoding}'. Supported: {', '.join(MAZE_ENCODINGS)}")
+    return {
+        'encoding': encoding,
+        'rows': len(maze),
+        'cols': len(maze[0]) if maze else 0,
+        'data': base64.b64encode(data).decode('ascii')
+    }
+
+
+def decode_maze(payload: Union[List[List[int]], Dict[str, Any], None]) -> Optional[List[List[int]]]:
+    """
+    Decode a maze sent in any of the supported encodings.
+
+    Args:
+        payload: Nested lists, or a dict produced by encode_maze()
+
+    Returns:
+        2D list representing the maze (nested lists and None are returned as-is)
+
+    Raises:
+        ValueError: If an encoded maze is malformed
+    """
+    if not isinstance(payload, dict):
+        return payload
+
+    encoding = payload.get('encoding')
+    rows, cols = payload.get('rows'), payload.get('cols')
+    if not isinstance(rows, int) or not isinstance(cols, int) or rows <= 0 or cols <= 0:
+        raise ValueError("Encoded maze needs positive integer 'rows' and 'cols'")
+    try:
+        data = base64.b64decode(payload.get('data') or '', validate=True)
+    except (TypeError, ValueError):
+        raise ValueError("Encoded maze 'data' is not valid base64")
+
+    if encoding == 'packed':
+        cells = _unpack_maze(data, rows * cols)
+    elif encoding == 'rle':
+        cells = _unrle_maze(data, rows * cols)
+    else:
+        raise ValueError(f"Unknown maze encoding '{encoding}'. Supported: packed, rle")
+    return [cells[row * cols:(row + 1) * cols] for row in range(rows)]
@@ -0,0 +1,322 @@
+"""
+Pool of warm solver processes for CPU-bound maze solving.
+
+Each worker process imports the algorithm modules (and with them numpy)
+once at start-up, then solves jobs sent over a pipe. Workers are
+recycled after a fixed number of tasks or when their memory use passes a
+ceiling. Solvers stop themselves at the job's deadline; a worker that
+overruns it by more than a grace period, or whose job is cancelled, is
+killed and replaced.
+"""
+import sys
+import time
+import queue
+import atexit
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, CancelledError, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from config import WORKER_CONFIG
+from utils import MazeError, AlgorithmError
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+def _memory_usage_mb() -> float:
+    """Get the peak resident memory of the current process in MB."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _worker_main(conn, max_tasks: int, max_memory_mb: float) -> None:
+    """
+    Entry point of a solver worker process.
+
+    Args:
+        conn: Pipe connection to the parent process
+        max_tasks: Number of jobs to run before asking to be recycled
+        max_memory_mb: Memory ceiling after which the worker asks to be recycled
+    """
+    # Import the solvers once so every job runs against warm modules
+    import solver_engine
+    from deadline import Deadline
+
+    tasks_done = 0
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        maze, algorithm, options, want_progress, timeout = message
+        progress_callback = (lambda progress: conn.send(('progress', progress))) if want_progress else None
+        try:
+            reply = ('ok', solver_engine.solve_grid(maze, algorithm, progress_callback,
+                                                    deadline=Deadline(timeout), **options))
+        except (MazeError, AlgorithmError) as e:
+            reply = ('error', e)
+        except Exception as e:
+            reply = ('error', AlgorithmError(f"{type(e).__name__}: {e}"))
+
+        tasks_done += 1
+        recycle = tasks_done >= max_tasks or (max_memory_mb and _memory_usage_mb() > max_memory_mb)
+        conn.send(reply + (bool(recycle),))
+        if recycle:
+            break
+
+    conn.close()
+
+
+class _WorkerSlot:
+    """Owns one worker process and feeds it jobs from the pool queue."""
+
+    def __init__(self, pool: 'SolverPool', index: int):
+        self.pool = pool
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.current = None
+        self.cancelled = False
+        self.start_process()
+        self.thread = threading.Thread(target=self.run, name=f"solver-slot-{index}", daemon=True)
+        self.thread.start()
+
+    def start_process(self) -> None:
+        """Start a fresh worker process."""
+        parent_conn, child_conn = self.pool.context.Pipe()
+        self.process = self.pool.context.Process(
+            target=_worker_main,
+            args=(child_conn, self.pool.max_tasks_per_worker, self.pool.max_memory_mb),
+            name=f"solver-worker-{self.index}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def stop_process(self, kill: bool = False) -> None:
+        """Stop the current worker process, killing it if it is still busy."""
+        if self.process is None:
+            return
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass  # Worker already exited after asking to be recycled
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def recycle(self, kill: bool = False) -> None:
+        """Replace the current worker process with a fresh one."""
+        self.stop_process(kill=kill)
+        self.pool._record_recycle()
+        if not self.pool.closed:
+            self.start_process()
+
+    def run(self) -> None:
+        """Take jobs from the pool queue until the pool shuts down."""
+        while True:
+            job = self.pool.jobs.get()
+            if job is None:
+                break
+
+            future, maze, algorithm, options, timeout, progress_callback = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            if self.process is None:
+                self.start_process()
+
+            self.current = future
+            self.cancelled = False
+            # The solver stops itself at the timeout; only kill it if it overruns the grace period
+            deadline = time.monotonic() + timeout + WORKER_CONFIG['KILL_GRACE_SECONDS']
+            try:
+                self.conn.send((maze, algorithm, options, progress_callback is not None, timeout))
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self.conn.poll(remaining):
+                        raise FutureTimeoutError(f"Solving exceeded {timeout} seconds")
+                    message = self.conn.recv()
+                    if message[0] != 'progress':
+                        break
+                    progress_callback(message[1])
+                status, payload, recycle = message
+            except FutureTimeoutError as e:
+                logger.warning(f"Solver worker {self.index} exceeded {timeout}s, killing it")
+                future.set_exception(e)
+                self.recycle(kill=True)
+                continue
+            except (EOFError, OSError) as e:
+                if self.cancelled:
+                    future.set_exception(CancelledError())
+                else:
+                    logger.error(f"Solver worker {self.index} died: {e}")
+                    future.set_exception(AlgorithmError("Solver worker terminated unexpectedly"))
+                self.recycle(kill=True)
+                continue
+            except Exception as e:
+                # A failing progress callback aborts the job like a cancellation
+                future.set_exception(e)
+                self.recycle(kill=True)
+                continue
+            finally:
+                self.current = None
+
+            if status == 'ok':
+                future.set_result(payload)
+            else:
+                future.set_exception(payload)
+            self.pool._record_completion()
+
+            if recycle:
+                self.recycle()
+
+        self.stop_process()
+
+
+class SolverPool:
+    """Fixed-size pool of warm solver processes."""
+
+    def __init__(self, processes: Optional[int] = None, max_tasks_per_worker: Optional[int] = None,
+                 max_memory_mb: Optional[float] = None, start_method: Optional[str] = None):
+        """
+        Initialize the pool and start its workers.
+
+        Args:
+            processes: Number of worker processes
+            max_tasks_per_worker: Jobs a worker runs before it is recycled
+            max_memory_mb: Peak RSS (MB) after which a worker is recycled
+            start_method: multiprocessing start method
+        """
+        self.processes = processes or WORKER_CONFIG['PROCESSES']
+        self.max_tasks_per_worker = max_tasks_per_worker or WORKER_CONFIG['MAX_TASKS_PER_WORKER']
+        self.max_memory_mb = max_memory_mb or WORKER_CONFIG['MAX_MEMORY_MB']
+        self.context = multiprocessing.get_context(start_method or WORKER_CONFIG['START_METHOD'])
+        self.jobs = queue.Queue()
+        self.closed = False
+
+        self._lock = threading.Lock()
+        self._tasks_completed = 0
+        self._workers_recycled = 0
+        self._slots: List[_WorkerSlot] = [_WorkerSlot(self, i) for i in range(self.processes)]
+        logger.info(f"Started solver pool with {self.processes} workers")
+
+    def submit(self, maze: List[List[int]], algorithm: str, timeout: Optional[float] = None,
+               progress_callback=None, **options) -> Future:
+        """
+        Queue a solve job.
+
+        Args:
+            maze: 2D list representing the maze
+            algorithm: Algorithm name
+            timeout: Seconds the solver may run before it stops with a 'timeout' status;
+                the worker is killed if it overruns this by KILL_GRACE_SECONDS
+            progress_callback: Optional callable receiving the worker's progress dicts
+            **options: Extra keyword arguments for solver_engine.solve_grid()
+
+        Returns:
+            Future resolving to a SolveResult
+        """
+        if self.closed:
+            raise RuntimeError("Solver pool has been shut down")
+        future = Future()
+        self.jobs.put((future, maze, algorithm, options, timeout or WORKER_CONFIG['SOLVE_TIMEOUT_SECONDS'],
+                       progress_callback))
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a job, killing its worker if the job is already running.
+
+        Args:
+            future: Future returned by submit()
+
+        Returns:
+            True if the job was cancelled before completing
+        """
+        if future.cancel():
+            return True
+        for slot in self._slots:
+            process = slot.process
+            if slot.current is future and process is not None:
+                slot.cancelled = True
+                process.kill()
+                return True
+        return False
+
+    def solve(self, maze: List[List[int]], algorithm: str, timeout: Optional[float] = None, **options):
+        """Solve a maze on a worker and wait for the SolveResult."""
+        return self.submit(maze, algorithm, timeout, **options).result()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a free worker."""
+        return self.jobs.qsize()
+
+    @property
+    def busy_workers(self) -> int:
+        """Number of workers currently running a job."""
+        return sum(1 for slot in self._slots if slot.current is not None)
+
+    def _record_completion(self) -> None:
+        with self._lock:
+            self._tasks_completed += 1
+
+    def _record_recycle(self) -> None:
+        with self._lock:
+            self._workers_recycled += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get a snapshot of pool utilisation."""
+        with self._lock:
+            return {
+                'processes': self.processes,
+                'busy_workers': self.busy_workers,
+                'queue_depth': self.queue_depth,
+                'tasks_completed': self._tasks_completed,
+                'workers_recycled': self._workers_recycled
+            }
+
+    def shutdown(self) -> None:
+        """Stop all workers once the queued jobs have been handed out."""
+        if self.closed:
+            return
+        self.closed = True
+        for _ in self._slots:
+            self.jobs.put(None)
+        for slot in self._slots:
+            slot.thread.join()
+        logger.info("Solver pool shut down")
+
+
+_pool: Optional[SolverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_solver_pool() -> SolverPool:
+    """Get the process-wide solver pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SolverPool()
+            atexit.register(_pool.shutdown)
+        return _pool
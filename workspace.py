@@ -0,0 +1,81 @@
+"""
+Per-request scratch workspaces for the web app.
+
+Each solve gets its own temporary directory for maze files and rendered
+images, so concurrent requests never read or delete each other's artifacts.
+"""
+import os
+import shutil
+import tempfile
+import uuid
+import logging
+from typing import Optional
+from config import PATHS
+
+logger = logging.getLogger(__name__)
+
+
+class SolveWorkspace:
+    """Isolated temporary directory that is removed when the solve finishes."""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the workspace.
+
+        Args:
+            root: Parent directory for workspaces (defaults to the system temp dir)
+        """
+        self.root = root or PATHS['WORKSPACE_ROOT']
+        self.workspace_id = uuid.uuid4().hex
+        self.directory = None
+
+    def __enter__(self) -> 'SolveWorkspace':
+        return self.create()
+
+    def create(self) -> 'SolveWorkspace':
+        """Create the workspace directory if it does not exist yet."""
+        if self.directory is None:
+            if self.root:
+                os.makedirs(self.root, exist_ok=True)
+            self.directory = tempfile.mkdtemp(prefix=f"maze-{self.workspace_id[:12]}-", dir=self.root)
+            logger.info(f"Created workspace {self.directory}")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.cleanup()
+
+    def path(self, filename: str) -> str:
+        """
+        Get the path of an artifact inside this workspace.
+
+        Args:
+            filename: Artifact file name
+
+        Returns:
+            Absolute path inside the workspace directory
+        """
+        if self.directory is None:
+            raise RuntimeError("Workspace has not been created")
+        return os.path.join(self.directory, filename)
+
+    @property
+    def maze_image(self) -> str:
+        """Path of the rendered maze image."""
+        return self.path(PATHS['MAZE_IMAGE'])
+
+    @property
+    def solution_image(self) -> str:
+        """Path of the rendered solution image."""
+        return self.path(PATHS['SOLUTION_IMAGE'])
+
+    def cleanup(self) -> None:
+        """Remove the workspace directory and everything in it."""
+        if self.directory is None:
+            return
+        try:
+            shutil.rmtree(self.directory)
+            logger.info(f"Removed workspace {self.directory}")
+        except OSError as e:
+            logger.warning(f"Could not remove workspace {self.directory}: {e}")
+        finally:
+            self.directory = None